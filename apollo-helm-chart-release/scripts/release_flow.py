@@ -6,7 +6,10 @@ Release workflow for apollo-helm-chart.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import fnmatch
+import json
+import os
 import re
 import shlex
 import shutil
@@ -14,10 +17,9 @@ import subprocess
 import sys
 import tempfile
 from dataclasses import dataclass
+from functools import cmp_to_key, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import yaml
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 REPO_REMOTE = "github.com/apolloconfig/apollo-helm-chart"
@@ -39,6 +41,21 @@ ALLOWED_GLOB_PATHS = [
     "docs/apollo-portal-*.tgz",
     "docs/apollo-service-*.tgz",
 ]
+ALLOWED_GLOB_PATTERN = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in ALLOWED_GLOB_PATHS)
+)
+CHART_POSIX_PATHS = {
+    chart_name: path.as_posix() for chart_name, path in CHART_PATHS.items()
+}
+DIFF_START_PATTERNS = {
+    f"diff --git a/{path} b/{path}": chart_name
+    for chart_name, path in CHART_POSIX_PATHS.items()
+}
+TEMPLATE_FIELD_PATTERN = re.compile(r"\{\{|\}\}|\{(\w+)\}")
+VERSION_CHANGE_PATTERN = re.compile(r"^([+-])(version|appVersion):\s*(\S+)\s*$")
+INDEX_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "apollo-helm-release" / "index-cache.json"
+)
 
 
 class FlowError(RuntimeError):
@@ -67,12 +84,11 @@ def command_display(command: List[str] | str) -> str:
 
 
 def run_command(
-    command: List[str] | str,
+    command: List[str],
     cwd: Path,
     executed: Optional[List[str]] = None,
     *,
     check: bool = True,
-    shell: bool = False,
 ) -> subprocess.CompletedProcess[str]:
     if executed is not None:
         executed.append(command_display(command))
@@ -80,9 +96,10 @@ def run_command(
     completed = subprocess.run(
         command,
         cwd=cwd,
-        shell=shell,
         capture_output=True,
         text=True,
+        encoding="utf-8",
+        errors="surrogateescape",
         check=False,
     )
     if check and completed.returncode != 0:
@@ -98,6 +115,46 @@ def run_command(
     return completed
 
 
+def run_command_lines(
+    command: List[str],
+    cwd: Path,
+    executed: Optional[List[str]] = None,
+) -> Iterator[str]:
+    if executed is not None:
+        executed.append(command_display(command))
+
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="surrogateescape") as stderr_file:
+        with subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+        ) as process:
+            assert process.stdout is not None
+            exhausted = False
+            try:
+                yield from process.stdout
+                exhausted = True
+            finally:
+                # Stopping early leaves the child blocked on a full pipe; kill it so the wait below returns.
+                if not exhausted:
+                    process.kill()
+            returncode = process.wait()
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+            message = [
+                f"Command failed: {command_display(command)}",
+                f"Exit code: {returncode}",
+            ]
+            if stderr.strip():
+                message.append(f"STDERR:\n{stderr.rstrip()}")
+            raise FlowError("\n".join(message))
+
+
 def normalize_remote_url(url: str) -> str:
     url = url.strip()
     if not url:
@@ -124,14 +181,30 @@ def normalize_remote_url(url: str) -> str:
     return f"{host.lower()}/{path.lower()}"
 
 
+@lru_cache(maxsize=8)
+def read_remote_output(repo_root: str) -> str:
+    return run_command(["git", "remote", "-v"], Path(repo_root)).stdout
+
+
+@lru_cache(maxsize=16)
+def find_tool(tool: str) -> Optional[str]:
+    return shutil.which(tool)
+
+
+def clear_caches() -> None:
+    read_remote_output.cache_clear()
+    find_tool.cache_clear()
+
+
 def collect_remote_urls(repo_root: Path, executed: List[str]) -> List[str]:
-    output = run_command(["git", "remote", "-v"], repo_root, executed).stdout
+    executed.append(command_display(["git", "remote", "-v"]))
+    output = read_remote_output(str(repo_root.resolve()))
     urls: List[str] = []
     for line in output.splitlines():
         parts = line.split()
         if len(parts) >= 2:
             urls.append(parts[1].strip())
-    return sorted(set(urls))
+    return list(dict.fromkeys(urls))
 
 
 def require_expected_remote(repo_root: Path, executed: List[str]) -> List[str]:
@@ -159,7 +232,7 @@ def require_required_tools() -> Dict[str, bool]:
     tools = {"git": True, "helm": True, "gh": True}
     missing_required: List[str] = []
     for tool in tools:
-        if shutil.which(tool) is None:
+        if find_tool(tool) is None:
             tools[tool] = False
             if tool in {"git", "helm"}:
                 missing_required.append(tool)
@@ -171,7 +244,12 @@ def require_required_tools() -> Dict[str, bool]:
 
 
 def ensure_no_root_tgz(repo_root: Path) -> None:
-    root_tgz = sorted(path.name for path in repo_root.glob("*.tgz"))
+    with os.scandir(repo_root) as entries:
+        root_tgz = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".tgz") and entry.is_file()
+        )
     if root_tgz:
         raise FlowError(
             "Found existing *.tgz files in repository root. "
@@ -180,8 +258,18 @@ def ensure_no_root_tgz(repo_root: Path) -> None:
         )
 
 
+def load_yaml_file(path: Path) -> Dict[str, Any]:
+    # Imported lazily so importing this module or printing --help stays cheap.
+    import yaml
+
+    # CSafeLoader is only present when PyYAML was built against libyaml.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with path.open("rb") as handle:
+        return yaml.load(handle, Loader=loader) or {}
+
+
 def read_chart_meta(chart_name: str, chart_path: Path) -> ChartMeta:
-    content = yaml.safe_load(chart_path.read_text(encoding="utf-8")) or {}
+    content = load_yaml_file(chart_path)
     version = str(content.get("version", "")).strip()
     app_version = str(content.get("appVersion", "")).strip()
     if not version or not app_version:
@@ -198,19 +286,38 @@ def read_chart_meta(chart_name: str, chart_path: Path) -> ChartMeta:
 
 
 def read_all_chart_meta(repo_root: Path) -> Dict[str, ChartMeta]:
-    charts: Dict[str, ChartMeta] = {}
-    for chart_name, relative_path in CHART_PATHS.items():
-        chart_path = repo_root / relative_path
-        charts[chart_name] = read_chart_meta(chart_name, chart_path)
-    return charts
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(CHART_PATHS)) as executor:
+        futures = {
+            chart_name: executor.submit(read_chart_meta, chart_name, repo_root / relative_path)
+            for chart_name, relative_path in CHART_PATHS.items()
+        }
+        return {chart_name: future.result() for chart_name, future in futures.items()}
+
+
+@lru_cache(maxsize=4096)
+def parse_chart_version(version: str) -> Tuple[Tuple[int | str, ...], str]:
+    main, _, pre = version.partition("-")
+    return tuple(int(part) if part.isdigit() else part for part in main.split(".")), pre
+
+
+@lru_cache(maxsize=4096)
+def chart_version_key(version: str) -> Optional[Tuple[Tuple[int, ...], Tuple[int, str]]]:
+    # Only all-numeric versions get a sort key; a non-numeric part compares as a string against
+    # numbers, which is not a total order, so those go through compare_chart_versions instead.
+    parts, pre = parse_chart_version(version)
+    if not all(isinstance(part, int) for part in parts):
+        return None
+    numbers = list(parts)
+    # Missing trailing parts compare as zero, so "1.0" and "1.0.0" are equal.
+    while numbers and numbers[-1] == 0:
+        numbers.pop()
+    # A release sorts after any of its pre-releases.
+    return tuple(numbers), (0, pre) if pre else (1, "")
 
 
 def compare_chart_versions(left: str, right: str) -> int:
-    left_main, _, left_pre = left.partition("-")
-    right_main, _, right_pre = right.partition("-")
-
-    left_parts = [int(part) if part.isdigit() else part for part in left_main.split(".")]
-    right_parts = [int(part) if part.isdigit() else part for part in right_main.split(".")]
+    left_parts, left_pre = parse_chart_version(left)
+    right_parts, right_pre = parse_chart_version(right)
     max_len = max(len(left_parts), len(right_parts))
 
     for idx in range(max_len):
@@ -231,8 +338,46 @@ def compare_chart_versions(left: str, right: str) -> int:
     return 1 if left_pre > right_pre else -1
 
 
+def index_cache_key(index_path: Path) -> List[Any]:
+    stat = index_path.stat()
+    return [str(index_path.resolve()), stat.st_mtime_ns, stat.st_size]
+
+
+def load_cached_latest_versions(key: List[Any]) -> Optional[Dict[str, Optional[str]]]:
+    try:
+        cached = json.loads(INDEX_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    latest = cached.get("latest")
+    if not isinstance(latest, dict) or set(latest) != set(CHART_PATHS):
+        return None
+    return latest
+
+
+def save_cached_latest_versions(key: List[Any], latest: Dict[str, Optional[str]]) -> None:
+    # Only the most recent index is kept, so the cache never grows. The cache lives in a per-user
+    # directory and is written through an unpredictable temp name so other users cannot plant it.
+    temp_name: Optional[str] = None
+    try:
+        INDEX_CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{INDEX_CACHE_PATH.name}.", dir=INDEX_CACHE_PATH.parent)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"key": key, "latest": latest}, handle)
+        os.replace(temp_name, INDEX_CACHE_PATH)
+    except OSError:
+        if temp_name is not None:
+            Path(temp_name).unlink(missing_ok=True)
+
+
 def read_latest_versions_from_index(index_path: Path) -> Dict[str, Optional[str]]:
-    index_data = yaml.safe_load(index_path.read_text(encoding="utf-8")) or {}
+    key = index_cache_key(index_path)
+    cached = load_cached_latest_versions(key)
+    if cached is not None:
+        return cached
+
+    index_data = load_yaml_file(index_path)
     entries = index_data.get("entries", {}) or {}
 
     latest: Dict[str, Optional[str]] = {}
@@ -247,39 +392,42 @@ def read_latest_versions_from_index(index_path: Path) -> Dict[str, Optional[str]
             latest[chart_name] = None
             continue
 
-        selected = versions[0]
-        for candidate in versions[1:]:
-            if compare_chart_versions(candidate, selected) > 0:
-                selected = candidate
-        latest[chart_name] = selected
+        if all(chart_version_key(version) is not None for version in versions):
+            latest[chart_name] = max(versions, key=chart_version_key)
+        else:
+            # Same left-to-right scan as the pairwise comparator, which keeps the first maximum.
+            latest[chart_name] = max(versions, key=cmp_to_key(compare_chart_versions))
+
+    save_cached_latest_versions(key, latest)
     return latest
 
 
 def extract_version_changes_from_diff(
-    diff_text: str,
+    diff_lines: str | Iterable[str],
 ) -> Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]]:
+    if isinstance(diff_lines, str):
+        diff_lines = diff_lines.splitlines()
+
     temp: Dict[str, Dict[str, Dict[str, Optional[str]]]] = {
         chart_name: {} for chart_name in CHART_PATHS
     }
     current_chart: Optional[str] = None
 
-    diff_start_patterns = {
-        f"diff --git a/{path.as_posix()} b/{path.as_posix()}": chart_name
-        for chart_name, path in CHART_PATHS.items()
-    }
-    change_pattern = re.compile(r"^([+-])(version|appVersion):\s*(\S+)\s*$")
-
-    for raw_line in diff_text.splitlines():
-        line = raw_line.rstrip()
-        if line.startswith("diff --git "):
-            current_chart = diff_start_patterns.get(line)
+    for raw_line in diff_lines:
+        # Only "diff --git" headers and +/- lines matter; dispatch on the first character
+        # so context and hunk lines are skipped without any further checks.
+        marker = raw_line[:1]
+        if marker == "d":
+            if raw_line.startswith("diff --git "):
+                current_chart = DIFF_START_PATTERNS.get(raw_line.rstrip())
             continue
-        if current_chart is None:
+        if marker not in ("+", "-") or current_chart is None:
             continue
-        if line.startswith("--- ") or line.startswith("+++ "):
+        line = raw_line.rstrip()
+        if line.startswith(("--- ", "+++ ")):
             continue
 
-        matched = change_pattern.match(line)
+        matched = VERSION_CHANGE_PATTERN.match(line)
         if not matched:
             continue
 
@@ -308,19 +456,32 @@ def extract_version_changes_from_diff(
 
 
 def detect_version_changes(repo_root: Path, executed: List[str]) -> Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]]:
-    diff_output = run_command(
+    # Exit code 0 means both charts match HEAD, so there is no diff worth parsing.
+    probe = run_command(
+        ["git", "diff", "--quiet", "HEAD", "--", *CHART_POSIX_PATHS.values()],
+        repo_root,
+        executed,
+        check=False,
+    )
+    if probe.returncode == 0:
+        return {chart_name: {} for chart_name in CHART_PATHS}
+
+    diff_lines = run_command_lines(
         [
             "git",
             "diff",
+            "--no-color",
+            "--unified=0",
+            "-G",
+            "^(version|appVersion):",
             "HEAD",
             "--",
-            CHART_PATHS["apollo-portal"].as_posix(),
-            CHART_PATHS["apollo-service"].as_posix(),
+            *CHART_POSIX_PATHS.values(),
         ],
         repo_root,
         executed,
-    ).stdout
-    return extract_version_changes_from_diff(diff_output)
+    )
+    return extract_version_changes_from_diff(diff_lines)
 
 
 def has_any_version_change(
@@ -350,23 +511,15 @@ def validate_chart_consistency(
     warnings: List[str] = []
     portal = charts["apollo-portal"]
     service = charts["apollo-service"]
-    if portal.version != service.version:
-        message = (
-            "Chart version mismatch detected: "
-            f"apollo-portal={portal.version}, apollo-service={service.version}"
-        )
-        if not allow_version_mismatch:
-            raise FlowError(
-                f"{message}\n"
-                "Use --allow-version-mismatch to continue with explicit override."
-            )
-        warnings.append(message)
-
-    if portal.app_version != service.app_version:
+    for field, portal_value, service_value in (
+        ("version", portal.version, service.version),
+        ("appVersion", portal.app_version, service.app_version),
+    ):
+        if portal_value == service_value:
+            continue
         message = (
-            "Chart appVersion mismatch detected: "
-            f"apollo-portal={portal.app_version}, "
-            f"apollo-service={service.app_version}"
+            f"Chart {field} mismatch detected: "
+            f"apollo-portal={portal_value}, apollo-service={service_value}"
         )
         if not allow_version_mismatch:
             raise FlowError(
@@ -378,32 +531,52 @@ def validate_chart_consistency(
     return warnings
 
 
-def parse_changed_paths(status_output: str) -> List[str]:
+def parse_worktree_status(status_output: str) -> Tuple[str, List[str]]:
+    # Parses `git status -z --porcelain=v2 --branch` into (current branch, changed paths).
+    # Ordinary ("1") and unmerged ("u") records end with the path, rename/copy ("2")
+    # records are followed by one extra record holding the source path.
+    records = status_output.split("\0")
+    branch = ""
     paths: List[str] = []
-    for line in status_output.splitlines():
-        if len(line) < 4:
-            continue
-        path = line[3:].strip()
-        if " -> " in path:
-            old_path, new_path = path.split(" -> ", 1)
-            paths.append(old_path.strip())
-            paths.append(new_path.strip())
-        else:
-            paths.append(path)
-    return sorted(set(paths))
+    index = 0
+    while index < len(records):
+        record = records[index]
+        index += 1
+        kind = record[:2]
+        if kind == "# ":
+            if record.startswith("# branch.head "):
+                head = record[len("# branch.head "):]
+                branch = "" if head == "(detached)" else head
+        elif kind == "1 ":
+            paths.append(record.split(" ", 8)[8])
+        elif kind == "2 ":
+            paths.append(record.split(" ", 9)[9])
+            if index < len(records):
+                paths.append(records[index])
+                index += 1
+        elif kind == "u ":
+            paths.append(record.split(" ", 10)[10])
+        elif kind in ("? ", "! "):
+            paths.append(record[2:])
+    return branch, list(dict.fromkeys(paths))
+
 
+def parse_changed_paths(status_output: str) -> List[str]:
+    return parse_worktree_status(status_output)[1]
 
-def collect_changed_paths(repo_root: Path, executed: List[str]) -> List[str]:
+
+def collect_worktree_status(repo_root: Path, executed: List[str]) -> Tuple[str, List[str]]:
     status_output = run_command(
-        ["git", "status", "--porcelain"], repo_root, executed
+        ["git", "status", "-z", "--porcelain=v2", "--branch"], repo_root, executed
     ).stdout
-    return parse_changed_paths(status_output)
+    return parse_worktree_status(status_output)
 
 
+@lru_cache(maxsize=1024)
 def is_allowed_changed_path(path: str) -> bool:
     if path in ALLOWED_EXACT_PATHS:
         return True
-    return any(fnmatch.fnmatch(path, pattern) for pattern in ALLOWED_GLOB_PATHS)
+    return ALLOWED_GLOB_PATTERN.match(path) is not None
 
 
 def find_disallowed_paths(paths: List[str]) -> List[str]:
@@ -441,6 +614,20 @@ def build_commit_message(charts: Dict[str, ChartMeta]) -> Tuple[str, str]:
     return title, body
 
 
+def convert_template_field(matched: re.Match[str]) -> str:
+    field = matched.group(1)
+    if field is None:
+        return matched.group(0)[0]
+    return f"%({field})s"
+
+
+@lru_cache(maxsize=4)
+def load_pr_template(template_path: str, mtime_ns: int) -> str:
+    # Convert the str.format-style template to %-style once per file version.
+    template = Path(template_path).read_text(encoding="utf-8").replace("%", "%%")
+    return TEMPLATE_FIELD_PATTERN.sub(convert_template_field, template)
+
+
 def render_pr_body(
     template_path: Path,
     charts: Dict[str, ChartMeta],
@@ -448,28 +635,34 @@ def render_pr_body(
     command_lines: List[str],
     lint_executed: bool,
 ) -> str:
-    template = template_path.read_text(encoding="utf-8")
+    template = load_pr_template(str(template_path), template_path.stat().st_mtime_ns)
     portal = charts["apollo-portal"]
     service = charts["apollo-service"]
     artifact_lines = "\n".join(f"- `{item}`" for item in artifacts)
     command_bullets = "\n".join(f"- `{line}`" for line in command_lines)
     lint_note = "passed for both charts" if lint_executed else "skipped by --skip-lint"
 
-    return template.format(
-        portal_version=portal.version,
-        portal_app_version=portal.app_version,
-        service_version=service.version,
-        service_app_version=service.app_version,
-        artifacts=artifact_lines,
-        commands=command_bullets,
-        lint_note=lint_note,
-    ).strip() + "\n"
+    return (template % {
+        "portal_version": portal.version,
+        "portal_app_version": portal.app_version,
+        "service_version": service.version,
+        "service_app_version": service.app_version,
+        "artifacts": artifact_lines,
+        "commands": command_bullets,
+        "lint_note": lint_note,
+    }).strip() + "\n"
 
 
-def ensure_branch(repo_root: Path, branch_name: str, executed: List[str]) -> str:
-    current_branch = run_command(
-        ["git", "branch", "--show-current"], repo_root, executed
-    ).stdout.strip()
+def ensure_branch(
+    repo_root: Path,
+    branch_name: str,
+    executed: List[str],
+    current_branch: Optional[str] = None,
+) -> str:
+    if current_branch is None:
+        current_branch = run_command(
+            ["git", "branch", "--show-current"], repo_root, executed
+        ).stdout.strip()
     if current_branch == branch_name:
         return "reused-current"
 
@@ -494,7 +687,9 @@ def stage_and_commit(
     commit_body: str,
     executed: List[str],
 ) -> None:
-    to_stage = sorted(set(path for path in changed_paths if is_allowed_changed_path(path)))
+    to_stage = list(
+        dict.fromkeys(path for path in changed_paths if is_allowed_changed_path(path))
+    )
     if not to_stage:
         raise FlowError("No allowed changed files found to stage for commit.")
 
@@ -512,15 +707,37 @@ def stage_and_commit(
     )
 
 
-def package_and_index(repo_root: Path, context: RunContext) -> List[str]:
+def package_file_names(charts: Dict[str, ChartMeta]) -> List[str]:
+    return [f"{chart.name}-{chart.version}.tgz" for chart in charts.values()]
+
+
+def move_packages_to_docs(
+    repo_root: Path,
+    charts: Dict[str, ChartMeta],
+    executed: List[str],
+) -> None:
+    file_names = package_file_names(charts)
+    executed.append(command_display(["mv", *file_names, "docs"]))
+    for file_name in file_names:
+        source = repo_root / file_name
+        if not source.is_file():
+            raise FlowError(f"Expected helm package not found: {file_name}")
+        os.replace(source, repo_root / "docs" / file_name)
+
+
+def package_and_index(
+    repo_root: Path,
+    context: RunContext,
+    charts: Dict[str, ChartMeta],
+) -> List[str]:
     run_command(["helm", "package", "apollo-portal"], repo_root, context.executed_commands)
     run_command(["helm", "package", "apollo-service"], repo_root, context.executed_commands)
-    run_command("mv *.tgz docs", repo_root, context.executed_commands, shell=True)
+    move_packages_to_docs(repo_root, charts, context.executed_commands)
     run_command(["helm", "repo", "index", "."], repo_root / "docs", context.executed_commands)
 
     artifacts = [
-        f"docs/apollo-portal-{read_chart_meta('apollo-portal', repo_root / CHART_PATHS['apollo-portal']).version}.tgz",
-        f"docs/apollo-service-{read_chart_meta('apollo-service', repo_root / CHART_PATHS['apollo-service']).version}.tgz",
+        f"docs/apollo-portal-{charts['apollo-portal'].version}.tgz",
+        f"docs/apollo-service-{charts['apollo-service'].version}.tgz",
         "docs/index.yaml",
     ]
     return artifacts
@@ -600,7 +817,7 @@ def run_flow(args: argparse.Namespace) -> int:
             [
                 "helm package apollo-portal",
                 "helm package apollo-service",
-                "mv *.tgz docs",
+                command_display(["mv", *package_file_names(charts), "docs"]),
                 "(cd docs && helm repo index .)",
             ]
         )
@@ -611,21 +828,25 @@ def run_flow(args: argparse.Namespace) -> int:
         ]
     else:
         print_header("Package and Index")
-        artifacts = package_and_index(repo_root, context)
+        artifacts = package_and_index(repo_root, context, charts)
         print("- Packaging and index update completed.")
 
-    changed_paths = collect_changed_paths(repo_root, context.executed_commands)
+    current_branch, changed_paths = collect_worktree_status(
+        repo_root, context.executed_commands
+    )
     disallowed = find_disallowed_paths(changed_paths)
+    # Paths keep porcelain order internally; only the listing shown to the user is sorted.
+    display_paths = sorted(changed_paths)
     print_header("Git Change Whitelist")
     if disallowed:
         print("- Changed paths:")
-        for path in changed_paths:
+        for path in display_paths:
             marker = "disallowed" if path in disallowed else "allowed"
             print(f"  - {path} ({marker})")
         raise FlowError("Found non-whitelisted changed files. Stop before commit.")
 
-    if changed_paths:
-        for path in changed_paths:
+    if display_paths:
+        for path in display_paths:
             print(f"- {path}")
     else:
         print("- No changed files detected.")
@@ -663,7 +884,9 @@ def run_flow(args: argparse.Namespace) -> int:
     branch_action = "dry-run"
     if not args.dry_run:
         print_header("Branch and Commit")
-        branch_action = ensure_branch(repo_root, branch_name, context.executed_commands)
+        branch_action = ensure_branch(
+            repo_root, branch_name, context.executed_commands, current_branch
+        )
         stage_and_commit(
             repo_root,
             changed_paths,
@@ -8,6 +8,7 @@ import textwrap
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 
 SCRIPT_PATH = Path(__file__).resolve().parent / "release_flow.py"
@@ -66,6 +67,47 @@ class ReleaseFlowHelperTests(unittest.TestCase):
         self.assertEqual(changes["apollo-service"]["version"], ("0.10.0", "0.11.0"))
         self.assertNotIn("appVersion", changes["apollo-service"])
 
+    def test_extract_version_changes_from_zero_context_diff(self) -> None:
+        diff_text = textwrap.dedent(
+            """\
+            diff --git a/apollo-portal/Chart.yaml b/apollo-portal/Chart.yaml
+            index 111..222 100644
+            --- a/apollo-portal/Chart.yaml
+            +++ b/apollo-portal/Chart.yaml
+            @@ -3 +3 @@ name: apollo-portal
+            -version: 0.10.0
+            +version: 0.11.0
+            @@ -5,0 +6 @@ description: Apollo portal
+            +appVersion: 2.5.0
+            """
+        )
+        changes = release_flow.extract_version_changes_from_diff(diff_text)
+
+        self.assertEqual(changes["apollo-portal"]["version"], ("0.10.0", "0.11.0"))
+        self.assertEqual(changes["apollo-portal"]["appVersion"], (None, "2.5.0"))
+        self.assertEqual(changes["apollo-service"], {})
+
+    def test_run_command_lines_tolerates_non_utf8_and_early_stop(self) -> None:
+        script = "import sys; sys.stdout.buffer.write(b'caf\\xe9\\n' + b'x' * 1024 * 1024 + b'\\n')"
+        with TemporaryDirectory() as temp_dir:
+            lines = release_flow.run_command_lines([sys.executable, "-c", script], Path(temp_dir))
+            self.assertEqual(next(lines), "caf\udce9\n")
+            # Closing before the child has written everything must not hang on the full pipe.
+            lines.close()
+
+    def test_compare_chart_versions(self) -> None:
+        self.assertEqual(release_flow.compare_chart_versions("0.11.0", "0.9.0"), 1)
+        self.assertEqual(release_flow.compare_chart_versions("0.9.0", "0.11.0"), -1)
+        self.assertEqual(release_flow.compare_chart_versions("1.0", "1.0.0"), 0)
+        self.assertEqual(release_flow.compare_chart_versions("1.0.0-rc1", "1.0.0"), -1)
+        self.assertEqual(release_flow.compare_chart_versions("1.0.0-rc2", "1.0.0-rc1"), 1)
+
+    def test_compare_chart_versions_mixed_parts_compare_as_strings(self) -> None:
+        self.assertEqual(release_flow.compare_chart_versions("1.2.x", "1.2.10"), 1)
+        self.assertEqual(release_flow.compare_chart_versions("1.2.1a", "1.2.10"), 1)
+        self.assertEqual(release_flow.compare_chart_versions("1.2.1a", "1.2.2"), -1)
+        self.assertIsNone(release_flow.chart_version_key("1.2.x"))
+
     def test_read_latest_versions_from_index(self) -> None:
         with TemporaryDirectory() as temp_dir:
             index_path = Path(temp_dir) / "index.yaml"
@@ -80,15 +122,62 @@ class ReleaseFlowHelperTests(unittest.TestCase):
                         - version: 0.10.0
                       apollo-service:
                         - version: 0.10.0
+                        - version: 0.11.x
                         - version: 0.11.0
                     """
                 ),
                 encoding="utf-8",
             )
-            latest = release_flow.read_latest_versions_from_index(index_path)
+            cache_path = Path(temp_dir) / "index-cache.json"
+            with mock.patch.object(release_flow, "INDEX_CACHE_PATH", cache_path):
+                latest = release_flow.read_latest_versions_from_index(index_path)
 
         self.assertEqual(latest["apollo-portal"], "0.11.0")
-        self.assertEqual(latest["apollo-service"], "0.11.0")
+        self.assertEqual(latest["apollo-service"], "0.11.x")
+
+    def test_read_latest_versions_from_index_uses_cache(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "index.yaml"
+            index_path.write_text(
+                textwrap.dedent(
+                    """\
+                    apiVersion: v1
+                    entries:
+                      apollo-portal:
+                        - version: 0.11.0
+                      apollo-service:
+                        - version: 0.11.0
+                    """
+                ),
+                encoding="utf-8",
+            )
+            cache_path = Path(temp_dir) / "cache" / "index-cache.json"
+            with mock.patch.object(release_flow, "INDEX_CACHE_PATH", cache_path):
+                first = release_flow.read_latest_versions_from_index(index_path)
+                self.assertEqual([path.name for path in cache_path.parent.iterdir()], ["index-cache.json"])
+                with mock.patch.object(release_flow, "load_yaml_file") as load_yaml_file:
+                    second = release_flow.read_latest_versions_from_index(index_path)
+                load_yaml_file.assert_not_called()
+
+                index_path.write_text(
+                    textwrap.dedent(
+                        """\
+                        apiVersion: v1
+                        entries:
+                          apollo-portal:
+                            - version: 0.11.0
+                            - version: 0.12.0
+                          apollo-service:
+                            - version: 0.12.0
+                        """
+                    ),
+                    encoding="utf-8",
+                )
+                third = release_flow.read_latest_versions_from_index(index_path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(third["apollo-portal"], "0.12.0")
+        self.assertEqual(third["apollo-service"], "0.12.0")
 
     def test_build_release_branch(self) -> None:
         self.assertEqual(
@@ -100,6 +189,79 @@ class ReleaseFlowHelperTests(unittest.TestCase):
             "codex/helm-release-0.11.0-0.11.1",
         )
 
+    def test_validate_chart_consistency(self) -> None:
+        charts = {
+            "apollo-portal": release_flow.ChartMeta(
+                name="apollo-portal", path=Path("apollo-portal/Chart.yaml"), version="0.11.0", app_version="2.5.0"
+            ),
+            "apollo-service": release_flow.ChartMeta(
+                name="apollo-service", path=Path("apollo-service/Chart.yaml"), version="0.11.0", app_version="2.4.0"
+            ),
+        }
+        with self.assertRaisesRegex(release_flow.FlowError, "Chart appVersion mismatch detected"):
+            release_flow.validate_chart_consistency(charts, allow_version_mismatch=False)
+
+        warnings = release_flow.validate_chart_consistency(charts, allow_version_mismatch=True)
+        self.assertEqual(
+            warnings,
+            ["Chart appVersion mismatch detected: apollo-portal=2.5.0, apollo-service=2.4.0"],
+        )
+
+    def test_render_pr_body(self) -> None:
+        charts = {
+            "apollo-portal": release_flow.ChartMeta(
+                name="apollo-portal", path=Path("apollo-portal/Chart.yaml"), version="0.11.0", app_version="2.5.0"
+            ),
+            "apollo-service": release_flow.ChartMeta(
+                name="apollo-service", path=Path("apollo-service/Chart.yaml"), version="0.11.0", app_version="2.5.0"
+            ),
+        }
+        with TemporaryDirectory() as temp_dir:
+            template_path = Path(temp_dir) / "pr-template.md"
+            template_path.write_text(
+                "portal {portal_version}/{portal_app_version} 100% {{literal}}\n"
+                "{artifacts}\n{commands}\nlint {lint_note}\n",
+                encoding="utf-8",
+            )
+            body = release_flow.render_pr_body(
+                template_path,
+                charts,
+                artifacts=["docs/index.yaml"],
+                command_lines=["helm repo index ."],
+                lint_executed=False,
+            )
+
+        self.assertEqual(
+            body,
+            "portal 0.11.0/2.5.0 100% {literal}\n"
+            "- `docs/index.yaml`\n- `helm repo index .`\nlint skipped by --skip-lint\n",
+        )
+
+    def test_parse_worktree_status(self) -> None:
+        status_output = (
+            "# branch.oid 1234567\0"
+            "# branch.head codex/helm-release-0.11.0\0"
+            "1 .M N... 100644 100644 100644 111 111 apollo-portal/Chart.yaml\0"
+            "2 R. N... 100644 100644 100644 222 222 R100 docs/apollo-portal-0.11.0.tgz\0"
+            "apollo-portal-0.11.0.tgz\0"
+            "? notes with spaces.md\0"
+        )
+        branch, paths = release_flow.parse_worktree_status(status_output)
+
+        self.assertEqual(branch, "codex/helm-release-0.11.0")
+        self.assertEqual(
+            paths,
+            [
+                "apollo-portal/Chart.yaml",
+                "docs/apollo-portal-0.11.0.tgz",
+                "apollo-portal-0.11.0.tgz",
+                "notes with spaces.md",
+            ],
+        )
+        self.assertEqual(
+            release_flow.parse_worktree_status("# branch.head (detached)\0")[0], ""
+        )
+
     def test_whitelist_matching(self) -> None:
         paths = [
             "apollo-portal/Chart.yaml",
@@ -35,6 +35,19 @@ CHECKPOINTS = {
     "CREATE_ANNOUNCEMENT_DISCUSSION",
     "PUSH_POST_RELEASE_PR",
 }
+ANNOUNCEMENT_SECTION_TITLES = ("What's Changed", "New Contributors")
+FULL_CHANGELOG_MARKER = "**Full Changelog**:"
+FULL_CHANGELOG_URL_RE = re.compile(r"\s*(\S+)")
+RELEASE_VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+SNAPSHOT_VERSION_RE = re.compile(r"\d+\.\d+\.\d+-SNAPSHOT")
+TOKEN_SCOPES_RE = re.compile(r"Token scopes:\s*(.+)")
+SCOPE_SEPARATOR_RE = re.compile(r"[\s,]+")
+GITHUB_REMOTE_SLUG_RE = re.compile(
+    r"^(?:https?://github\.com/|git@github\.com:|ssh://git@github\.com/)([^/]+/[^/]+?)(?:\.git)?$"
+)
+POM_ARTIFACT_ID_RE = re.compile(r"<artifactId>([^<]+)</artifactId>")
+POM_REVISION_RE = re.compile(r"(<revision>)([^<]+)(</revision>)")
+PR_URL_NUMBER_RE = re.compile(r"/pull/(\d+)$")
 
 
 class ReleaseFlowError(RuntimeError):
@@ -61,9 +74,9 @@ class ReleaseFlow:
         self._validate_inputs()
 
     def _validate_inputs(self) -> None:
-        if not re.fullmatch(r"\d+\.\d+\.\d+", self.args.release_version):
+        if not RELEASE_VERSION_RE.fullmatch(self.args.release_version):
             raise ReleaseFlowError("--release-version must be in x.y.z format")
-        if not re.fullmatch(r"\d+\.\d+\.\d+-SNAPSHOT", self.args.next_snapshot):
+        if not SNAPSHOT_VERSION_RE.fullmatch(self.args.next_snapshot):
             raise ReleaseFlowError("--next-snapshot must be in x.y.z-SNAPSHOT format")
 
         existing_release_version = self.state.get("release_version")
@@ -215,7 +228,7 @@ class ReleaseFlow:
 
         if not self.args.skip_auth_check:
             auth_status = self._run_command(["gh", "auth", "status", "-h", "github.com"], check=True)
-            scopes_match = re.search(r"Token scopes:\s*(.+)", auth_status.stdout)
+            scopes_match = TOKEN_SCOPES_RE.search(auth_status.stdout)
             if scopes_match:
                 scopes_text = scopes_match.group(1).strip()
                 scopes = {
@@ -227,7 +240,7 @@ class ReleaseFlow:
                 scopes_text = auth_status.stdout
                 scopes = {
                     token.strip()
-                    for token in re.split(r"[\s,]+", scopes_text)
+                    for token in SCOPE_SEPARATOR_RE.split(scopes_text)
                     if token.strip()
                 }
             for required_scope in ["repo", "workflow"]:
@@ -278,21 +291,13 @@ class ReleaseFlow:
 
     @staticmethod
     def _normalize_github_slug(url: str) -> Optional[str]:
-        patterns = [
-            r"^https?://github\.com/([^/]+/[^/]+?)(?:\.git)?$",
-            r"^git@github\.com:([^/]+/[^/]+?)(?:\.git)?$",
-            r"^ssh://git@github\.com/([^/]+/[^/]+?)(?:\.git)?$",
-        ]
-        for pattern in patterns:
-            match = re.match(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = GITHUB_REMOTE_SLUG_RE.match(url)
+        return match.group(1) if match else None
 
     @staticmethod
     def _read_root_artifact_id(pom_path: Path) -> Optional[str]:
         content = pom_path.read_text(encoding="utf-8")
-        match = re.search(r"<artifactId>([^<]+)</artifactId>", content)
+        match = POM_ARTIFACT_ID_RE.search(content)
         if not match:
             return None
         return match.group(1).strip()
@@ -319,16 +324,15 @@ class ReleaseFlow:
 
     def _read_revision(self) -> str:
         pom = (self.repo_root / "pom.xml").read_text(encoding="utf-8")
-        match = re.search(r"<revision>([^<]+)</revision>", pom)
+        match = POM_REVISION_RE.search(pom)
         if not match:
             raise ReleaseFlowError("Failed to locate <revision> in pom.xml")
-        return match.group(1).strip()
+        return match.group(2).strip()
 
     def _write_revision(self, revision: str) -> None:
         pom_path = self.repo_root / "pom.xml"
         content = pom_path.read_text(encoding="utf-8")
-        new_content, count = re.subn(
-            r"(<revision>)([^<]+)(</revision>)",
+        new_content, count = POM_REVISION_RE.subn(
             rf"\g<1>{revision}\g<3>",
             content,
             count=1,
@@ -661,35 +665,43 @@ class ReleaseFlow:
             time.sleep(self.args.poll_interval_seconds)
 
     @staticmethod
-    def _extract_section_bullets(markdown: str, section_title: str) -> list[str]:
-        section_pattern = re.compile(
-            rf"^## {re.escape(section_title)}[ \t]*\r?$\n?([\s\S]*?)(?=^## |\Z)",
-            re.MULTILINE,
-        )
-        match = section_pattern.search(markdown)
-        if not match:
-            return []
-        lines: list[str] = []
-        for line in match.group(1).splitlines():
-            stripped = line.strip()
-            if stripped.startswith("* "):
-                lines.append(stripped)
-        return lines
-
-    @staticmethod
-    def _extract_full_changelog(markdown: str) -> Optional[str]:
-        match = re.search(r"\*\*Full Changelog\*\*:\s*(\S+)", markdown)
-        if not match:
-            return None
-        return match.group(1)
+    def _scan_release_notes(markdown: str) -> tuple[list[str], list[str], Optional[str]]:
+        """Collect What's Changed and New Contributors bullets plus the Full Changelog URL in one pass."""
+        sections: dict[str, list[str]] = {}
+        current: Optional[list[str]] = None
+        full_changelog_url: Optional[str] = None
+        changelog_seen = False
+        offset = 0
+        # Split on "\n" only: a heading has to start a real line, not follow a splitlines() separator like \x0b.
+        for line in markdown.split("\n"):
+            if line.startswith("## "):
+                heading = line[3:-1] if line.endswith("\r") else line[3:]
+                heading = heading.rstrip(" \t")
+                # Only the first heading with a given title opens a section; any "## " line closes it.
+                current = None
+                if heading in ANNOUNCEMENT_SECTION_TITLES and heading not in sections:
+                    current = sections[heading] = []
+            elif current is not None:
+                for part in line.splitlines():
+                    stripped = part.strip()
+                    if stripped.startswith("* "):
+                        current.append(stripped)
+            if not changelog_seen:
+                marker_index = line.find(FULL_CHANGELOG_MARKER)
+                if marker_index >= 0:
+                    changelog_seen = True
+                    url_match = FULL_CHANGELOG_URL_RE.match(
+                        markdown, offset + marker_index + len(FULL_CHANGELOG_MARKER)
+                    )
+                    full_changelog_url = url_match.group(1) if url_match else None
+            offset += len(line) + 1
+        return sections.get("What's Changed", []), sections.get("New Contributors", []), full_changelog_url
 
     @classmethod
     def _render_announcement_from_release_notes(
         cls, release_version: str, release_notes_markdown: str
     ) -> str:
-        change_lines = cls._extract_section_bullets(release_notes_markdown, "What's Changed")
-        contributor_lines = cls._extract_section_bullets(release_notes_markdown, "New Contributors")
-        full_changelog_url = cls._extract_full_changelog(release_notes_markdown)
+        change_lines, contributor_lines, full_changelog_url = cls._scan_release_notes(release_notes_markdown)
 
         lines: list[str] = [
             "Hi all,",
@@ -1008,7 +1020,7 @@ class ReleaseFlow:
 
     @staticmethod
     def _extract_pr_number(url: str) -> int:
-        match = re.search(r"/pull/(\d+)$", url)
+        match = PR_URL_NUMBER_RE.search(url)
         if not match:
             raise ReleaseFlowError(f"Unable to parse PR number from URL: {url}")
         return int(match.group(1))
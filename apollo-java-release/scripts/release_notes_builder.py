@@ -4,16 +4,28 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http.client
 import json
+import os
 import re
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson is optional; the stdlib parser reads the same payloads, just slower.
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ChangeEntry:
     raw_text: str
     summary: str
@@ -21,13 +33,13 @@ class ChangeEntry:
     pr_number: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HighlightItem:
     title: str
     body: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PullRequestContext:
     title: Optional[str]
     body: str
@@ -36,12 +48,19 @@ class PullRequestContext:
     doc_lines: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PullRequestMeta:
     title: Optional[str]
     author_login: Optional[str]
 
 
+@dataclass(slots=True, frozen=True)
+class MarkdownLineBuckets:
+    section_lines: list[str]
+    code_lines: list[str]
+    body_lines: list[str]
+
+
 USAGE_HEADING_HINTS = [
     "usage",
     "how to use",
@@ -78,6 +97,14 @@ NOISE_LINE_HINTS = [
     "coding agent tips",
 ]
 
+# One (substring, weight) table so _score_usage_line walks the hints in a single loop.
+USAGE_LINE_HINT_WEIGHTS = (
+    *((hint, 2) for hint in USAGE_LINE_HINTS),
+    *((hint, -2) for hint in NOISE_LINE_HINTS),
+    ("curl ", 4),
+    ("openapi java client can call", 4),
+)
+
 BOT_LOGIN_HINTS = [
     "coderabbit",
     "github-actions",
@@ -93,20 +120,351 @@ AUTO_SUMMARY_HINTS = [
     "suggested reviewers",
 ]
 
+LIST_MARKER_PREFIX_RE = re.compile(r"^(?:[-*+]\s+)?(?:\d+[.)]\s+)?")
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+# Either a whole-line `[summary](url)` link, or free text split around its first URL.
+CHANGE_ENTRY_RE = re.compile(
+    r"\s*\[(?P<link_summary>[^\]]+)\]\((?P<link_url>https?://[^)]+)\)\s*"
+    r"|(?:(?P<before>.*?)(?P<url>https?://\S+))?(?P<after>.*)",
+    re.DOTALL,
+)
+BACKTICK_TRANSLATION = str.maketrans("", "", "`")
+AUTO_GENERATED_COMMENT_RE = re.compile(
+    r"<!--\s*This is an auto-generated comment:[\s\S]*?end of auto-generated comment:[\s\S]*?-->",
+    re.IGNORECASE,
+)
+HTML_COMMENT_RE = re.compile(r"<!--[\s\S]*?-->")
+PR_TITLE_NUMBER_SUFFIX_RE = re.compile(r"\(#\d+\)$")
+PR_TITLE_ISSUE_PREFIX_RE = re.compile(r"^\[issue[-_\s]?\d+\]:?\s*", re.IGNORECASE)
+ENDPOINT_PATTERN = r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[A-Za-z0-9._~!$&'()*+,;=:@%/\-{}]+)"
+ENDPOINT_RE = re.compile(ENDPOINT_PATTERN)
+ENDPOINT_ANY_CASE_RE = re.compile(ENDPOINT_PATTERN, re.IGNORECASE)
+CLIENT_CALL_RE = re.compile(r"\bclient\.([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+CLIENT_CALL_NO_ARGS_RE = re.compile(r"client\.([A-Za-z_][A-Za-z0-9_]*)\(\)")
+CURL_COMMAND_RE = re.compile(r"(curl\s+[^\n`]+?)(?:\s+and\s+you\s+can|\s+to\s+|\s*$)", re.IGNORECASE)
+TASK_LIST_PREFIXES = ("- [ ]", "- [x]", "- [X]")
+# Task-list items, headings, quotes, images and HTML never make useful usage lines.
+SKIPPED_CANDIDATE_PREFIXES = ("#", ">", "![", "<", *TASK_LIST_PREFIXES)
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$")
+HTTP_VERB_WORD_RE = re.compile(r"\b(get|post|put|delete)\b")
+IDENTIFIER_ONLY_RE = re.compile(r"[A-Za-z0-9_.]+")
+SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+CHANGES_SEPARATOR_RE = re.compile(r"^-{3,}\s*$")
+PULL_NUMBER_RE = re.compile(r"/pull/(\d+)")
+CONVENTIONAL_PREFIX_RE = re.compile(
+    r"^(feat|fix|perf|refactor|docs|test|chore|build|ci|feature|bugfix|security|optimize)(\([^)]+\))?:\s*",
+    re.IGNORECASE,
+)
+BRACKET_PREFIX_RE = re.compile(r"^\[[^\]]+\]\s*")
+STAR_BULLET_RE = re.compile(r"^\*\s+")
+FULL_CHANGELOG_RE = re.compile(r"\*\*Full Changelog\*\*:\s*(\S+)")
+
+GH_API_CACHE_DIR = Path.home() / ".cache" / "apollo-release-notes"
+HTTP_HEADER_END_RE = re.compile(r"\r?\n\r?\n")
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+GITHUB_API_TIMEOUT_SECONDS = 30
+
+DOC_PATCH_JQ_FILTER = (
+    '.[] | select((.filename | startswith("docs/")) or (.filename | ascii_downcase | endswith(".md")))'
+    " | {filename, patch}"
+)
+
+DOC_PATCH_LINE_LIMIT = 500
+
+PR_BUNDLE_BATCH_SIZE = 25
+PR_FETCH_WORKERS = 8
+
+PR_BUNDLE_FIELDS = """
+      title
+      author { __typename login }
+      body
+      files(first: 100) { nodes { path } }
+      comments(first: 100) { nodes { author { __typename login } body } }
+"""
+
+# `gh pr view --json` shaped payloads keyed by (repo, pr_number), filled by _prefetch_pr_bundles.
+_PREFETCHED_PR_PAYLOADS: dict[tuple[str, int], dict] = {}
+
 
 def run_json_command(cmd: list[str]) -> object:
-    completed = subprocess.run(cmd, check=True, capture_output=True, text=True)
-    return json.loads(completed.stdout)
+    # Both parsers accept UTF-8 bytes, so gh output is never decoded into an intermediate str.
+    completed = subprocess.run(cmd, check=True, capture_output=True)
+    return _json_loads(completed.stdout)
+
+
+def iter_json_lines_command(cmd: list[str]) -> Iterator[object]:
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file
+        ) as process:
+            assert process.stdout is not None
+            exhausted = False
+            try:
+                for line in process.stdout:
+                    if line.strip():
+                        yield _json_loads(line)
+                exhausted = True
+            finally:
+                # The caller stopped early or a line failed to parse; gh's remaining pages are not needed.
+                if not exhausted:
+                    process.kill()
+            returncode = process.wait()
+        if returncode != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_file.read())
+
+
+def _split_http_response(output: str) -> tuple[int, dict[str, str], str]:
+    separator = HTTP_HEADER_END_RE.search(output)
+    head, body = (output[: separator.start()], output[separator.end() :]) if separator else (output, "")
+    head_lines = head.splitlines()
+    status_parts = head_lines[0].split() if head_lines else []
+    status = int(status_parts[1]) if len(status_parts) > 1 and status_parts[1].isdigit() else 0
+    headers: dict[str, str] = {}
+    for line in head_lines[1:]:
+        name, separator_char, value = line.partition(":")
+        if separator_char:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+class GitHubApiError(RuntimeError):
+    pass
+
+
+class _GitHubClient:
+    """Token-authenticated GitHub API client that keeps one HTTPS connection alive per thread."""
+
+    def __init__(self, token: str) -> None:
+        self._headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "apollo-java-release-notes-builder",
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        self._local = threading.local()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[dict] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request_headers = {**self._headers, **(headers or {})}
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, f"/{path.lstrip('/')}", body=body, headers=request_headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                # The server may close an idle keep-alive connection; retry once on a fresh one.
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise GitHubApiError(f"{method} {path} failed: {exc}") from exc
+                continue
+            return response.status, {name.lower(): value for name, value in response.getheaders()}, data
+        raise AssertionError("unreachable")
+
+    def request_json(self, method: str, path: str, payload: Optional[dict] = None) -> object:
+        status, _, data = self.request(method, path, payload)
+        if status >= 400:
+            raise GitHubApiError(f"{method} {path} returned HTTP {status}: {data[:200]!r}")
+        return _json_loads(data)
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=GITHUB_API_TIMEOUT_SECONDS)
+            self._local.connection = connection
+        return connection
+
+
+# Set by --use-github-api. gh stays the default so GH_HOST and the user's gh configuration apply.
+_GITHUB_CLIENT: Optional[_GitHubClient] = None
+
+
+def enable_github_api() -> None:
+    """Send GitHub calls over one kept-alive REST connection instead of running gh per call."""
+    global _GITHUB_CLIENT
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token:
+        try:
+            token = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=False).stdout.strip()
+        except OSError:
+            token = ""
+    if not token:
+        raise GitHubApiError("--use-github-api needs GH_TOKEN, GITHUB_TOKEN or a `gh auth login` session")
+    _GITHUB_CLIENT = _GitHubClient(token)
+
+
+def _github_client() -> Optional[_GitHubClient]:
+    return _GITHUB_CLIENT
+
+
+def gh_api_json(path: str, fields: Optional[dict[str, str]] = None, method: Optional[str] = None) -> object:
+    """Call a GitHub API path through `gh api`, or directly once --use-github-api is enabled."""
+    client = _github_client()
+    if client is None:
+        cmd = ["gh", "api"]
+        if method:
+            cmd.extend(["-X", method])
+        cmd.append(path)
+        for key, value in (fields or {}).items():
+            cmd.extend(["-f", f"{key}={value}"])
+        return run_json_command(cmd)
+
+    # Like `gh api`, sending fields implies POST, and graphql fields other than the query are variables.
+    resolved_method = method or ("POST" if fields else "GET")
+    payload: Optional[dict] = dict(fields) if fields else None
+    if path == "graphql" and payload is not None:
+        payload = {"query": payload.pop("query", ""), "variables": payload}
+    return client.request_json(resolved_method, path, payload)
+
+
+def run_cached_gh_api_json(endpoint: str) -> object:
+    """GET a REST endpoint, revalidating a local copy with its ETag."""
+    cache_path = GH_API_CACHE_DIR / f"{hashlib.sha256(endpoint.encode('utf-8')).hexdigest()}.json"
+    cached: object = None
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+    if not isinstance(cached, dict) or "payload" not in cached:
+        cached = None
+
+    etag = cached.get("etag") if cached else None
+    client = _github_client()
+    if client is not None:
+        status, headers, body = client.request("GET", endpoint, headers={"If-None-Match": etag} if etag else None)
+        if status == 304 and cached:
+            return cached["payload"]
+        if status >= 400:
+            raise GitHubApiError(f"GET {endpoint} returned HTTP {status}: {body[:200]!r}")
+    else:
+        cmd = ["gh", "api", "--include", endpoint]
+        if etag:
+            cmd[2:2] = ["-H", f"If-None-Match: {etag}"]
+        completed = subprocess.run(cmd, check=False, capture_output=True, text=True)
+        status, headers, body = _split_http_response(completed.stdout)
+        # gh exits non-zero on 304, so the status line decides whether the local copy is still valid.
+        if status == 304 and cached:
+            return cached["payload"]
+        if completed.returncode != 0:
+            raise subprocess.CalledProcessError(
+                completed.returncode, cmd, output=completed.stdout, stderr=completed.stderr
+            )
+
+    payload = _json_loads(body)
+    etag = headers.get("etag")
+    if etag:
+        try:
+            GH_API_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"etag": etag, "payload": payload}), encoding="utf-8")
+        except OSError:
+            pass
+    return payload
+
+
+def _normalize_graphql_author(author: object) -> Optional[dict[str, str]]:
+    if not isinstance(author, dict):
+        return None
+    login = author.get("login")
+    if not isinstance(login, str):
+        return None
+    # `gh pr view` reports GitHub App authors as app/<slug>; keep the same shape.
+    if author.get("__typename") == "Bot":
+        login = f"app/{login}"
+    return {"login": login}
+
 
+def _fetch_pr_bundle(repo: str, pr_numbers: tuple[int, ...]) -> dict[int, dict]:
+    owner, _, name = repo.partition("/")
+    aliases = "\n".join(
+        f"    pr{pr_number}: pullRequest(number: {pr_number}) {{{PR_BUNDLE_FIELDS}    }}"
+        for pr_number in pr_numbers
+    )
+    query = (
+        "query($owner: String!, $name: String!) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{aliases}\n"
+        "  }\n"
+        "}"
+    )
+    payload = gh_api_json("graphql", {"query": query, "owner": owner, "name": name})
+    repository = payload.get("data", {}).get("repository") if isinstance(payload, dict) else None
+    if not isinstance(repository, dict):
+        return {}
+
+    bundle: dict[int, dict] = {}
+    for pr_number in pr_numbers:
+        node = repository.get(f"pr{pr_number}")
+        if not isinstance(node, dict):
+            continue
+        bundle[pr_number] = {
+            "title": node.get("title"),
+            "author": _normalize_graphql_author(node.get("author")),
+            "body": node.get("body"),
+            "files": (node.get("files") or {}).get("nodes") or [],
+            "comments": [
+                {**comment, "author": _normalize_graphql_author(comment.get("author"))}
+                for comment in (node.get("comments") or {}).get("nodes") or []
+                if isinstance(comment, dict)
+            ],
+        }
+    return bundle
+
+
+def _prefetch_pr_bundles(repo: str, pr_numbers: Iterable[int]) -> None:
+    pending = sorted({number for number in pr_numbers if (repo, number) not in _PREFETCHED_PR_PAYLOADS})
+    for start in range(0, len(pending), PR_BUNDLE_BATCH_SIZE):
+        batch = tuple(pending[start : start + PR_BUNDLE_BATCH_SIZE])
+        try:
+            bundle = _fetch_pr_bundle(repo, batch)
+        except (subprocess.CalledProcessError, GitHubApiError, json.JSONDecodeError, OSError):
+            # Per-PR `gh pr view` lookups remain the fallback for anything not prefetched, so a
+            # failed batch only costs its own PRs and the remaining batches are still tried.
+            continue
+        for pr_number, payload in bundle.items():
+            _PREFETCHED_PR_PAYLOADS[(repo, pr_number)] = payload
 
+
+def clear_pr_cache() -> None:
+    """Forget memoized PR lookups so a long-lived caller sees fresh GitHub data."""
+    _PREFETCHED_PR_PAYLOADS.clear()
+    _fetch_pr_metadata.cache_clear()
+    _fetch_pr_context.cache_clear()
+
+
+def _load_pr_view_payload(repo: str, pr_number: int, fields: str) -> object:
+    prefetched = _PREFETCHED_PR_PAYLOADS.get((repo, pr_number))
+    if prefetched is not None:
+        return prefetched
+    cmd = [
+        "gh",
+        "pr",
+        "view",
+        str(pr_number),
+        "--repo",
+        repo,
+        "--json",
+        fields,
+    ]
+    return run_json_command(cmd)
+
+
+@lru_cache(maxsize=4096)
 def _sanitize_text_line(text: str) -> str:
-    cleaned = text.strip()
-    cleaned = re.sub(r"^[-*+]\s+", "", cleaned)
-    cleaned = re.sub(r"^\d+[.)]\s+", "", cleaned)
-    cleaned = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1", cleaned)
-    cleaned = cleaned.replace("`", "")
-    cleaned = re.sub(r"\s+", " ", cleaned)
-    return cleaned.strip()
+    cleaned = LIST_MARKER_PREFIX_RE.sub("", text.strip(), count=1)
+    cleaned = MARKDOWN_LINK_RE.sub(r"\1", cleaned).translate(BACKTICK_TRANSLATION)
+    # str.split() uses the same whitespace definition as `\s` and also drops the ends.
+    return " ".join(cleaned.split())
 
 
 def _truncate_text(text: str, limit: int = 180) -> str:
@@ -115,6 +473,7 @@ def _truncate_text(text: str, limit: int = 180) -> str:
     return text[: limit - 3].rstrip() + "..."
 
 
+@lru_cache(maxsize=4096)
 def _is_bot_login(login: str) -> bool:
     lowered = login.lower().strip()
     if not lowered:
@@ -125,13 +484,8 @@ def _is_bot_login(login: str) -> bool:
 
 
 def _strip_auto_generated_content(markdown_text: str) -> str:
-    text = re.sub(
-        r"<!--\s*This is an auto-generated comment:[\s\S]*?end of auto-generated comment:[\s\S]*?-->",
-        "",
-        markdown_text,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(r"<!--[\s\S]*?-->", "", text)
+    text = AUTO_GENERATED_COMMENT_RE.sub("", markdown_text)
+    text = HTML_COMMENT_RE.sub("", text)
     cleaned_lines: list[str] = []
     for raw_line in text.splitlines():
         lowered = raw_line.strip().lower()
@@ -162,48 +516,43 @@ def _extract_added_lines_from_patch(patch_text: str) -> list[str]:
 
 
 def _fetch_doc_patch_lines(repo: str, pr_number: int) -> list[str]:
+    # Page through every changed file, but let gh's jq keep only doc files and their patches.
+    # Files are streamed one per line, so only the added lines are kept in memory.
+    lines: list[str] = []
     try:
-        payload = run_json_command(
-            ["gh", "api", f"repos/{repo}/pulls/{pr_number}/files?per_page=100"]
-        )
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        for item in iter_json_lines_command(
+            [
+                "gh",
+                "api",
+                "--paginate",
+                f"repos/{repo}/pulls/{pr_number}/files?per_page=100",
+                "--jq",
+                DOC_PATCH_JQ_FILTER,
+            ]
+        ):
+            if not isinstance(item, dict):
+                continue
+            filename = item.get("filename")
+            if not isinstance(filename, str) or not filename.strip():
+                continue
+            is_doc_file = filename.startswith("docs/") or filename.lower().endswith(".md")
+            if not is_doc_file:
+                continue
+            patch = item.get("patch")
+            if not isinstance(patch, str) or not patch.strip():
+                continue
+            lines.extend(_extract_added_lines_from_patch(patch))
+            if len(lines) >= DOC_PATCH_LINE_LIMIT:
+                break
+    except (subprocess.CalledProcessError, json.JSONDecodeError, OSError):
         return []
-
-    if not isinstance(payload, list):
-        return []
-
-    lines: list[str] = []
-    for item in payload:
-        if not isinstance(item, dict):
-            continue
-        filename = item.get("filename")
-        if not isinstance(filename, str) or not filename.strip():
-            continue
-        is_doc_file = filename.startswith("docs/") or filename.lower().endswith(".md")
-        if not is_doc_file:
-            continue
-        patch = item.get("patch")
-        if not isinstance(patch, str) or not patch.strip():
-            continue
-        lines.extend(_extract_added_lines_from_patch(patch))
-    return lines
+    return lines[:DOC_PATCH_LINE_LIMIT]
 
 
 @lru_cache(maxsize=512)
 def _fetch_pr_metadata(repo: str, pr_number: int) -> Optional[PullRequestMeta]:
     try:
-        payload = run_json_command(
-            [
-                "gh",
-                "pr",
-                "view",
-                str(pr_number),
-                "--repo",
-                repo,
-                "--json",
-                "title,author",
-            ]
-        )
+        payload = _load_pr_view_payload(repo, pr_number, "title,author")
     except (subprocess.CalledProcessError, json.JSONDecodeError):
         return None
 
@@ -221,10 +570,19 @@ def _fetch_pr_metadata(repo: str, pr_number: int) -> Optional[PullRequestMeta]:
     return PullRequestMeta(title=title, author_login=author_login)
 
 
+def _fetch_pr_payloads_concurrently(fetch, repo: str, pr_numbers: Iterable[int]) -> dict[int, object]:
+    unique_numbers = list(dict.fromkeys(pr_numbers))
+    if len(unique_numbers) <= 1:
+        return {pr_number: fetch(repo, pr_number) for pr_number in unique_numbers}
+    # Each lookup mostly waits on a gh subprocess, so threads overlap them despite the GIL.
+    with ThreadPoolExecutor(max_workers=min(PR_FETCH_WORKERS, len(unique_numbers))) as executor:
+        return dict(zip(unique_numbers, executor.map(lambda n: fetch(repo, n), unique_numbers)))
+
+
 def _sanitize_pr_title(title: str) -> str:
     cleaned = title.strip()
-    cleaned = re.sub(r"\(#\d+\)$", "", cleaned).strip()
-    cleaned = re.sub(r"^\[issue[-_\s]?\d+\]:?\s*", "", cleaned, flags=re.IGNORECASE).strip()
+    cleaned = PR_TITLE_NUMBER_SUFFIX_RE.sub("", cleaned).strip()
+    cleaned = PR_TITLE_ISSUE_PREFIX_RE.sub("", cleaned).strip()
     return cleaned
 
 
@@ -238,20 +596,10 @@ def _format_author_mention(login: Optional[str]) -> Optional[str]:
     return f"@{login}"
 
 
+@lru_cache(maxsize=512)
 def _fetch_pr_context(repo: str, pr_number: int) -> Optional[PullRequestContext]:
     try:
-        payload = run_json_command(
-            [
-                "gh",
-                "pr",
-                "view",
-                str(pr_number),
-                "--repo",
-                repo,
-                "--json",
-                "title,body,files,comments",
-            ]
-        )
+        payload = _load_pr_view_payload(repo, pr_number, "title,body,files,comments")
     except (subprocess.CalledProcessError, json.JSONDecodeError):
         return None
 
@@ -295,23 +643,58 @@ def _fetch_pr_context(repo: str, pr_number: int) -> Optional[PullRequestContext]
     )
 
 
-def _extract_usage_lines_from_code_blocks(markdown_text: str) -> list[str]:
+def _tokenize_markdown(markdown_text: str) -> MarkdownLineBuckets:
+    buckets = MarkdownLineBuckets(section_lines=[], code_lines=[], body_lines=[])
+    in_code_block = False
+    # The usage section ends at the next heading and tracks its own fences, as if it were split out on its own.
+    section_open = False
+    section_closed = False
+    section_in_code_block = False
+    # Code lines only count once their fence is closed, so an unterminated block contributes nothing.
+    open_block_lines: list[str] = []
+    for raw_line in markdown_text.splitlines():
+        stripped = raw_line.strip()
+        is_fence = stripped.startswith("```")
+        if not section_closed:
+            heading = HEADING_RE.match(stripped)
+            if heading and any(token in heading.group(1).strip().lower() for token in USAGE_HEADING_HINTS):
+                section_open = True
+            elif heading and section_open:
+                section_closed = True
+            elif section_open:
+                if is_fence:
+                    section_in_code_block = not section_in_code_block
+                elif not section_in_code_block:
+                    buckets.section_lines.append(raw_line)
+
+        if is_fence:
+            if in_code_block:
+                buckets.code_lines.extend(open_block_lines)
+                open_block_lines = []
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            open_block_lines.append(raw_line)
+        else:
+            buckets.body_lines.append(raw_line)
+    return buckets
+
+
+def _extract_usage_lines_from_code(code_lines: list[str]) -> list[str]:
     lines: list[str] = []
-    for match in re.finditer(r"```[A-Za-z0-9_-]*\s*\n([\s\S]*?)```", markdown_text):
-        block = match.group(1)
-        for raw_line in block.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            if "curl " in line:
-                lines.append(line)
-            endpoint_match = re.search(r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[A-Za-z0-9._~!$&'()*+,;=:@%/\-{}]+)", line)
-            if endpoint_match:
-                lines.append(f"{endpoint_match.group(1)} {endpoint_match.group(2)}")
-            client_call_match = re.search(r"\bclient\.([A-Za-z_][A-Za-z0-9_]*)\s*\(", line)
-            if client_call_match:
-                method = client_call_match.group(1)
-                lines.append(f"OpenAPI Java client can call client.{method}()")
+    for raw_line in code_lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        if "curl " in line:
+            lines.append(line)
+        endpoint_match = ENDPOINT_RE.search(line)
+        if endpoint_match:
+            lines.append(f"{endpoint_match.group(1)} {endpoint_match.group(2)}")
+        client_call_match = CLIENT_CALL_RE.search(line)
+        if client_call_match:
+            method = client_call_match.group(1)
+            lines.append(f"OpenAPI Java client can call client.{method}()")
     cleaned_lines: list[str] = []
     seen: set[str] = set()
     for item in lines:
@@ -326,27 +709,13 @@ def _extract_usage_lines_from_code_blocks(markdown_text: str) -> list[str]:
     return cleaned_lines
 
 
-def _split_candidate_lines(markdown_text: str) -> list[str]:
+def _filter_candidate_lines(raw_lines: list[str]) -> list[str]:
     lines: list[str] = []
-    in_code_block = False
-    for raw_line in markdown_text.splitlines():
-        if raw_line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-        if in_code_block:
-            continue
+    for raw_line in raw_lines:
         line = _sanitize_text_line(raw_line)
         if not line:
             continue
-        if line.startswith("#"):
-            continue
-        if re.match(r"^- \[[ xX]\]", line):
-            continue
-        if line.startswith(">"):
-            continue
-        if line.startswith("!["):
-            continue
-        if line.startswith("<"):
+        if line.startswith(SKIPPED_CANDIDATE_PREFIXES):
             continue
         if len(line) < 24:
             continue
@@ -354,50 +723,21 @@ def _split_candidate_lines(markdown_text: str) -> list[str]:
     return lines
 
 
-def _extract_usage_lines_from_sections(markdown_text: str) -> list[str]:
-    lines = markdown_text.splitlines()
-    section_lines: list[str] = []
-    collecting = False
-    for raw_line in lines:
-        stripped = raw_line.strip()
-        heading = re.match(r"^#{1,6}\s+(.+)$", stripped)
-        if heading:
-            heading_text = heading.group(1).strip().lower()
-            matched = any(token in heading_text for token in USAGE_HEADING_HINTS)
-            if matched:
-                collecting = True
-                continue
-            if collecting:
-                break
-        if collecting:
-            section_lines.append(raw_line)
-    return _split_candidate_lines("\n".join(section_lines))
-
-
+@lru_cache(maxsize=4096)
 def _score_usage_line(line: str) -> int:
     lowered = line.lower()
-    score = 0
-    for hint in USAGE_LINE_HINTS:
-        if hint in lowered:
-            score += 2
+    score = sum([weight for hint, weight in USAGE_LINE_HINT_WEIGHTS if hint in lowered])
     if "users can" in lowered or "you can" in lowered:
         score += 3
-    if "curl " in lowered:
-        score += 4
-    if "openapi java client can call" in lowered:
-        score += 4
     if "http" in lowered or "/api" in lowered:
         score += 2
-    if re.search(r"\b(get|post|put|delete)\b", lowered):
+    if HTTP_VERB_WORD_RE.search(lowered):
         score += 1
-    for hint in NOISE_LINE_HINTS:
-        if hint in lowered:
-            score -= 2
     if len(line) > 220:
         score -= 1
     if " " not in line:
         score -= 4
-    if re.fullmatch(r"[A-Za-z0-9_.]+", line):
+    if IDENTIFIER_ONLY_RE.fullmatch(line):
         score -= 5
     if lowered.startswith("fixes #"):
         score -= 4
@@ -409,114 +749,120 @@ def _score_usage_line(line: str) -> int:
 def _pick_best_usage_line(lines: list[str]) -> Optional[str]:
     if not lines:
         return None
-    scored: list[tuple[int, str]] = []
-    for line in lines:
-        score = _score_usage_line(line)
-        scored.append((score, line))
-    scored.sort(key=lambda item: (-item[0], len(item[1])))
-    best_score, best_line = scored[0]
+    scored = ((_score_usage_line(line), line) for line in lines)
+    best_score, best_line = max(scored, key=lambda item: (item[0], -len(item[1])))
     if best_score <= 0:
         return None
     return _truncate_text(best_line, limit=200)
 
 
 def _summarize_doc_files(files: list[str]) -> Optional[str]:
-    doc_files = [path for path in files if path.startswith("docs/") or path.lower().endswith(".md")]
-    if not doc_files:
-        return None
     names: list[str] = []
-    for path in doc_files:
-        name = Path(path).name
+    # Stop at the second distinct doc name instead of filtering the whole file list first.
+    for path in files:
+        if not (path.startswith("docs/") or path.lower().endswith(".md")):
+            continue
+        name = path.rsplit("/", 1)[-1]
         if name not in names:
             names.append(name)
-        if len(names) >= 2:
-            break
+            if len(names) >= 2:
+                break
+    if not names:
+        return None
     top_paths = ", ".join(f"`{name}`" for name in names)
     return _truncate_text(f"Detailed usage notes are documented in {top_paths}.", limit=170)
 
 
 def _extract_pr_usage_hint(context: PullRequestContext) -> tuple[Optional[str], Optional[str]]:
-    section_lines = _extract_usage_lines_from_sections(context.body)
+    doc_hint = _summarize_doc_files(context.files)
+    body_buckets = _tokenize_markdown(context.body)
+    section_lines = _filter_candidate_lines(body_buckets.section_lines)
     best_section_line = _pick_best_usage_line(section_lines)
     if best_section_line:
-        return best_section_line, _summarize_doc_files(context.files)
+        return best_section_line, doc_hint
 
-    code_lines = _extract_usage_lines_from_code_blocks(context.body)
+    code_lines = _extract_usage_lines_from_code(body_buckets.code_lines)
     best_code_line = _pick_best_usage_line(code_lines)
     if best_code_line:
-        return best_code_line, _summarize_doc_files(context.files)
+        return best_code_line, doc_hint
 
-    body_lines = _split_candidate_lines(context.body)
+    body_lines = _filter_candidate_lines(body_buckets.body_lines)
     best_body_line = _pick_best_usage_line(body_lines)
     if best_body_line:
-        return best_body_line, _summarize_doc_files(context.files)
+        return best_body_line, doc_hint
 
     best_doc_line = _pick_best_usage_line(context.doc_lines)
     if best_doc_line:
-        return best_doc_line, _summarize_doc_files(context.files)
+        return best_doc_line, doc_hint
 
     comment_lines: list[str] = []
     for comment in context.comments:
-        comment_lines.extend(_extract_usage_lines_from_sections(comment))
-        comment_lines.extend(_extract_usage_lines_from_code_blocks(comment))
-        comment_lines.extend(_split_candidate_lines(comment))
+        comment_buckets = _tokenize_markdown(comment)
+        comment_lines.extend(_filter_candidate_lines(comment_buckets.section_lines))
+        comment_lines.extend(_extract_usage_lines_from_code(comment_buckets.code_lines))
+        comment_lines.extend(_filter_candidate_lines(comment_buckets.body_lines))
     best_comment_line = _pick_best_usage_line(comment_lines)
     if best_comment_line:
-        return best_comment_line, _summarize_doc_files(context.files)
+        return best_comment_line, doc_hint
 
-    return None, _summarize_doc_files(context.files)
+    return None, doc_hint
 
 
+@lru_cache(maxsize=4096)
 def parse_semver(value: str) -> tuple[int, int, int]:
-    match = re.fullmatch(r"(\d+)\.(\d+)\.(\d+)", value)
+    match = SEMVER_RE.fullmatch(value)
     if not match:
         raise ValueError(f"Invalid semantic version: {value}")
     return tuple(int(part) for part in match.groups())
 
 
 def parse_highlight_pr_numbers(raw: str) -> list[int]:
-    tokens = [token.strip() for token in re.split(r"[,\s]+", raw.strip()) if token.strip()]
+    tokens = raw.replace(",", " ").split()
     if not tokens:
         raise ValueError("No PR numbers provided")
 
-    numbers: list[int] = []
-    seen: set[int] = set()
-    for token in tokens:
-        if not re.fullmatch(r"\d+", token):
-            raise ValueError(f"Invalid PR number: {token}")
-        value = int(token)
-        if value <= 0:
-            raise ValueError(f"Invalid PR number: {token}")
-        if value in seen:
-            continue
-        seen.add(value)
-        numbers.append(value)
-    return numbers
+    # isdecimal() accepts exactly the characters `\d` matched before.
+    invalid = next((token for token in tokens if not token.isdecimal() or int(token) <= 0), None)
+    if invalid is not None:
+        raise ValueError(f"Invalid PR number: {invalid}")
+    # dict.fromkeys dedupes while keeping the order the numbers were given in.
+    return list(dict.fromkeys(map(int, tokens)))
 
 
 def infer_previous_tag(repo: str, release_version: str) -> Optional[str]:
     release_tuple = parse_semver(release_version)
-    payload = run_json_command(["gh", "api", f"repos/{repo}/releases?per_page=100"])
-    candidates: list[tuple[tuple[int, int, int], str]] = []
+    payload = run_cached_gh_api_json(f"repos/{repo}/releases?per_page=100")
+    best_version: Optional[tuple[int, int, int]] = None
+    best_tag: Optional[str] = None
     for item in payload:
         tag = item.get("tag_name", "")
         if not isinstance(tag, str) or not tag.startswith("v"):
             continue
-        raw_version = tag[1:]
-        if not re.fullmatch(r"\d+\.\d+\.\d+", raw_version):
+        match = SEMVER_RE.fullmatch(tag, 1)
+        if not match:
             continue
-        version_tuple = parse_semver(raw_version)
-        if version_tuple < release_tuple:
-            candidates.append((version_tuple, tag))
-    if not candidates:
-        return None
-    candidates.sort(key=lambda item: item[0])
-    return candidates[-1][1]
+        version_tuple = tuple(int(part) for part in match.groups())
+        # `>=` keeps the last of equal versions, as the previous stable sort did.
+        if version_tuple < release_tuple and (best_version is None or version_tuple >= best_version):
+            best_version, best_tag = version_tuple, tag
+    return best_tag
 
 
 def _parse_release_changes_block(
     changes_file: Path, release_version: str
 ) -> tuple[list[str], Optional[str]]:
+    resolved = changes_file.resolve()
+    bullets, milestone_line = _parse_release_changes_block_cached(
+        resolved, release_version, resolved.stat().st_mtime_ns
+    )
+    return list(bullets), milestone_line
+
+
+@lru_cache(maxsize=8)
+def _parse_release_changes_block_cached(
+    changes_file: Path, release_version: str, mtime_ns: int
+) -> tuple[tuple[str, ...], Optional[str]]:
+    # mtime_ns is only part of the cache key, so an edited CHANGES.md is parsed again.
     lines = changes_file.read_text(encoding="utf-8").splitlines()
     header = f"Apollo Java {release_version}"
     start_index = -1
@@ -527,9 +873,8 @@ def _parse_release_changes_block(
     if start_index < 0:
         raise ValueError(f"Failed to locate section '{header}' in {changes_file}")
 
-    separator_pattern = re.compile(r"^-{3,}\s*$")
     index = start_index + 1
-    while index < len(lines) and not separator_pattern.match(lines[index].strip()):
+    while index < len(lines) and not CHANGES_SEPARATOR_RE.match(lines[index].strip()):
         index += 1
     if index >= len(lines):
         raise ValueError(f"Failed to locate first separator after '{header}'")
@@ -538,7 +883,7 @@ def _parse_release_changes_block(
     bullets: list[str] = []
     while index < len(lines):
         stripped = lines[index].strip()
-        if separator_pattern.match(stripped):
+        if CHANGES_SEPARATOR_RE.match(stripped):
             break
         if stripped.startswith("*"):
             content = stripped.lstrip("*").strip()
@@ -553,7 +898,7 @@ def _parse_release_changes_block(
             milestone_line = line
             break
 
-    return bullets, milestone_line
+    return tuple(bullets), milestone_line
 
 
 def parse_changes_section(changes_file: Path, release_version: str) -> tuple[list[str], Optional[str]]:
@@ -567,14 +912,17 @@ def parse_change_entries(changes_file: Path, release_version: str) -> tuple[list
 
 
 def _parse_change_entry(raw_text: str) -> ChangeEntry:
-    link_match = re.fullmatch(r"\[([^\]]+)\]\((https?://[^)]+)\)", raw_text.strip())
-    if link_match:
-        summary = link_match.group(1).strip()
-        pr_url = link_match.group(2).strip()
+    match = CHANGE_ENTRY_RE.fullmatch(raw_text)
+    if match.group("link_url"):
+        summary = match.group("link_summary").strip()
+        pr_url = match.group("link_url").strip()
+    elif match.group("url"):
+        pr_url = match.group("url")
+        # Later repeats of the same URL are dropped too, matching the old str.replace.
+        summary = (match.group("before") + match.group("after").replace(pr_url, "")).strip(" -")
     else:
-        url_match = re.search(r"(https?://\S+)", raw_text)
-        pr_url = url_match.group(1).strip() if url_match else None
-        summary = raw_text.replace(pr_url, "").strip(" -") if pr_url else raw_text.strip()
+        pr_url = None
+        summary = raw_text.strip()
 
     return ChangeEntry(
         raw_text=raw_text.strip(),
@@ -587,7 +935,7 @@ def _parse_change_entry(raw_text: str) -> ChangeEntry:
 def _extract_pr_number(pr_url: Optional[str]) -> Optional[int]:
     if not pr_url:
         return None
-    match = re.search(r"/pull/(\d+)", pr_url)
+    match = PULL_NUMBER_RE.search(pr_url)
     if not match:
         return None
     return int(match.group(1))
@@ -601,7 +949,22 @@ def _format_change_summary_text(entry: ChangeEntry) -> str:
     return fallback or "Release update"
 
 
-def format_change_lines(entries: Iterable[ChangeEntry], repo: Optional[str] = None) -> list[str]:
+def _prefetch_pr_metadata(repo: str, entries: Iterable[ChangeEntry]) -> dict[int, Optional[PullRequestMeta]]:
+    return _fetch_pr_payloads_concurrently(
+        _fetch_pr_metadata, repo, (entry.pr_number for entry in entries if entry.pr_number)
+    )
+
+
+def format_change_lines(
+    entries: Iterable[ChangeEntry],
+    repo: Optional[str] = None,
+    pr_metas: Optional[dict[int, Optional[PullRequestMeta]]] = None,
+) -> list[str]:
+    entries = list(entries)
+    metas: dict[int, Optional[PullRequestMeta]] = {}
+    if repo:
+        metas = pr_metas if pr_metas is not None else _prefetch_pr_metadata(repo, entries)
+
     lines: list[str] = []
     for entry in entries:
         summary = _format_change_summary_text(entry)
@@ -609,7 +972,7 @@ def format_change_lines(entries: Iterable[ChangeEntry], repo: Optional[str] = No
 
         author_mention: Optional[str] = None
         if repo and entry.pr_number:
-            meta = _fetch_pr_metadata(repo, entry.pr_number)
+            meta = metas.get(entry.pr_number)
             if meta:
                 if meta.title:
                     summary = _sanitize_pr_title(meta.title)
@@ -632,15 +995,11 @@ def format_change_lines(entries: Iterable[ChangeEntry], repo: Optional[str] = No
     return lines
 
 
+@lru_cache(maxsize=4096)
 def _clean_summary_for_highlight(summary: str) -> str:
     cleaned = summary.strip()
-    cleaned = re.sub(
-        r"^(feat|fix|perf|refactor|docs|test|chore|build|ci|feature|bugfix|security|optimize)(\([^)]+\))?:\s*",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
-    cleaned = re.sub(r"^\[[^\]]+\]\s*", "", cleaned).strip()
+    cleaned = CONVENTIONAL_PREFIX_RE.sub("", cleaned)
+    cleaned = BRACKET_PREFIX_RE.sub("", cleaned).strip()
     cleaned = cleaned.rstrip(".").strip()
     return cleaned
 
@@ -659,46 +1018,35 @@ def _build_highlight_title(summary: str) -> str:
     return f"{summary[:107].rstrip()}..."
 
 
+@lru_cache(maxsize=4096)
 def _normalize_usage_hint(text: str) -> str:
     normalized = _sanitize_text_line(text)
     if not normalized:
         return ""
 
-    lowered = normalized.lower()
-    users_idx = lowered.find("users can ")
+    users_idx = normalized.lower().find("users can ")
     if 0 < users_idx < 120:
         normalized = normalized[users_idx:]
-        lowered = normalized.lower()
 
-    curl_match = re.search(r"(curl\s+[^\n`]+?)(?:\s+and\s+you\s+can|\s+to\s+|\s*$)", normalized, re.IGNORECASE)
+    curl_match = CURL_COMMAND_RE.search(normalized)
     if curl_match:
         command = curl_match.group(1).strip().rstrip(".,;")
         normalized = f"You can verify this with `{_truncate_text(command, limit=140)}`"
-        lowered = normalized.lower()
 
-    client_call = re.search(r"client\.([A-Za-z_][A-Za-z0-9_]*)\(\)", normalized)
+    client_call = CLIENT_CALL_NO_ARGS_RE.search(normalized)
     if client_call:
         method = client_call.group(1)
         normalized = f"OpenAPI Java client now supports `client.{method}()` for this scenario"
-        lowered = normalized.lower()
 
-    endpoint_match = re.search(
-        r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[A-Za-z0-9._~!$&'()*+,;=:@%/\-{}]+)",
-        normalized,
-        re.IGNORECASE,
-    )
-    if endpoint_match and "call `" not in lowered:
+    # Only the endpoint guard and the "users can" prefix need a lowercase copy, so lower lazily there.
+    endpoint_match = ENDPOINT_ANY_CASE_RE.search(normalized)
+    if endpoint_match and "call `" not in normalized.lower():
         method = endpoint_match.group(1).upper()
         path = endpoint_match.group(2)
         normalized = f"Call `{method} {path}` to use this capability"
-        lowered = normalized.lower()
-
-    if lowered.startswith("you can "):
-        return _truncate_text(_ensure_sentence_end(normalized), limit=220)
-    if lowered.startswith("users can "):
-        return _truncate_text(_ensure_sentence_end(normalized[0].upper() + normalized[1:]), limit=220)
-    if lowered.startswith("call ") or lowered.startswith("openapi java client now supports"):
-        return _truncate_text(_ensure_sentence_end(normalized), limit=220)
+
+    if normalized[:10].lower() == "users can ":
+        normalized = normalized[0].upper() + normalized[1:]
     return _truncate_text(_ensure_sentence_end(normalized), limit=220)
 
 
@@ -763,6 +1111,10 @@ def build_highlights(
             f"Selected highlight PRs not found in CHANGES.md for Apollo Java {release_version}: {missing_str}"
         )
 
+    contexts: dict[int, Optional[PullRequestContext]] = {}
+    if repo:
+        contexts = _fetch_pr_payloads_concurrently(_fetch_pr_context, repo, highlight_pr_numbers)
+
     highlights: list[HighlightItem] = []
     for pr_number in highlight_pr_numbers:
         entry = entry_by_pr[pr_number]
@@ -777,7 +1129,7 @@ def build_highlights(
         usage_hint: Optional[str] = None
         doc_hint: Optional[str] = None
         if repo:
-            pr_context = _fetch_pr_context(repo, pr_number)
+            pr_context = contexts.get(pr_number)
             if pr_context:
                 usage_hint, doc_hint = _extract_pr_usage_hint(pr_context)
 
@@ -795,25 +1147,29 @@ def build_highlights(
     return highlights
 
 
-def extract_section_lines(markdown: str, section_title: str) -> list[str]:
-    section_pattern = re.compile(
+@lru_cache(maxsize=16)
+def _section_pattern(section_title: str) -> re.Pattern[str]:
+    return re.compile(
         rf"^## {re.escape(section_title)}[ \t]*\r?$\n?([\s\S]*?)(?=^## |\Z)",
         re.MULTILINE,
     )
-    match = section_pattern.search(markdown)
+
+
+def extract_section_lines(markdown: str, section_title: str) -> list[str]:
+    match = _section_pattern(section_title).search(markdown)
     if not match:
         return []
     section = match.group(1)
     lines: list[str] = []
     for line in section.splitlines():
         stripped = line.strip()
-        if re.match(r"^\*\s+", stripped):
+        if STAR_BULLET_RE.match(stripped):
             lines.append(stripped)
     return lines
 
 
 def extract_full_changelog(markdown: str) -> Optional[str]:
-    match = re.search(r"\*\*Full Changelog\*\*:\s*(\S+)", markdown)
+    match = FULL_CHANGELOG_RE.search(markdown)
     if not match:
         return None
     return match.group(1)
@@ -825,20 +1181,10 @@ def generate_notes_from_github(
     target_commitish: str,
     previous_tag_name: Optional[str],
 ) -> dict[str, str]:
-    cmd = [
-        "gh",
-        "api",
-        "-X",
-        "POST",
-        f"repos/{repo}/releases/generate-notes",
-        "-f",
-        f"tag_name=v{release_version}",
-        "-f",
-        f"target_commitish={target_commitish}",
-    ]
+    fields = {"tag_name": f"v{release_version}", "target_commitish": target_commitish}
     if previous_tag_name:
-        cmd.extend(["-f", f"previous_tag_name={previous_tag_name}"])
-    payload = run_json_command(cmd)
+        fields["previous_tag_name"] = previous_tag_name
+    payload = gh_api_json(f"repos/{repo}/releases/generate-notes", fields, method="POST")
     return {
         "name": payload.get("name", f"v{release_version}"),
         "body": payload.get("body", ""),
@@ -939,14 +1285,19 @@ def build_release_content(
     if not highlight_pr_numbers:
         raise ValueError("highlight_pr_numbers is required to build Highlights")
 
+    clear_pr_cache()
     entries, milestone_line = parse_change_entries(changes_file, release_version)
+    _prefetch_pr_bundles(repo, [entry.pr_number for entry in entries if entry.pr_number is not None])
+    # One concurrent metadata fan-out up front; the highlight title fallback then hits the
+    # _fetch_pr_metadata cache and the change lines reuse the same dict.
+    pr_metas = _prefetch_pr_metadata(repo, entries)
     highlights = build_highlights(
         entries,
         release_version,
         highlight_pr_numbers=highlight_pr_numbers,
         repo=repo,
     )
-    change_lines = format_change_lines(entries, repo=repo)
+    change_lines = format_change_lines(entries, repo=repo, pr_metas=pr_metas)
 
     resolved_previous_tag = previous_tag_name or infer_previous_tag(repo, release_version)
     generated_notes = generate_notes_from_github(
@@ -999,6 +1350,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output", required=True, help="Output markdown file")
     parser.add_argument("--target-commitish", default="main", help="Release target branch/commit")
     parser.add_argument("--previous-tag", default=None, help="Optional previous tag override")
+    parser.add_argument(
+        "--use-github-api",
+        action="store_true",
+        help="Call the GitHub REST/GraphQL API over one reused connection instead of running gh per call",
+    )
     return parser.parse_args()
 
 
@@ -1008,6 +1364,11 @@ def main() -> int:
         highlight_pr_numbers = parse_highlight_pr_numbers(args.highlight_prs)
     except ValueError as exc:
         raise SystemExit(f"--highlight-prs is invalid: {exc}") from exc
+    if args.use_github_api:
+        try:
+            enable_github_api()
+        except GitHubApiError as exc:
+            raise SystemExit(str(exc)) from exc
 
     content = build_release_content(
         repo=args.repo,
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import io
+import json
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
@@ -18,7 +21,44 @@ import workflow_log_validator
 from release_flow import ReleaseFlow
 
 
+CHANGES_2_5_0 = """Changes by Version
+==================
+Release Notes.
+
+Apollo Java 2.5.0
+
+------------------
+* [Support Spring Boot 4.0 bootstrap context package relocation](https://github.com/apolloconfig/apollo-java/pull/115)
+* [Fix change listener de-duplication by identity](https://github.com/apolloconfig/apollo-java/pull/121)
+
+------------------
+All issues and pull requests are [here](https://github.com/apolloconfig/apollo-java/milestone/5?closed=1)
+"""
+
+
 class ReleaseNotesBuilderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._changes_dir = tempfile.TemporaryDirectory()
+        cls.changes_path = Path(cls._changes_dir.name) / "CHANGES.md"
+        cls.changes_path.write_text(CHANGES_2_5_0, encoding="utf-8")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._changes_dir.cleanup()
+
+    def setUp(self) -> None:
+        # Memoized lookups are module-level, so no test sees another test's cached responses.
+        self.addCleanup(release_notes_builder.clear_pr_cache)
+
+    def test_github_api_is_opt_in(self) -> None:
+        with mock.patch.dict(release_notes_builder.os.environ, {"GH_TOKEN": "token"}), mock.patch.object(
+            release_notes_builder, "_GITHUB_CLIENT", None
+        ):
+            self.assertIsNone(release_notes_builder._github_client())
+            release_notes_builder.enable_github_api()
+            self.assertIsInstance(release_notes_builder._github_client(), release_notes_builder._GitHubClient)
+
     def test_parse_semver(self) -> None:
         self.assertEqual(release_notes_builder.parse_semver("2.5.0"), (2, 5, 0))
         with self.assertRaises(ValueError):
@@ -33,26 +73,13 @@ class ReleaseNotesBuilderTest(unittest.TestCase):
             release_notes_builder.parse_highlight_pr_numbers("115,abc")
 
     def test_parse_changes_section(self) -> None:
-        content = """Changes by Version
-==================
-Release Notes.
-
-Apollo Java 2.5.0
-
-------------------
-* [Feature A](https://github.com/apolloconfig/apollo-java/pull/1)
-* [Feature B](https://github.com/apolloconfig/apollo-java/pull/2)
-
-------------------
-All issues and pull requests are [here](https://github.com/apolloconfig/apollo-java/milestone/5?closed=1)
-"""
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "CHANGES.md"
-            path.write_text(content, encoding="utf-8")
-            bullets, milestone = release_notes_builder.parse_changes_section(path, "2.5.0")
+        bullets, milestone = release_notes_builder.parse_changes_section(self.changes_path, "2.5.0")
+        with mock.patch.object(Path, "read_text", side_effect=AssertionError("CHANGES.md read twice")):
+            entries, _ = release_notes_builder.parse_change_entries(self.changes_path, "2.5.0")
 
         self.assertEqual(len(bullets), 2)
         self.assertIn("milestone/5", milestone)
+        self.assertEqual([entry.pr_number for entry in entries], [115, 121])
 
     def test_build_highlights_uses_selected_prs(self) -> None:
         entries = [
@@ -157,75 +184,349 @@ All issues and pull requests are [here](https://github.com/apolloconfig/apollo-j
         self.assertEqual(len(highlights), 1)
         self.assertIn("GET /configfiles/json", highlights[0].body)
 
-    def test_build_release_content_uses_selected_highlights_and_authors(self) -> None:
-        content = """Changes by Version
-==================
-Release Notes.
+    def test_pick_best_usage_line_prefers_shorter_line_on_tie(self) -> None:
+        lines = [
+            "Users can set apollo.config-service.incremental to enable incremental sync for large apps.",
+            "You can set apollo.config-service.incremental to enable incremental sync.",
+            "Fixes #123",
+        ]
 
-Apollo Java 2.5.0
+        self.assertEqual(
+            release_notes_builder._pick_best_usage_line(lines),
+            "You can set apollo.config-service.incremental to enable incremental sync.",
+        )
+        self.assertIsNone(release_notes_builder._pick_best_usage_line(lines[2:]))
 
-------------------
-* [Support Spring Boot 4.0 bootstrap context package relocation](https://github.com/apolloconfig/apollo-java/pull/115)
-* [Fix change listener de-duplication by identity](https://github.com/apolloconfig/apollo-java/pull/121)
+    def test_pick_best_usage_line_keeps_positive_mcp_line(self) -> None:
+        line = "Users can now call the MCP server endpoint with curl http://localhost:8070/mcp to list configs."
 
-------------------
-All issues and pull requests are [here](https://github.com/apolloconfig/apollo-java/milestone/5?closed=1)
-"""
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "CHANGES.md"
-            path.write_text(content, encoding="utf-8")
-
-            with mock.patch.object(
-                release_notes_builder,
-                "infer_previous_tag",
-                return_value="v2.4.0",
-            ), mock.patch.object(
-                release_notes_builder,
-                "generate_notes_from_github",
-                return_value={"name": "v2.5.0", "body": ""},
-            ), mock.patch.object(
-                release_notes_builder,
-                "_fetch_pr_metadata",
-                side_effect=[
-                    release_notes_builder.PullRequestMeta(
-                        title="Support Spring Boot 4.0 bootstrap context package relocation",
-                        author_login="app/copilot-swe-agent",
-                    ),
-                    release_notes_builder.PullRequestMeta(
-                        title="fix: deduplicate config listeners by identity",
-                        author_login="nobodyiam",
-                    ),
-                    release_notes_builder.PullRequestMeta(
-                        title="Support Spring Boot 4.0 bootstrap context package relocation",
-                        author_login="app/copilot-swe-agent",
-                    ),
-                ],
-            ), mock.patch.object(
-                release_notes_builder,
-                "_fetch_pr_context",
-                return_value=None,
-            ):
-                result = release_notes_builder.build_release_content(
-                    repo="apolloconfig/apollo-java",
-                    release_version="2.5.0",
-                    changes_file=path,
-                    target_commitish="main",
-                    highlight_pr_numbers=[115],
-                )
+        self.assertEqual(release_notes_builder._pick_best_usage_line([line]), line)
+
+    def test_infer_previous_tag_picks_highest_older_release(self) -> None:
+        releases = [
+            {"tag_name": "v2.4.0"},
+            {"tag_name": "v2.5.0"},
+            {"tag_name": "v2.10.1"},
+            {"tag_name": "v2.4.1"},
+            {"tag_name": "v2.4.2-RC1"},
+            {"tag_name": "2.4.9"},
+        ]
+        with mock.patch.object(release_notes_builder, "run_cached_gh_api_json", return_value=releases):
+            self.assertEqual(release_notes_builder.infer_previous_tag("apolloconfig/apollo-java", "2.5.0"), "v2.4.1")
+            self.assertIsNone(release_notes_builder.infer_previous_tag("apolloconfig/apollo-java", "2.4.0"))
+
+    def test_tokenize_markdown_buckets_lines_in_one_pass(self) -> None:
+        buckets = release_notes_builder._tokenize_markdown(
+            "Intro line\n"
+            "## Usage\n"
+            "Users can enable incremental sync for large namespaces.\n"
+            "```bash\n"
+            "curl http://localhost:8080/configs\n"
+            "```\n"
+            "## Notes\n"
+            "Trailing line\n"
+            "```bash\n"
+            "never closed\n"
+        )
+
+        self.assertEqual(buckets.section_lines, ["Users can enable incremental sync for large namespaces."])
+        self.assertEqual(buckets.code_lines, ["curl http://localhost:8080/configs"])
+        self.assertEqual(buckets.body_lines[0], "Intro line")
+        self.assertNotIn("curl http://localhost:8080/configs", buckets.body_lines)
+
+    def test_build_release_content_uses_selected_highlights_and_authors(self) -> None:
+        metas = {
+            115: release_notes_builder.PullRequestMeta(
+                title="Support Spring Boot 4.0 bootstrap context package relocation",
+                author_login="app/copilot-swe-agent",
+            ),
+            121: release_notes_builder.PullRequestMeta(
+                title="fix: deduplicate config listeners by identity",
+                author_login="nobodyiam",
+            ),
+        }
+        with mock.patch.object(
+            release_notes_builder,
+            "infer_previous_tag",
+            return_value="v2.4.0",
+        ), mock.patch.object(
+            release_notes_builder,
+            "generate_notes_from_github",
+            return_value={"name": "v2.5.0", "body": ""},
+        ), mock.patch.object(
+            release_notes_builder,
+            "_fetch_pr_metadata",
+            side_effect=lambda _repo, pr_number: metas[pr_number],
+        ), mock.patch.object(
+            release_notes_builder,
+            "_fetch_pr_context",
+            return_value=None,
+        ), mock.patch.object(
+            release_notes_builder,
+            "_prefetch_pr_bundles",
+        ):
+            result = release_notes_builder.build_release_content(
+                repo="apolloconfig/apollo-java",
+                release_version="2.5.0",
+                changes_file=self.changes_path,
+                target_commitish="main",
+                highlight_pr_numbers=[115],
+            )
 
         notes = result["release_notes"]
         self.assertIn("### Support Spring Boot 4.0 bootstrap context package relocation", notes)
         self.assertIn("by @Copilot in https://github.com/apolloconfig/apollo-java/pull/115", notes)
 
+    def test_prefetch_pr_bundles_feeds_pr_context(self) -> None:
+        graphql_payload = {
+            "data": {
+                "repository": {
+                    "pr115": {
+                        "title": "Support Spring Boot 4.0 bootstrap context package relocation",
+                        "author": {"__typename": "Bot", "login": "copilot-swe-agent"},
+                        "body": "Users can enable the new bootstrap context with a single property.",
+                        "files": {"nodes": [{"path": "README.md"}]},
+                        "comments": {
+                            "nodes": [
+                                {"author": {"__typename": "Bot", "login": "coderabbitai"}, "body": "Walkthrough"},
+                                {"author": {"__typename": "User", "login": "nobodyiam"}, "body": "LGTM"},
+                            ]
+                        },
+                    }
+                }
+            }
+        }
+        with mock.patch.object(
+            release_notes_builder,
+            "run_json_command",
+            return_value=graphql_payload,
+        ) as run_json_command, mock.patch.object(
+            release_notes_builder,
+            "_fetch_doc_patch_lines",
+            return_value=[],
+        ):
+            release_notes_builder._prefetch_pr_bundles("apolloconfig/apollo-java", [115])
+            context = release_notes_builder._fetch_pr_context("apolloconfig/apollo-java", 115)
+
+        run_json_command.assert_called_once()
+        self.assertEqual(run_json_command.call_args.args[0][:3], ["gh", "api", "graphql"])
+        self.assertIsNotNone(context)
+        self.assertEqual(context.files, ["README.md"])
+        self.assertEqual(context.comments, ["LGTM"])
+        self.assertEqual(
+            release_notes_builder._PREFETCHED_PR_PAYLOADS[("apolloconfig/apollo-java", 115)]["author"],
+            {"login": "app/copilot-swe-agent"},
+        )
+
+    def test_fetch_pr_context_filters_bot_comments(self) -> None:
+        payload = {
+            "title": "Add feature",
+            "body": "",
+            "files": [],
+            "comments": [
+                {"author": {"login": "coderabbitai"}, "body": "Walkthrough"},
+                {"author": {"login": "alice"}, "body": "LGTM"},
+            ],
+        }
+        with mock.patch.object(
+            release_notes_builder,
+            "run_json_command",
+            return_value=payload,
+        ) as run_json_command, mock.patch.object(
+            release_notes_builder,
+            "_fetch_doc_patch_lines",
+            return_value=[],
+        ):
+            context = release_notes_builder._fetch_pr_context("apolloconfig/apollo-java", 116)
+
+        self.assertNotIn("--jq", run_json_command.call_args.args[0])
+        self.assertEqual(context.comments, ["LGTM"])
+
+    def test_prefetch_pr_bundles_continues_after_failed_batch(self) -> None:
+        def fetch_bundle(_repo: str, batch: tuple[int, ...]) -> dict[int, dict]:
+            if batch[0] == 1:
+                raise release_notes_builder.GitHubApiError("boom")
+            return {pr_number: {"title": f"PR {pr_number}"} for pr_number in batch}
+
+        with mock.patch.object(release_notes_builder, "PR_BUNDLE_BATCH_SIZE", 2), mock.patch.object(
+            release_notes_builder, "_fetch_pr_bundle", side_effect=fetch_bundle
+        ) as fetch_pr_bundle:
+            release_notes_builder._prefetch_pr_bundles("apolloconfig/apollo-java", [1, 2, 3, 4])
+
+        self.assertEqual(fetch_pr_bundle.call_count, 2)
+        self.assertEqual(
+            sorted(release_notes_builder._PREFETCHED_PR_PAYLOADS),
+            [("apolloconfig/apollo-java", 3), ("apolloconfig/apollo-java", 4)],
+        )
+
+    def test_fetch_doc_patch_lines_paginates_doc_files(self) -> None:
+        payload = [
+            {
+                "filename": "docs/en/client/java-sdk-user-guide.md",
+                "patch": "@@ -1 +1,2 @@\n+Users can enable incremental sync with apollo.config-service.incremental.",
+            },
+        ]
+        with mock.patch.object(
+            release_notes_builder,
+            "iter_json_lines_command",
+            return_value=payload,
+        ) as iter_json_lines_command:
+            lines = release_notes_builder._fetch_doc_patch_lines("apolloconfig/apollo-java", 115)
+
+        cmd = iter_json_lines_command.call_args.args[0]
+        self.assertIn("--paginate", cmd)
+        self.assertIn("--jq", cmd)
+        self.assertEqual(
+            lines,
+            ["Users can enable incremental sync with apollo.config-service.incremental."],
+        )
+
+    def test_iter_json_lines_command_streams_and_reports_failures(self) -> None:
+        script = "import sys\nfor i in range(3): print('{\"n\": %d}' % i)\nsys.exit(int(sys.argv[1]))"
+        stream = release_notes_builder.iter_json_lines_command([sys.executable, "-c", script, "0"])
+        self.assertEqual(next(stream), {"n": 0})
+        stream.close()
+
+        self.assertEqual(
+            list(release_notes_builder.iter_json_lines_command([sys.executable, "-c", script, "0"])),
+            [{"n": 0}, {"n": 1}, {"n": 2}],
+        )
+        with self.assertRaises(subprocess.CalledProcessError):
+            list(release_notes_builder.iter_json_lines_command([sys.executable, "-c", script, "3"]))
+
+    def test_run_cached_gh_api_json_revalidates_with_etag(self) -> None:
+        responses = [
+            mock.Mock(
+                returncode=0,
+                stdout='HTTP/2.0 200 OK\r\nEtag: W/"abc"\r\n\r\n[{"tag_name": "v2.4.0"}]',
+                stderr="",
+            ),
+            mock.Mock(returncode=1, stdout='HTTP/2.0 304 Not Modified\r\nEtag: W/"abc"\r\n\r\n', stderr=""),
+        ]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            release_notes_builder, "GH_API_CACHE_DIR", Path(tmp)
+        ), mock.patch.object(release_notes_builder.subprocess, "run", side_effect=responses) as run:
+            first = release_notes_builder.run_cached_gh_api_json("repos/apolloconfig/apollo-java/releases")
+            second = release_notes_builder.run_cached_gh_api_json("repos/apolloconfig/apollo-java/releases")
+
+        self.assertEqual(first, [{"tag_name": "v2.4.0"}])
+        self.assertEqual(second, first)
+        self.assertIn('If-None-Match: W/"abc"', run.call_args_list[1].args[0])
+
+    def test_run_cached_gh_api_json_uses_token_client_when_available(self) -> None:
+        client = mock.Mock()
+        client.request.side_effect = [
+            (200, {"etag": 'W/"abc"'}, b'[{"tag_name": "v2.4.0"}]'),
+            (304, {"etag": 'W/"abc"'}, b""),
+        ]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            release_notes_builder, "GH_API_CACHE_DIR", Path(tmp)
+        ), mock.patch.object(release_notes_builder, "_github_client", return_value=client), mock.patch.object(
+            release_notes_builder.subprocess, "run", side_effect=AssertionError("unexpected gh subprocess")
+        ):
+            first = release_notes_builder.run_cached_gh_api_json("repos/apolloconfig/apollo-java/releases")
+            second = release_notes_builder.run_cached_gh_api_json("repos/apolloconfig/apollo-java/releases")
+
+        self.assertEqual(second, first)
+        self.assertEqual(client.request.call_args_list[1].kwargs["headers"], {"If-None-Match": 'W/"abc"'})
+
 
 class WorkflowLogValidatorTest(unittest.TestCase):
     def test_parse_uploaded_urls(self) -> None:
         log = """
-Uploaded to releases: https://central.sonatype.com/repository/releases/com/ctrip/framework/apollo/apollo-core/2.5.0/apollo-core-2.5.0.jar
 Uploaded to releases: https://central.sonatype.com/repository/releases/com/ctrip/framework/apollo/apollo-core/2.5.0/apollo-core-2.5.0.pom
+Uploaded to releases: https://central.sonatype.com/repository/releases/com/ctrip/framework/apollo/apollo-core/2.5.0/apollo-core-2.5.0.jar
 """
-        urls = workflow_log_validator.parse_uploaded_urls(log, "releases")
-        self.assertEqual(len(urls), 2)
+        urls = workflow_log_validator.parse_uploaded_urls(log + log.splitlines()[1] + "\n", "releases")
+        # Upload order is kept: the .pom line comes first in the log, and the repeated line is dropped.
+        self.assertEqual([url.rpartition(".")[2] for url in urls], ["pom", "jar"])
+        colored_lines = [line.replace("Uploaded", "\x1b[1mUploaded\x1b[m") + "\n" for line in log.splitlines()]
+        self.assertEqual(workflow_log_validator.parse_uploaded_urls_stream(colored_lines, "releases"), urls)
+        with tempfile.TemporaryDirectory() as tmp:
+            plain_path = Path(tmp) / "plain.log"
+            plain_path.write_text(log, encoding="utf-8")
+            colored_path = Path(tmp) / "colored.log"
+            colored_path.write_text("".join(colored_lines), encoding="utf-8")
+            empty_path = Path(tmp) / "empty.log"
+            empty_path.write_text("", encoding="utf-8")
+            self.assertEqual(workflow_log_validator.parse_uploaded_urls_file(plain_path, "releases"), urls)
+            self.assertEqual(workflow_log_validator.parse_uploaded_urls_file(colored_path, "releases"), urls)
+            self.assertEqual(workflow_log_validator.parse_uploaded_urls_file(empty_path, "releases"), [])
+
+    def test_fetch_uploaded_urls_prefers_job_logs(self) -> None:
+        job_lines = ["2024-01-01T00:00:00Z Uploaded to releases: https://repo/apollo-core-1.0.jar\n"]
+        with mock.patch.object(workflow_log_validator, "iter_job_log_lines", return_value=iter(job_lines)), mock.patch.object(
+            workflow_log_validator, "iter_workflow_log_lines"
+        ) as run_log:
+            urls = workflow_log_validator.fetch_uploaded_urls("apolloconfig/apollo-java", 1, "releases")
+
+        self.assertEqual(urls, ["https://repo/apollo-core-1.0.jar"])
+        run_log.assert_not_called()
+
+    def test_fetch_uploaded_urls_falls_back_to_run_log(self) -> None:
+        run_lines = ["deploy\tUpload\tUploaded to releases: https://repo/apollo-core-1.0.pom\n"]
+        with mock.patch.object(workflow_log_validator, "iter_job_log_lines", return_value=iter([])), mock.patch.object(
+            workflow_log_validator, "iter_workflow_log_lines", return_value=iter(run_lines)
+        ):
+            urls = workflow_log_validator.fetch_uploaded_urls("apolloconfig/apollo-java", 1, "releases")
+
+        self.assertEqual(urls, ["https://repo/apollo-core-1.0.pom"])
+
+    def test_validate_uploaded_artifacts_buckets_by_path_segment(self) -> None:
+        base = "https://central.sonatype.com/repository/releases/com/ctrip/framework/apollo"
+        urls = [
+            f"{base}/apollo-core/2.5.0/apollo-core-2.5.0.jar",
+            f"{base}/apollo-core/2.5.0/apollo-core-2.5.0.jar.asc",
+            f"{base}/apollo-core/2.5.0/apollo-core-2.5.0.pom",
+            f"{base}/apollo-client/2.5.0/apollo-client-2.5.0.pom",
+        ]
+
+        report = workflow_log_validator.validate_uploaded_artifacts(urls, ["apollo-core", "apollo-client"])
+
+        self.assertEqual(report["artifact_reports"][0]["jar_urls"], [urls[0]])
+        self.assertEqual(report["missing"], [{"artifact_id": "apollo-client", "missing": ["jar"]}])
+        self.assertFalse(report["valid"])
+
+    def test_collect_non_pom_artifacts_walks_modules(self) -> None:
+        ns = ' xmlns="http://maven.apache.org/POM/4.0.0"'
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "pom.xml").write_text(
+                f"<project{ns}><parent><artifactId>parent</artifactId></parent><artifactId>apollo-java</artifactId>"
+                "<packaging>pom</packaging><modules><module>apollo-core</module><module>missing</module>"
+                "</modules></project>",
+                encoding="utf-8",
+            )
+            (root / "apollo-core").mkdir()
+            (root / "apollo-core" / "pom.xml").write_text(
+                f"<project{ns}><artifactId>apollo-core</artifactId><modules><module>..</module></modules></project>",
+                encoding="utf-8",
+            )
+
+            artifacts = workflow_log_validator.collect_non_pom_artifacts(root)
+
+        self.assertEqual(artifacts, ["apollo-core"])
+
+    def test_parse_pom_file_stops_after_artifact_id_for_leaf_pom(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pom_path = Path(tmp) / "pom.xml"
+            # The parser reads in chunks; stopping after artifactId means the broken tail is never fed.
+            tail = "<dependency/>" * 20000 + "<"
+            pom_path.write_text(f"<project><artifactId>apollo-core</artifactId><dependencies>{tail}", encoding="utf-8")
+
+            self.assertEqual(workflow_log_validator.parse_pom_file(pom_path), ("apollo-core", "jar", []))
+
+    def test_write_report_matches_json_dumps(self) -> None:
+        report = {"run_id": 7, "uploaded_urls": ["https://repo/a.jar", "https://repo/\u00e9.pom"], "valid": True}
+        expected = json.dumps(report, indent=2, ensure_ascii=True) + "\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "report.json"
+            with mock.patch.object(sys, "stdout", new=io.StringIO()) as stdout:
+                workflow_log_validator.write_report(report, str(output))
+            written = output.read_text(encoding="utf-8")
+
+        self.assertEqual(stdout.getvalue(), expected)
+        self.assertEqual(written, expected)
 
 
 class ReleaseFlowHelpersTest(unittest.TestCase):
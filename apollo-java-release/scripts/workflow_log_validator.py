@@ -4,93 +4,169 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import mmap
+import os
 import re
 import subprocess
-import xml.etree.ElementTree as ET
+import sys
+import tempfile
+from collections import deque
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
-
-
-def strip_namespace(tag: str) -> str:
-    if "}" in tag:
-        return tag.split("}", 1)[1]
-    return tag
+try:
+    from lxml import etree as ET
+except ImportError:
+    # lxml is optional; ElementTree exposes the same iterparse interface, just slower.
+    import xml.etree.ElementTree as ET
 
 
-def direct_child_text(element: ET.Element, child_name: str, default: Optional[str] = None) -> Optional[str]:
-    for child in list(element):
-        if strip_namespace(child.tag) == child_name and child.text is not None:
-            return child.text.strip()
-    return default
-
-
-def direct_child_modules(element: ET.Element) -> list[str]:
-    modules: list[str] = []
-    for child in list(element):
-        if strip_namespace(child.tag) != "modules":
-            continue
-        for module in list(child):
-            if strip_namespace(module.tag) == "module" and module.text:
-                modules.append(module.text.strip())
-    return modules
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
 
 
 def parse_pom_file(pom_path: Path) -> tuple[Optional[str], str, list[str]]:
-    tree = ET.parse(pom_path)
-    root = tree.getroot()
-    artifact_id = direct_child_text(root, "artifactId")
-    packaging = direct_child_text(root, "packaging", "jar") or "jar"
-    modules = direct_child_modules(root)
-    return artifact_id, packaging, modules
+    # Only direct children of <project> matter, so the POM is streamed and parsing stops once
+    # artifactId, packaging and modules have all been seen instead of building the whole tree.
+    artifact_id: Optional[str] = None
+    packaging: Optional[str] = None
+    modules: list[str] = []
+    data = pom_path.read_bytes()
+    # Leaf POMs usually have no <modules> and often no <packaging>; a raw substring miss proves the
+    # element is absent, so the parse can stop right after artifactId instead of reading to the end.
+    modules_seen = b"modules" not in data
+    packaging_seen = b"packaging" not in data
+    depth = 0
+    with io.BytesIO(data) as handle:
+        for event, element in ET.iterparse(handle, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            name = element.tag.rpartition("}")[2]
+            if name == "artifactId" and artifact_id is None and element.text is not None:
+                artifact_id = element.text.strip()
+            elif name == "packaging" and packaging is None and element.text is not None:
+                packaging = element.text.strip()
+                packaging_seen = True
+            elif name == "modules":
+                modules_seen = True
+                modules.extend(
+                    module.text.strip()
+                    for module in element
+                    # lxml also yields comments here, whose tag is not a string.
+                    if isinstance(module.tag, str) and module.tag.rpartition("}")[2] == "module" and module.text
+                )
+            element.clear()
+            if artifact_id is not None and packaging_seen and modules_seen:
+                break
+    return artifact_id, packaging or "jar", modules
+
+
+def _parse_module_pom(pom_path: Path) -> Optional[tuple[Optional[str], str, list[str]]]:
+    # Opening the file is the existence check, so listed modules cost no separate stat call.
+    try:
+        return parse_pom_file(pom_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def collect_non_pom_artifacts(repo_root: Path) -> list[str]:
     artifacts: set[str] = set()
-    visited: set[Path] = set()
-
-    def walk(pom_path: Path) -> None:
-        resolved = pom_path.resolve()
-        if resolved in visited:
-            return
-        visited.add(resolved)
-        artifact_id, packaging, modules = parse_pom_file(pom_path)
+    root_pom = repo_root / "pom.xml"
+    visited: set[Path] = {root_pom.resolve()}
+    queue: deque[tuple[Path, Optional[tuple[Optional[str], str, list[str]]]]] = deque(
+        [(root_pom, parse_pom_file(root_pom))]
+    )
+    while queue:
+        pom_path, parsed = queue.popleft()
+        if parsed is None:
+            continue
+        artifact_id, packaging, modules = parsed
         if artifact_id and packaging != "pom":
             artifacts.add(artifact_id)
         for module in modules:
             module_pom = pom_path.parent / module / "pom.xml"
-            if module_pom.exists():
-                walk(module_pom)
-
-    walk(repo_root / "pom.xml")
+            resolved = module_pom.resolve()
+            if resolved not in visited:
+                visited.add(resolved)
+                queue.append((module_pom, _parse_module_pom(module_pom)))
     return sorted(artifacts)
 
 
-def parse_uploaded_urls(log_text: str, repository_name: str) -> list[str]:
-    sanitized = ANSI_ESCAPE_RE.sub("", log_text)
-    pattern = re.compile(rf"Uploaded to {re.escape(repository_name)}:\s+(\S+)")
-    return sorted(set(pattern.findall(sanitized)))
+@lru_cache(maxsize=8)
+def _uploaded_pattern(repository_name: str) -> re.Pattern[str]:
+    return re.compile(rf"Uploaded to {re.escape(repository_name)}:\s+(\S+)")
+
+
+def _strip_ansi(text: str) -> str:
+    # Escapes can sit inside the "Uploaded to" marker or right after the URL, so they cannot be folded
+    # into the match pattern; skipping the substitution when there are none saves a full pass instead.
+    return ANSI_ESCAPE_RE.sub("", text) if "\x1b" in text else text
 
 
-def artifact_matches(url: str, artifact_id: str, suffix: str) -> bool:
-    if f"/{artifact_id}/" not in url:
-        return False
-    if not url.endswith(suffix):
-        return False
-    if url.endswith(f"{suffix}.asc"):
-        return False
-    return True
+# Uploaded URLs are deduplicated in upload (log) order; validation only looks URLs up by path
+# segment, so no sort is needed. Artifact ids stay sorted to keep the report stable across runs.
+def parse_uploaded_urls(log_text: str, repository_name: str) -> list[str]:
+    matches = _uploaded_pattern(repository_name).finditer(_strip_ansi(log_text))
+    return list(dict.fromkeys(match.group(1) for match in matches))
+
+
+def parse_uploaded_urls_stream(lines: Iterable[str], repository_name: str) -> list[str]:
+    pattern = _uploaded_pattern(repository_name)
+    urls: dict[str, None] = {}
+    for line in lines:
+        urls.update((match.group(1), None) for match in pattern.finditer(_strip_ansi(line)))
+    return list(urls)
+
+
+@lru_cache(maxsize=8)
+def _uploaded_bytes_pattern(repository_name: str) -> re.Pattern[bytes]:
+    # Same match as parse_uploaded_urls_stream: the URL has to follow on the same line.
+    return re.compile(rb"Uploaded to " + re.escape(repository_name.encode("utf-8")) + rb":[^\S\n]+(\S+)")
+
+
+def parse_uploaded_urls_file(log_path: Path, repository_name: str) -> list[str]:
+    with log_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return []
+        # Scan the page-cached file in place; only the matched URLs are ever decoded.
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(b"\x1b") == -1:
+                pattern = _uploaded_bytes_pattern(repository_name)
+                return list(dict.fromkeys(match.group(1).decode("utf-8") for match in pattern.finditer(mapped)))
+    # Coloured logs need ANSI stripping first, which happens line by line on decoded text.
+    with log_path.open(encoding="utf-8") as log_lines:
+        return parse_uploaded_urls_stream(log_lines, repository_name)
+
+
+def bucket_urls_by_path_segment(uploaded_urls: list[str]) -> dict[str, dict[str, list[str]]]:
+    # One pass over the URLs instead of one per artifact: each .jar/.pom URL is filed under every
+    # directory segment in its path, so looking up an artifact id matches "/{artifact_id}/" in url.
+    buckets: dict[str, dict[str, list[str]]] = {}
+    for url in uploaded_urls:
+        suffix = ".jar" if url.endswith(".jar") else ".pom" if url.endswith(".pom") else None
+        if suffix is None:
+            continue
+        for segment in dict.fromkeys(url.split("/")[1:-1]):
+            buckets.setdefault(segment, {".jar": [], ".pom": []})[suffix].append(url)
+    return buckets
 
 
 def validate_uploaded_artifacts(uploaded_urls: list[str], artifact_ids: list[str]) -> dict[str, object]:
     artifact_reports: list[dict[str, object]] = []
     missing: list[dict[str, object]] = []
+    buckets = bucket_urls_by_path_segment(uploaded_urls)
 
     for artifact_id in artifact_ids:
-        jar_urls = [url for url in uploaded_urls if artifact_matches(url, artifact_id, ".jar")]
-        pom_urls = [url for url in uploaded_urls if artifact_matches(url, artifact_id, ".pom")]
+        bucket = buckets.get(artifact_id, {})
+        jar_urls = list(bucket.get(".jar", []))
+        pom_urls = list(bucket.get(".pom", []))
         has_jar = len(jar_urls) > 0
         has_pom = len(pom_urls) > 0
 
@@ -118,14 +194,59 @@ def validate_uploaded_artifacts(uploaded_urls: list[str], artifact_ids: list[str
     }
 
 
-def fetch_workflow_log(repo: str, run_id: int) -> str:
-    completed = subprocess.run(
-        ["gh", "run", "view", str(run_id), "--repo", repo, "--log"],
-        check=True,
-        capture_output=True,
+def _iter_command_lines(cmd: list[str]) -> Iterator[str]:
+    # Workflow logs can be hundreds of MB, so lines are consumed as gh prints them instead of
+    # buffering the whole log; stderr is spooled to a file so a full pipe cannot stall gh.
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file, text=True
+        ) as process:
+            assert process.stdout is not None
+            exhausted = False
+            try:
+                yield from process.stdout
+                exhausted = True
+            finally:
+                if not exhausted:
+                    process.kill()
+            returncode = process.wait()
+        if returncode != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_file.read())
+
+
+def iter_workflow_log_lines(repo: str, run_id: int) -> Iterator[str]:
+    return _iter_command_lines(["gh", "run", "view", str(run_id), "--repo", repo, "--log"])
+
+
+def list_workflow_job_ids(repo: str, run_id: int) -> list[int]:
+    # Skipped jobs have no log to download.
+    output = subprocess.check_output(
+        [
+            "gh",
+            "api",
+            "--paginate",
+            f"repos/{repo}/actions/runs/{run_id}/jobs?per_page=100",
+            "--jq",
+            '.jobs[] | select(.conclusion != "skipped") | .id',
+        ],
+        stdin=subprocess.DEVNULL,
         text=True,
     )
-    return completed.stdout
+    return [int(line) for line in output.split()]
+
+
+def iter_job_log_lines(repo: str, run_id: int) -> Iterator[str]:
+    # Raw per-job logs skip the job/step prefix gh run view adds to every line, and skipped jobs.
+    for job_id in list_workflow_job_ids(repo, run_id):
+        yield from _iter_command_lines(["gh", "api", f"repos/{repo}/actions/jobs/{job_id}/logs"])
+
+
+def fetch_uploaded_urls(repo: str, run_id: int, repository_name: str) -> list[str]:
+    uploaded_urls = parse_uploaded_urls_stream(iter_job_log_lines(repo, run_id), repository_name)
+    if uploaded_urls:
+        return uploaded_urls
+    return parse_uploaded_urls_stream(iter_workflow_log_lines(repo, run_id), repository_name)
 
 
 def build_validation_report(
@@ -149,6 +270,19 @@ def build_validation_report(
     }
 
 
+def write_report(report: dict[str, object], output: Optional[str] = None) -> None:
+    # The report embeds every uploaded URL, so it is encoded chunk by chunk straight into stdout and
+    # the output file rather than first being joined into one large string.
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=True)
+    with open(output, "w", encoding="utf-8") if output else nullcontext() as handle:
+        streams = [sys.stdout] if handle is None else [handle, sys.stdout]
+        for chunk in encoder.iterencode(report):
+            for stream in streams:
+                stream.write(chunk)
+        for stream in streams:
+            stream.write("\n")
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate uploaded Maven artifacts from workflow logs")
     parser.add_argument("--repo-root", default=".", help="Apollo Java repository root")
@@ -167,11 +301,9 @@ def main() -> int:
         raise SystemExit("Either --run-id or --log-file must be provided")
 
     if args.log_file:
-        log_text = Path(args.log_file).read_text(encoding="utf-8")
+        uploaded_urls = parse_uploaded_urls_file(Path(args.log_file), args.repository_name)
     else:
-        log_text = fetch_workflow_log(args.repo, args.run_id)
-
-    uploaded_urls = parse_uploaded_urls(log_text, args.repository_name)
+        uploaded_urls = fetch_uploaded_urls(args.repo, args.run_id, args.repository_name)
     report = build_validation_report(
         repo_root=Path(args.repo_root),
         uploaded_urls=uploaded_urls,
@@ -179,10 +311,7 @@ def main() -> int:
         repository_name=args.repository_name,
     )
 
-    serialized = json.dumps(report, indent=2, ensure_ascii=True)
-    if args.output:
-        Path(args.output).write_text(serialized + "\n", encoding="utf-8")
-    print(serialized)
+    write_report(report, args.output)
     return 0 if report["valid"] else 2
 
 
@@ -4,18 +4,30 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
 import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Union
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson is optional; the stdlib parser reads the same payloads, just slower.
+    _json_loads = json.loads
 
 UPSTREAM_REPO = "apolloconfig/apollo-quick-start"
 DEFAULT_STATE_FILE = ".apollo-quick-start-release-state.json"
@@ -23,6 +35,17 @@ SYNC_WORKFLOW = "sync-apollo-release.yml"
 DOCKER_WORKFLOW = "docker-publish.yml"
 SYNC_BRANCH_PREFIX = "codex/quick-start-sync-"
 RUN_LIST_TIMEOUT_SECONDS = 30
+RUN_POLL_INITIAL_DELAY_SECONDS = 1
+# Runs created up to this long before the dispatch was sent still count as ours (clock skew).
+RUN_CREATED_SKEW = timedelta(seconds=5)
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+GITHUB_API_TIMEOUT_SECONDS = 30
+IDEMPOTENT_HTTP_METHODS = {"GET", "HEAD"}
+SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+TOKEN_SCOPES_RE = re.compile(r"Token scopes:\s*(.+)")
+SCOPE_SEPARATOR_RE = re.compile(r"[\s,]+")
+GITHUB_REMOTE_PREFIXES = ("https://github.com/", "http://github.com/", "git@github.com:", "ssh://git@github.com/")
 
 CHECKPOINTS = {
     "TRIGGER_SYNC_WORKFLOW",
@@ -36,6 +59,7 @@ STATE_RESERVED_KEYS = {
     "timestamps",
     "pending_checkpoint",
     "pending_message",
+    "github_cache",
 }
 
 
@@ -49,36 +73,73 @@ class CheckpointPending(ReleaseFlowError):
 
 @dataclass
 class CommandResult:
-    stdout: str
-    stderr: str
+    # bytes when the command ran with text=False, so JSON output skips a decode pass.
+    stdout: Union[str, bytes]
+    stderr: Union[str, bytes]
     returncode: int
 
 
+# macOS has no fdatasync.
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _fsync_directory(path: Path) -> None:
+    # The rename only survives a crash once the directory entry itself is on disk.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+@lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    # Each lookup walks every PATH entry; preflight and the GitHub client both ask for gh.
+    return shutil.which(tool)
+
+
+def _output_text(output: Union[str, bytes, None]) -> str:
+    if isinstance(output, bytes):
+        return output.decode("utf-8", "replace")
+    return output or ""
+
+
+@lru_cache(maxsize=64)
 def parse_semver(version: str) -> tuple[int, int, int]:
-    match = re.fullmatch(r"(\d+)\.(\d+)\.(\d+)", version or "")
+    match = SEMVER_RE.fullmatch(version or "")
     if not match:
         raise ValueError(f"Invalid semantic version: {version}")
     major_text, minor_text, patch_text = match.groups()
     return (int(major_text), int(minor_text), int(patch_text))
 
 
+@lru_cache(maxsize=256)
+def _parse_created_at(raw: str) -> datetime:
+    # The same runs come back on every poll; each timestamp is parsed once. fromisoformat only
+    # understands a trailing "Z" from Python 3.11 on.
+    if sys.version_info < (3, 11):
+        raw = raw.replace("Z", "+00:00")
+    return datetime.fromisoformat(raw)
+
+
 def select_workflow_run(
     runs: list[dict[str, Any]],
     started_at: datetime,
 ) -> Optional[dict[str, Any]]:
     candidates: list[tuple[datetime, dict[str, Any]]] = []
-    threshold = started_at - timedelta(seconds=5)
+    threshold = started_at - RUN_CREATED_SKEW
     for run in runs:
         raw_created = run.get("createdAt")
         if not isinstance(raw_created, str):
             continue
-        created_at = datetime.fromisoformat(raw_created.replace("Z", "+00:00"))
+        created_at = _parse_created_at(raw_created)
         if created_at >= threshold:
             candidates.append((created_at, run))
     if not candidates:
         return None
-    candidates.sort(key=lambda item: item[0], reverse=True)
-    return candidates[0][1]
+    return max(candidates, key=lambda item: item[0])[1]
 
 
 def is_pr_merged(pr_payload: dict[str, Any]) -> bool:
@@ -86,11 +147,98 @@ def is_pr_merged(pr_payload: dict[str, Any]) -> bool:
     return isinstance(merged_at, str) and bool(merged_at.strip())
 
 
+def _run_from_rest(run: dict[str, Any]) -> dict[str, Any]:
+    # Same fields `gh run list --json` returns, so both paths feed select_workflow_run alike.
+    return {
+        "databaseId": run.get("id"),
+        "createdAt": run.get("created_at"),
+        "url": run.get("html_url"),
+    }
+
+
+def _pr_from_rest(pr: dict[str, Any]) -> dict[str, Any]:
+    # Same fields `gh pr list --json` returns; gh reports merged PRs with state MERGED.
+    merged_at = pr.get("merged_at")
+    return {
+        "number": pr.get("number"),
+        "url": pr.get("html_url"),
+        "state": "MERGED" if merged_at else str(pr.get("state", "")).upper(),
+        "mergedAt": merged_at,
+        "headRefName": (pr.get("head") or {}).get("ref"),
+        "baseRefName": (pr.get("base") or {}).get("ref"),
+    }
+
+
+class _GitHubClient:
+    """Token-authenticated GitHub REST client that reuses one keep-alive HTTPS connection."""
+
+    def __init__(self, token: str) -> None:
+        self._headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "apollo-quick-start-release-flow",
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        self._connection: Optional[http.client.HTTPSConnection] = None
+
+    def request_json(self, method: str, path: str, payload: Optional[dict[str, Any]] = None) -> Any:
+        _, _, data = self.request(method, path, payload)
+        return _json_loads(data) if data else None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request_headers = {**self._headers, **(headers or {})}
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            if self._connection is None:
+                self._connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=GITHUB_API_TIMEOUT_SECONDS)
+            try:
+                self._connection.request(method, f"/{path.lstrip('/')}", body=body, headers=request_headers)
+                response = self._connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self._connection.close()
+                self._connection = None
+                if method not in IDEMPOTENT_HTTP_METHODS:
+                    # The server may already have accepted the request (e.g. a workflow dispatch), so a
+                    # retry could repeat it; surface the failure and let the user check Actions first.
+                    raise ReleaseFlowError(
+                        f"GitHub API {method} {path} failed: {exc}. The request may have been applied; "
+                        "check the repository's Actions runs before re-running."
+                    ) from exc
+                # The server may close an idle keep-alive connection; retry reads once on a fresh one.
+                if attempt:
+                    raise ReleaseFlowError(f"GitHub API {method} {path} failed: {exc}") from exc
+                continue
+            if response.status >= 400:
+                raise ReleaseFlowError(f"GitHub API {method} {path} returned HTTP {response.status}: {data[:200]!r}")
+            return response.status, {name.lower(): value for name, value in response.getheaders()}, data
+        raise AssertionError("unreachable")
+
+
 class ReleaseFlow:
     def __init__(self, args: argparse.Namespace) -> None:
         self.args = args
         self.repo_root = Path.cwd().resolve()
         self.state_path = (self.repo_root / args.state_file).resolve()
+        # How `git status --short` spells the state file; computed once, not per status line.
+        try:
+            self._state_rel_path = self.state_path.relative_to(self.repo_root).as_posix()
+        except ValueError:
+            self._state_rel_path = os.path.relpath(self.state_path, self.repo_root).replace("\\", "/")
+        self._state_batch_depth = 0
+        self._state_dirty = False
+        self._saved_state_content: Optional[str] = None
+        self._github: Optional[_GitHubClient] = None
+        self._github_resolved = False
+        self._workflow_runs_cache: dict[str, tuple[str, list[dict[str, Any]]]] = {}
         self.state = self._load_state()
         self._validate_inputs()
 
@@ -125,23 +273,49 @@ class ReleaseFlow:
         self._save_state()
 
     def _load_state(self) -> dict[str, Any]:
-        if self.state_path.exists():
-            try:
-                return json.loads(self.state_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError as exc:
-                raise ReleaseFlowError(
-                    f"State file {self.state_path} is corrupted. "
-                    "Delete it to restart, or fix the JSON manually."
-                ) from exc
-        return {
-            "release_version": None,
-            "docker_tag": None,
-            "timestamps": {},
-            "steps": {},
-        }
+        try:
+            content = self.state_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return {
+                "release_version": None,
+                "docker_tag": None,
+                "timestamps": {},
+                "steps": {},
+            }
+        try:
+            state = json.loads(content)
+        except json.JSONDecodeError as exc:
+            raise ReleaseFlowError(
+                f"State file {self.state_path} is corrupted. "
+                "Delete it to restart, or fix the JSON manually."
+            ) from exc
+        self._saved_state_content = content
+        return state
+
+    @contextmanager
+    def _state_batch(self) -> Iterator[None]:
+        # Saves inside the batch only mark the state dirty; one fsync'd write happens on exit, including
+        # when the step raises (e.g. CheckpointPending), so nothing recorded before the error is lost.
+        self._state_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._state_batch_depth -= 1
+            if self._state_batch_depth == 0 and self._state_dirty:
+                self._write_state()
 
     def _save_state(self) -> None:
+        if self._state_batch_depth:
+            self._state_dirty = True
+            return
+        self._write_state()
+
+    def _write_state(self) -> None:
+        self._state_dirty = False
         content = json.dumps(self.state, indent=2, ensure_ascii=True, sort_keys=True) + "\n"
+        # Resumed runs re-record values that are already on disk; skip the fsync'd rewrite for those.
+        if content == self._saved_state_content:
+            return
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
 
         with tempfile.NamedTemporaryFile(
@@ -154,19 +328,24 @@ class ReleaseFlow:
         ) as temp_file:
             temp_file.write(content)
             temp_file.flush()
-            os.fsync(temp_file.fileno())
+            # A fresh file has no metadata worth syncing beyond its size, which fdatasync covers too.
+            _fdatasync(temp_file.fileno())
             temp_path = Path(temp_file.name)
 
         temp_path.replace(self.state_path)
-
-    def _mark_timestamp(self, key: str) -> None:
-        self.state.setdefault("timestamps", {})[key] = datetime.now(timezone.utc).isoformat()
-        self._save_state()
+        _fsync_directory(self.state_path.parent)
+        self._saved_state_content = content
 
     def _step_done(self, key: str) -> bool:
         return bool(self.state.setdefault("steps", {}).get(key))
 
-    def _mark_step_done(self, key: str, metadata: Optional[dict[str, Any]] = None) -> None:
+    def _mark_step_done(
+        self,
+        key: str,
+        metadata: Optional[dict[str, Any]] = None,
+        *,
+        timestamp_key: Optional[str] = None,
+    ) -> None:
         self.state.setdefault("steps", {})[key] = True
         if metadata:
             conflicts = STATE_RESERVED_KEYS.intersection(metadata.keys())
@@ -175,6 +354,8 @@ class ReleaseFlow:
                     "Step metadata contains reserved keys: " + ", ".join(sorted(conflicts))
                 )
             self.state.update(metadata)
+        if timestamp_key:
+            self.state.setdefault("timestamps", {})[timestamp_key] = datetime.now(timezone.utc).isoformat()
         self._save_state()
 
     def _run_command(
@@ -184,30 +365,31 @@ class ReleaseFlow:
         mutate: bool = False,
         check: bool = True,
         timeout_seconds: Optional[int] = None,
+        text: bool = True,
     ) -> CommandResult:
         if self.args.dry_run and mutate:
-            print(f"[dry-run] {' '.join(cmd)}")
-            return CommandResult(stdout="", stderr="", returncode=0)
+            print(f"[dry-run] {shlex.join(cmd)}")
+            empty = "" if text else b""
+            return CommandResult(stdout=empty, stderr=empty, returncode=0)
         try:
             completed = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
+                text=text,
                 timeout=timeout_seconds,
             )
         except subprocess.TimeoutExpired as exc:
-            stdout_text = exc.stdout if isinstance(exc.stdout, str) else ""
-            stderr_text = exc.stderr if isinstance(exc.stderr, str) else ""
+            # subprocess.run leaves partial output as bytes here even with text=True.
             raise ReleaseFlowError(
-                f"Command timed out after {timeout_seconds} seconds: {' '.join(cmd)}\n"
-                f"stdout:\n{stdout_text}\n"
-                f"stderr:\n{stderr_text}"
+                f"Command timed out after {timeout_seconds} seconds: {shlex.join(cmd)}\n"
+                f"stdout:\n{_output_text(exc.stdout)}\n"
+                f"stderr:\n{_output_text(exc.stderr)}"
             ) from exc
         if check and completed.returncode != 0:
             raise ReleaseFlowError(
-                f"Command failed ({completed.returncode}): {' '.join(cmd)}\n"
-                f"stdout:\n{completed.stdout}\n"
-                f"stderr:\n{completed.stderr}"
+                f"Command failed ({completed.returncode}): {shlex.join(cmd)}\n"
+                f"stdout:\n{_output_text(completed.stdout)}\n"
+                f"stderr:\n{_output_text(completed.stderr)}"
             )
         return CommandResult(
             stdout=completed.stdout,
@@ -215,6 +397,60 @@ class ReleaseFlow:
             returncode=completed.returncode,
         )
 
+    def _github_client(self) -> Optional[_GitHubClient]:
+        # Polling through gh forks a process and redoes the TLS handshake every call; with
+        # --use-github-api the flow talks to the REST API over one kept-alive connection instead.
+        if not self._github_resolved:
+            self._github_resolved = True
+            if not self.args.use_github_api:
+                return None
+            token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+            if not token and _which("gh"):
+                token = self._run_command(["gh", "auth", "token"], check=False).stdout.strip()
+            if not token:
+                raise ReleaseFlowError("--use-github-api needs GH_TOKEN, GITHUB_TOKEN or a `gh auth login` session")
+            self._github = _GitHubClient(token)
+        return self._github
+
+    def _dispatch_workflow(self, workflow: str, inputs: dict[str, str]) -> None:
+        client = self._github_client()
+        if client is None or self.args.dry_run:
+            cmd = ["gh", "workflow", "run", workflow, "--repo", UPSTREAM_REPO, "--ref", "master"]
+            for key, value in inputs.items():
+                cmd.extend(["-f", f"{key}={value}"])
+            self._run_command(cmd, mutate=True, check=True)
+            return
+        client.request_json(
+            "POST",
+            f"repos/{UPSTREAM_REPO}/actions/workflows/{workflow}/dispatches",
+            {"ref": "master", "inputs": inputs},
+        )
+
+    def _watch_run(self, run_id: int) -> None:
+        client = self._github_client()
+        if client is None:
+            self._run_command(
+                ["gh", "run", "watch", str(run_id), "--repo", UPSTREAM_REPO, "--exit-status"],
+                check=True,
+                timeout_seconds=self.args.watch_timeout_seconds,
+            )
+            return
+        deadline = time.monotonic() + self.args.watch_timeout_seconds
+        while True:
+            run = client.request_json("GET", f"repos/{UPSTREAM_REPO}/actions/runs/{run_id}")
+            if run.get("status") == "completed":
+                # Mirrors `gh run watch --exit-status`: anything but success fails the step.
+                if run.get("conclusion") != "success":
+                    raise ReleaseFlowError(
+                        f"Workflow run {run_id} finished with conclusion {run.get('conclusion')}: {run.get('html_url')}"
+                    )
+                return
+            if time.monotonic() >= deadline:
+                raise ReleaseFlowError(
+                    f"Workflow run {run_id} did not finish within {self.args.watch_timeout_seconds} seconds"
+                )
+            time.sleep(self.args.poll_interval_seconds)
+
     def _checkpoint(self, name: str, message: str) -> None:
         if name not in CHECKPOINTS:
             raise ReleaseFlowError(f"Unknown checkpoint: {name}")
@@ -241,10 +477,14 @@ class ReleaseFlow:
         )
 
     def run(self) -> None:
-        self._preflight()
-        self._trigger_sync_workflow()
-        self._ensure_sync_pr_ready()
-        self._trigger_docker_workflow()
+        for step in (
+            self._preflight,
+            self._trigger_sync_workflow,
+            self._ensure_sync_pr_ready,
+            self._trigger_docker_workflow,
+        ):
+            with self._state_batch():
+                step()
         self._print_final_report()
 
     def _preflight(self) -> None:
@@ -252,7 +492,7 @@ class ReleaseFlow:
             return
 
         required_tools = ["gh", "git", "python3"]
-        missing = [tool for tool in required_tools if shutil.which(tool) is None]
+        missing = [tool for tool in required_tools if _which(tool) is None]
         if missing:
             raise ReleaseFlowError(f"Missing required tools: {', '.join(missing)}")
 
@@ -266,10 +506,25 @@ class ReleaseFlow:
         if not (self.repo_root / "sql/apolloconfigdb.sql").exists():
             raise ReleaseFlowError("Current directory does not contain sql/apolloconfigdb.sql")
 
-        if not self.args.skip_auth_check:
-            auth_status = self._run_command(["gh", "auth", "status", "-h", "github.com"], check=True)
+        # The gh/git probes are independent, so they run concurrently; results are still checked in
+        # the original order so the first reported problem does not depend on timing.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            auth_future = (
+                None
+                if self.args.skip_auth_check
+                else executor.submit(self._run_command, ["gh", "auth", "status", "-h", "github.com"], check=True)
+            )
+            dirty_future = (
+                None
+                if self.args.allow_dirty
+                else executor.submit(self._run_command, ["git", "status", "--short"], check=True)
+            )
+            remotes_future = executor.submit(self._list_remotes)
+
+        if auth_future is not None:
+            auth_status = auth_future.result()
             auth_output = auth_status.stdout.strip() or auth_status.stderr
-            scopes_match = re.search(r"Token scopes:\s*(.+)", auth_output)
+            scopes_match = TOKEN_SCOPES_RE.search(auth_output)
             if scopes_match:
                 scopes_text = scopes_match.group(1).strip()
                 scopes = {
@@ -281,7 +536,7 @@ class ReleaseFlow:
                 scopes_text = auth_output
                 scopes = {
                     token.strip()
-                    for token in re.split(r"[\s,]+", scopes_text)
+                    for token in SCOPE_SEPARATOR_RE.split(scopes_text)
                     if token.strip()
                 }
             for required_scope in ["repo", "workflow"]:
@@ -290,8 +545,8 @@ class ReleaseFlow:
                         f"gh auth token is missing '{required_scope}' scope; scopes={sorted(scopes)}"
                     )
 
-        if not self.args.allow_dirty:
-            dirty = self._run_command(["git", "status", "--short"], check=True)
+        if dirty_future is not None:
+            dirty = dirty_future.result()
             dirty_lines = [
                 line
                 for line in dirty.stdout.splitlines()
@@ -304,14 +559,17 @@ class ReleaseFlow:
                     + "\n".join(dirty_lines)
                 )
 
-        remotes = self._list_remotes()
+        remotes = remotes_future.result()
         upstream_candidates = [name for name, slug in remotes.items() if slug == UPSTREAM_REPO]
         if not upstream_candidates:
             raise ReleaseFlowError("No git remote points to github.com/apolloconfig/apollo-quick-start")
 
-        upstream_remote = sorted(upstream_candidates)[0]
-        self._mark_step_done("preflight", {"upstream_remote": upstream_remote})
-        self._mark_timestamp("preflight_completed_at")
+        upstream_remote = min(upstream_candidates)
+        self._mark_step_done(
+            "preflight",
+            {"upstream_remote": upstream_remote},
+            timestamp_key="preflight_completed_at",
+        )
 
     def _is_ignored_state_path(self, status_line: str) -> bool:
         if len(status_line) < 4:
@@ -319,11 +577,7 @@ class ReleaseFlow:
         path_text = status_line[3:].strip()
         if " -> " in path_text:
             path_text = path_text.split(" -> ", 1)[1].strip()
-        try:
-            state_rel = self.state_path.relative_to(self.repo_root).as_posix()
-        except ValueError:
-            state_rel = os.path.relpath(self.state_path, self.repo_root).replace("\\", "/")
-        return path_text == state_rel
+        return path_text == self._state_rel_path
 
     def _list_remotes(self) -> dict[str, str]:
         output = self._run_command(["git", "remote", "-v"], check=True)
@@ -340,16 +594,17 @@ class ReleaseFlow:
 
     @staticmethod
     def _normalize_github_slug(url: str) -> Optional[str]:
-        patterns = [
-            r"^https?://github\.com/([^/]+/[^/]+?)(?:\.git)?$",
-            r"^git@github\.com:([^/]+/[^/]+?)(?:\.git)?$",
-            r"^ssh://git@github\.com/([^/]+/[^/]+?)(?:\.git)?$",
-        ]
-        for pattern in patterns:
-            match = re.match(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        prefix = next((prefix for prefix in GITHUB_REMOTE_PREFIXES if url.startswith(prefix)), None)
+        if prefix is None:
+            return None
+        slug = url[len(prefix):]
+        # A trailing ".git" is dropped unless it is the whole repository name.
+        if slug.endswith(".git") and not slug[:-4].endswith("/"):
+            slug = slug[:-4]
+        owner, _, name = slug.partition("/")
+        if not owner or not name or "/" in name:
+            return None
+        return slug
 
     def _trigger_sync_workflow(self) -> None:
         if self._step_done("sync_workflow_completed"):
@@ -376,38 +631,11 @@ class ReleaseFlow:
             return
 
         started_at = datetime.now(timezone.utc)
-        self._run_command(
-            [
-                "gh",
-                "workflow",
-                "run",
-                SYNC_WORKFLOW,
-                "--repo",
-                UPSTREAM_REPO,
-                "--ref",
-                "master",
-                "-f",
-                f"release_version={self.args.release_version}",
-            ],
-            mutate=True,
-            check=True,
-        )
+        self._dispatch_workflow(SYNC_WORKFLOW, {"release_version": self.args.release_version})
 
         run = self._wait_for_new_run(SYNC_WORKFLOW, started_at)
         run_id = int(run["databaseId"])
-        self._run_command(
-            [
-                "gh",
-                "run",
-                "watch",
-                str(run_id),
-                "--repo",
-                UPSTREAM_REPO,
-                "--exit-status",
-            ],
-            check=True,
-            timeout_seconds=self.args.watch_timeout_seconds,
-        )
+        self._watch_run(run_id)
 
         self._mark_step_done(
             "sync_workflow_completed",
@@ -415,8 +643,8 @@ class ReleaseFlow:
                 "sync_workflow_run_id": run_id,
                 "sync_workflow_url": run.get("url"),
             },
+            timestamp_key="sync_workflow_completed_at",
         )
-        self._mark_timestamp("sync_workflow_completed_at")
         self._refresh_sync_pr_state()
 
     def _ensure_sync_pr_ready(self) -> None:
@@ -427,14 +655,12 @@ class ReleaseFlow:
             return
 
         if self.args.dry_run:
-            self._mark_step_done("sync_pr_ready_for_docker")
-            self._mark_timestamp("sync_pr_ready_for_docker_at")
+            self._mark_step_done("sync_pr_ready_for_docker", timestamp_key="sync_pr_ready_for_docker_at")
             return
 
         self._refresh_sync_pr_state()
         if self.state.get("sync_no_change"):
-            self._mark_step_done("sync_pr_ready_for_docker")
-            self._mark_timestamp("sync_pr_ready_for_docker_at")
+            self._mark_step_done("sync_pr_ready_for_docker", timestamp_key="sync_pr_ready_for_docker_at")
             return
 
         pr_number = self.state.get("sync_pr_number")
@@ -451,8 +677,7 @@ class ReleaseFlow:
                 "Please merge it first, then rerun this command."
             )
 
-        self._mark_step_done("sync_pr_ready_for_docker")
-        self._mark_timestamp("sync_pr_ready_for_docker_at")
+        self._mark_step_done("sync_pr_ready_for_docker", timestamp_key="sync_pr_ready_for_docker_at")
 
     def _refresh_sync_pr_state(self) -> None:
         branch = f"{SYNC_BRANCH_PREFIX}{self.args.release_version}"
@@ -466,7 +691,7 @@ class ReleaseFlow:
             self._save_state()
             return
 
-        picked = sorted(prs, key=lambda pr: int(pr.get("number", 0)), reverse=True)[0]
+        picked = max(prs, key=lambda pr: int(pr.get("number", 0)))
         self.state["sync_no_change"] = False
         self.state["sync_pr_number"] = picked.get("number")
         self.state["sync_pr_url"] = picked.get("url")
@@ -475,6 +700,31 @@ class ReleaseFlow:
         self._save_state()
 
     def _find_sync_prs(self, branch: str) -> list[dict[str, Any]]:
+        client = self._github_client()
+        if client is not None:
+            query = urllib.parse.urlencode(
+                {"head": f"{UPSTREAM_REPO.split('/')[0]}:{branch}", "state": "all", "per_page": 20}
+            )
+            path = f"repos/{UPSTREAM_REPO}/pulls?{query}"
+            # The ETag and PR list live in the state file, so a resumed run revalidates instead of
+            # refetching; the caller saves the state right after this lookup.
+            cache = self.state.setdefault("github_cache", {})
+            cached = cache.get("sync_pr_list")
+            if not cached or cached.get("path") != path:
+                cached = None
+            status, headers, data = client.request(
+                "GET",
+                path,
+                headers={"If-None-Match": cached["etag"]} if cached else None,
+            )
+            if status == 304 and cached:
+                return cached["prs"]
+            prs = [_pr_from_rest(pr) for pr in _json_loads(data)]
+            etag = headers.get("etag")
+            if etag:
+                cache["sync_pr_list"] = {"path": path, "etag": etag, "prs": prs}
+            return prs
+
         result = self._run_command(
             [
                 "gh",
@@ -492,14 +742,15 @@ class ReleaseFlow:
                 "number,url,state,mergedAt,headRefName,baseRefName",
             ],
             check=True,
+            text=False,
         )
         try:
-            payload = json.loads(result.stdout or "[]")
+            payload = _json_loads(result.stdout or b"[]")
         except json.JSONDecodeError as exc:
             raise ReleaseFlowError(
                 "Failed to parse JSON from `gh pr list`.\n"
-                f"stdout:\n{result.stdout}\n"
-                f"stderr:\n{result.stderr}"
+                f"stdout:\n{_output_text(result.stdout)}\n"
+                f"stderr:\n{_output_text(result.stderr)}"
             ) from exc
         if not isinstance(payload, list):
             raise ReleaseFlowError(f"Unexpected PR list payload: {payload}")
@@ -526,38 +777,11 @@ class ReleaseFlow:
 
         started_at = datetime.now(timezone.utc)
         docker_tag = self.state["docker_tag"]
-        self._run_command(
-            [
-                "gh",
-                "workflow",
-                "run",
-                DOCKER_WORKFLOW,
-                "--repo",
-                UPSTREAM_REPO,
-                "--ref",
-                "master",
-                "-f",
-                f"tag={docker_tag}",
-            ],
-            mutate=True,
-            check=True,
-        )
+        self._dispatch_workflow(DOCKER_WORKFLOW, {"tag": docker_tag})
 
         run = self._wait_for_new_run(DOCKER_WORKFLOW, started_at)
         run_id = int(run["databaseId"])
-        self._run_command(
-            [
-                "gh",
-                "run",
-                "watch",
-                str(run_id),
-                "--repo",
-                UPSTREAM_REPO,
-                "--exit-status",
-            ],
-            check=True,
-            timeout_seconds=self.args.watch_timeout_seconds,
-        )
+        self._watch_run(run_id)
 
         self._mark_step_done(
             "docker_workflow_completed",
@@ -565,48 +789,83 @@ class ReleaseFlow:
                 "docker_workflow_run_id": run_id,
                 "docker_workflow_url": run.get("url"),
             },
+            timestamp_key="docker_workflow_completed_at",
         )
-        self._mark_timestamp("docker_workflow_completed_at")
 
     def _wait_for_new_run(self, workflow: str, started_at: datetime) -> dict[str, Any]:
         timeout_at = datetime.now(timezone.utc) + timedelta(minutes=self.args.workflow_start_timeout_minutes)
+        attempt = 0
         while True:
-            result = self._run_command(
-                [
-                    "gh",
-                    "run",
-                    "list",
-                    "--repo",
-                    UPSTREAM_REPO,
-                    "--workflow",
-                    workflow,
-                    "--event",
-                    "workflow_dispatch",
-                    "--limit",
-                    "20",
-                    "--json",
-                    "databaseId,createdAt,status,url,conclusion,headBranch,event",
-                ],
-                check=True,
-                timeout_seconds=RUN_LIST_TIMEOUT_SECONDS,
-            )
-            try:
-                runs = json.loads(result.stdout or "[]")
-            except json.JSONDecodeError as exc:
-                raise ReleaseFlowError(
-                    f"Failed to parse JSON from `gh run list` for {workflow}.\n"
-                    f"stdout:\n{result.stdout}\n"
-                    f"stderr:\n{result.stderr}"
-                ) from exc
-            if not isinstance(runs, list):
-                raise ReleaseFlowError(f"Unexpected workflow runs payload for {workflow}: {runs}")
+            runs = self._list_workflow_runs(workflow, created_after=started_at - RUN_CREATED_SKEW)
             matched = select_workflow_run(runs, started_at)
             if matched:
                 return matched
 
             if datetime.now(timezone.utc) >= timeout_at:
                 raise ReleaseFlowError(f"Timed out waiting for workflow run for {workflow}")
-            time.sleep(self.args.poll_interval_seconds)
+            # A dispatched run usually shows up within seconds, so start polling fast and back off
+            # exponentially up to --poll-interval-seconds.
+            time.sleep(min(self.args.poll_interval_seconds, RUN_POLL_INITIAL_DELAY_SECONDS * 2**attempt))
+            attempt += 1
+
+    def _list_workflow_runs(
+        self,
+        workflow: str,
+        created_after: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        client = self._github_client()
+        if client is not None:
+            query = {"event": "workflow_dispatch", "per_page": 20}
+            if created_after is not None:
+                # Let the API drop older runs; the list is then empty until the dispatched run exists.
+                query["created"] = ">=" + created_after.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            path = f"repos/{UPSTREAM_REPO}/actions/workflows/{workflow}/runs?{urllib.parse.urlencode(query)}"
+            # Polls revalidate with the last ETag; an unchanged list comes back as a bodiless 304.
+            cached = self._workflow_runs_cache.get(path)
+            status, headers, data = client.request(
+                "GET",
+                path,
+                headers={"If-None-Match": cached[0]} if cached else None,
+            )
+            if status == 304 and cached:
+                return cached[1]
+            runs = [_run_from_rest(run) for run in _json_loads(data).get("workflow_runs", [])]
+            etag = headers.get("etag")
+            if etag:
+                self._workflow_runs_cache[path] = (etag, runs)
+            return runs
+
+        result = self._run_command(
+            [
+                "gh",
+                "run",
+                "list",
+                "--repo",
+                UPSTREAM_REPO,
+                "--workflow",
+                workflow,
+                "--event",
+                "workflow_dispatch",
+                "--limit",
+                "20",
+                "--json",
+                "databaseId,createdAt,url",
+            ],
+            check=True,
+            timeout_seconds=RUN_LIST_TIMEOUT_SECONDS,
+            text=False,
+        )
+        try:
+            runs = _json_loads(result.stdout or b"[]")
+        except json.JSONDecodeError as exc:
+            raise ReleaseFlowError(
+                f"Failed to parse JSON from `gh run list` for {workflow}.\n"
+                f"stdout:\n{_output_text(result.stdout)}\n"
+                f"stderr:\n{_output_text(result.stderr)}"
+            ) from exc
+        if not isinstance(runs, list):
+            raise ReleaseFlowError(f"Unexpected workflow runs payload for {workflow}: {runs}")
+        return runs
 
     def _print_final_report(self) -> None:
         report = {
@@ -639,6 +898,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     run.add_argument("--dry-run", action="store_true")
     run.add_argument("--allow-dirty", action="store_true")
     run.add_argument("--skip-auth-check", action="store_true")
+    run.add_argument(
+        "--use-github-api",
+        action="store_true",
+        help="Call the GitHub REST API over one reused connection instead of running gh per call",
+    )
     run.add_argument("--poll-interval-seconds", type=int, default=20)
     run.add_argument("--workflow-start-timeout-minutes", type=int, default=10)
     run.add_argument("--watch-timeout-seconds", type=int, default=7200)
@@ -82,6 +82,78 @@ class ReleaseFlowHelpersTest(unittest.TestCase):
             self.assertNotIn("pending_checkpoint", cleared)
             self.assertNotIn("pending_message", cleared)
 
+    def test_state_batch_writes_state_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            args = release_flow.parse_args(
+                [
+                    "run",
+                    "--release-version",
+                    "2.5.0",
+                    "--state-file",
+                    "state.json",
+                ]
+            )
+            with mock.patch("pathlib.Path.cwd", return_value=repo_root):
+                flow = ReleaseFlow(args)
+            with mock.patch.object(flow, "_write_state", wraps=flow._write_state) as write_state:
+                with self.assertRaises(release_flow.CheckpointPending), flow._state_batch():
+                    flow._mark_step_done("preflight", {"upstream_remote": "upstream"}, timestamp_key="preflight_at")
+                    flow._checkpoint("TRIGGER_SYNC_WORKFLOW", "trigger sync")
+
+            self.assertEqual(write_state.call_count, 1)
+            saved = json.loads((repo_root / "state.json").read_text(encoding="utf-8"))
+            self.assertTrue(saved["steps"]["preflight"])
+            self.assertIn("preflight_at", saved["timestamps"])
+            self.assertEqual(saved["pending_checkpoint"], "TRIGGER_SYNC_WORKFLOW")
+
+    def test_resume_skips_rewriting_unchanged_state(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            args = release_flow.parse_args(
+                [
+                    "run",
+                    "--release-version",
+                    "2.5.0",
+                    "--state-file",
+                    "state.json",
+                ]
+            )
+            with mock.patch("pathlib.Path.cwd", return_value=repo_root):
+                ReleaseFlow(args)
+                with mock.patch.object(
+                    release_flow.tempfile, "NamedTemporaryFile", side_effect=AssertionError("state rewritten")
+                ):
+                    resumed = ReleaseFlow(args)
+                    resumed._save_state()
+
+            self.assertEqual(resumed.state["docker_tag"], "2.5.0")
+
+    def test_preflight_runs_probes_and_records_upstream_remote(self) -> None:
+        outputs = {
+            ("gh", "auth", "status", "-h", "github.com"): "  - Token scopes: 'read:org', 'repo', 'workflow'\n",
+            ("git", "status", "--short"): "?? state.json\n",
+            ("git", "remote", "-v"): "upstream\thttps://github.com/apolloconfig/apollo-quick-start.git (fetch)\n",
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp) / "apollo-quick-start"
+            (repo_root / ".github/workflows").mkdir(parents=True)
+            (repo_root / ".github/workflows/docker-publish.yml").write_text("", encoding="utf-8")
+            (repo_root / "sql").mkdir()
+            (repo_root / "sql/apolloconfigdb.sql").write_text("", encoding="utf-8")
+            args = release_flow.parse_args(["run", "--release-version", "2.5.0", "--state-file", "state.json"])
+            with mock.patch("pathlib.Path.cwd", return_value=repo_root):
+                flow = ReleaseFlow(args)
+            with mock.patch.object(release_flow, "_which", return_value="/usr/bin/tool"), mock.patch.object(
+                flow,
+                "_run_command",
+                side_effect=lambda cmd, **_: release_flow.CommandResult(outputs[tuple(cmd)], "", 0),
+            ):
+                flow._preflight()
+
+        self.assertEqual(flow.state["upstream_remote"], "upstream")
+        self.assertTrue(flow.state["steps"]["preflight"])
+
     def test_select_workflow_run(self) -> None:
         started_at = datetime(2026, 2, 21, 8, 0, 0, tzinfo=timezone.utc)
         runs = [
@@ -174,6 +246,162 @@ class ReleaseFlowHelpersTest(unittest.TestCase):
         self.assertIn("pending_checkpoint", release_flow.STATE_RESERVED_KEYS)
         self.assertIn("pending_message", release_flow.STATE_RESERVED_KEYS)
 
+    def test_github_api_payloads_match_gh_json_fields(self) -> None:
+        prs_body = [
+            {
+                "number": 12,
+                "html_url": "https://github.com/apolloconfig/apollo-quick-start/pull/12",
+                "state": "closed",
+                "merged_at": "2026-02-21T09:01:02Z",
+                "head": {"ref": "codex/quick-start-sync-2.5.0"},
+                "base": {"ref": "master"},
+            }
+        ]
+        runs_body = {"workflow_runs": [{"id": 7, "created_at": "2026-02-21T08:00:05Z", "html_url": "https://example.com/runs/7"}]}
+        client = mock.Mock()
+        client.request.side_effect = [
+            (200, {"etag": '"prs-v1"'}, json.dumps(prs_body).encode("utf-8")),
+            (200, {"etag": '"runs-v1"'}, json.dumps(runs_body).encode("utf-8")),
+            (304, {}, b""),
+        ]
+        resumed_client = mock.Mock()
+        resumed_client.request.return_value = (304, {}, b"")
+        with tempfile.TemporaryDirectory() as tmp:
+            args = release_flow.parse_args(
+                [
+                    "run",
+                    "--release-version",
+                    "2.5.0",
+                    "--state-file",
+                    "state.json",
+                ]
+            )
+            with mock.patch("pathlib.Path.cwd", return_value=Path(tmp)):
+                flow = ReleaseFlow(args)
+                with mock.patch.object(flow, "_github_client", return_value=client):
+                    prs = flow._find_sync_prs(branch="codex/quick-start-sync-2.5.0")
+                    created_after = datetime(2026, 2, 21, 7, 59, 55, tzinfo=timezone.utc)
+                    runs = flow._list_workflow_runs(release_flow.SYNC_WORKFLOW, created_after=created_after)
+                    self.assertEqual(flow._list_workflow_runs(release_flow.SYNC_WORKFLOW, created_after=created_after), runs)
+                flow._save_state()
+
+                # A resumed run revalidates the PR list with the ETag persisted in the state file.
+                resumed = ReleaseFlow(args)
+                with mock.patch.object(resumed, "_github_client", return_value=resumed_client):
+                    self.assertEqual(resumed._find_sync_prs(branch="codex/quick-start-sync-2.5.0"), prs)
+
+        self.assertIn("head=apolloconfig%3Acodex%2Fquick-start-sync-2.5.0", client.request.call_args_list[0].args[1])
+        self.assertIn("created=%3E%3D2026-02-21T07%3A59%3A55Z", client.request.call_args_list[1].args[1])
+        self.assertEqual(client.request.call_args_list[2].kwargs["headers"], {"If-None-Match": '"runs-v1"'})
+        self.assertEqual(resumed_client.request.call_args.kwargs["headers"], {"If-None-Match": '"prs-v1"'})
+
+        self.assertEqual(prs[0]["state"], "MERGED")
+        self.assertTrue(release_flow.is_pr_merged(prs[0]))
+        self.assertEqual(prs[0]["url"], "https://github.com/apolloconfig/apollo-quick-start/pull/12")
+        self.assertEqual(runs[0]["databaseId"], 7)
+        self.assertEqual(runs[0]["createdAt"], "2026-02-21T08:00:05Z")
+
+    def test_github_api_is_opt_in(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            args = release_flow.parse_args(["run", "--release-version", "2.5.0", "--state-file", "state.json"])
+            with mock.patch("pathlib.Path.cwd", return_value=Path(tmp)):
+                flow = ReleaseFlow(args)
+        with mock.patch.dict(release_flow.os.environ, {"GH_TOKEN": "token"}), mock.patch.object(
+            flow, "_run_command", side_effect=AssertionError("gh called")
+        ):
+            self.assertIsNone(flow._github_client())
+
+    def test_dispatch_and_watch_through_github_api(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            args = release_flow.parse_args(
+                [
+                    "run",
+                    "--release-version",
+                    "2.5.0",
+                    "--state-file",
+                    "state.json",
+                    "--use-github-api",
+                    "--poll-interval-seconds",
+                    "1",
+                ]
+            )
+            with mock.patch("pathlib.Path.cwd", return_value=Path(tmp)):
+                flow = ReleaseFlow(args)
+        client = mock.Mock()
+        client.request_json.side_effect = [
+            None,
+            {"status": "in_progress"},
+            {"status": "completed", "conclusion": "success"},
+            {"status": "completed", "conclusion": "failure", "html_url": "https://example.com/runs/9"},
+        ]
+        with mock.patch.object(flow, "_github_client", return_value=client), mock.patch.object(
+            flow, "_run_command", side_effect=AssertionError("gh called")
+        ), mock.patch.object(release_flow.time, "sleep") as sleep:
+            flow._dispatch_workflow(release_flow.DOCKER_WORKFLOW, {"tag": "2.5.0"})
+            flow._watch_run(8)
+            with self.assertRaisesRegex(release_flow.ReleaseFlowError, "conclusion failure"):
+                flow._watch_run(9)
+
+        self.assertEqual(
+            client.request_json.call_args_list[0].args,
+            (
+                "POST",
+                f"repos/{release_flow.UPSTREAM_REPO}/actions/workflows/{release_flow.DOCKER_WORKFLOW}/dispatches",
+                {"ref": "master", "inputs": {"tag": "2.5.0"}},
+            ),
+        )
+        self.assertEqual(client.request_json.call_args_list[1].args, ("GET", f"repos/{release_flow.UPSTREAM_REPO}/actions/runs/8"))
+        sleep.assert_called_once_with(1)
+
+    def test_github_client_retries_reads_but_not_posts(self) -> None:
+        client = release_flow._GitHubClient("token")
+        connection = mock.Mock()
+        connection.getresponse.side_effect = [
+            release_flow.http.client.RemoteDisconnected("closed"),
+            mock.Mock(status=200, read=mock.Mock(return_value=b"{}"), getheaders=mock.Mock(return_value=[])),
+            release_flow.http.client.RemoteDisconnected("closed"),
+        ]
+        with mock.patch.object(release_flow.http.client, "HTTPSConnection", return_value=connection):
+            self.assertEqual(client.request_json("GET", "repos/a/b/actions/runs/1"), {})
+            with self.assertRaisesRegex(release_flow.ReleaseFlowError, "may have been applied"):
+                client.request_json("POST", "repos/a/b/actions/workflows/w.yml/dispatches", {"ref": "master"})
+
+        self.assertEqual(connection.request.call_count, 3)
+
+    def test_run_command_binary_output_and_decoded_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            args = release_flow.parse_args(["run", "--release-version", "2.5.0", "--state-file", "state.json"])
+            with mock.patch("pathlib.Path.cwd", return_value=Path(tmp)):
+                flow = ReleaseFlow(args)
+        result = flow._run_command([sys.executable, "-c", "print('[]')"], text=False)
+        self.assertEqual(json.loads(result.stdout), [])
+        with self.assertRaisesRegex(release_flow.ReleaseFlowError, "stderr:\n\u00e9") as raised:
+            flow._run_command(
+                [sys.executable, "-c", "import sys; sys.stderr.buffer.write(b'\\xc3\\xa9'); sys.exit(3)"],
+                text=False,
+            )
+        # The failing command is shown shell-quoted, so it can be copied and re-run as is.
+        self.assertIn("-c 'import sys;", str(raised.exception))
+
+    def test_wait_for_new_run_backs_off_exponentially(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            args = release_flow.parse_args(
+                ["run", "--release-version", "2.5.0", "--state-file", "state.json", "--poll-interval-seconds", "3"]
+            )
+            with mock.patch("pathlib.Path.cwd", return_value=Path(tmp)):
+                flow = ReleaseFlow(args)
+        run = {"databaseId": 5, "createdAt": "2026-02-21T08:00:05Z"}
+        with mock.patch.object(flow, "_list_workflow_runs", side_effect=[[], [], [], [run]]), mock.patch.object(
+            release_flow.time, "sleep"
+        ) as sleep:
+            matched = flow._wait_for_new_run(
+                workflow=release_flow.SYNC_WORKFLOW,
+                started_at=datetime(2026, 2, 21, 8, 0, 0, tzinfo=timezone.utc),
+            )
+
+        self.assertEqual(matched, run)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [1, 2, 3])
+
     def test_find_sync_prs_invalid_json_raises_release_flow_error(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             repo_root = Path(tmp)
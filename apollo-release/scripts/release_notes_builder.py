@@ -4,24 +4,35 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
+import os
 import re
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChangeEntry:
     raw_text: str
     summary: str
     pr_url: Optional[str]
     pr_number: Optional[int]
 
+    @property
+    def display_summary(self) -> str:
+        summary = _sanitize_text_line(self.summary or "")
+        return summary or _sanitize_text_line(self.raw_text) or "Release update"
 
-@dataclass
+
+@dataclass(slots=True)
 class HighlightItem:
     title: str
     body: str
@@ -100,6 +111,14 @@ BOT_LOGIN_HINTS = [
     "renovate",
 ]
 
+PR_FETCH_WORKERS = 8
+PR_METADATA_BATCH_SIZE = 50
+PR_METADATA_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "apollo-release-notes" / "pr-meta.json"
+)
+PR_METADATA_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+_PR_METADATA_CACHE_LOCK = threading.Lock()
+
 AUTO_SUMMARY_HINTS = [
     "summary by coderabbit",
     "walkthrough",
@@ -110,19 +129,161 @@ AUTO_SUMMARY_HINTS = [
     "poem",
 ]
 
+LIST_MARKER_PREFIX_RE = re.compile(r"^(?:[-*+]\s+)?(?:\d+[.)]\s+)?")
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+MARKDOWN_URL_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^)]+)\)")
+WHITESPACE_RE = re.compile(r"\s+")
+SENTENCE_BREAK_RE = re.compile(r"(?<=[,\.\!\?;:\u3002\uff0c\uff1b])\s+")
+AUTO_GENERATED_COMMENT_RE = re.compile(
+    r"<!--\s*This is an auto-generated comment:[\s\S]*?end of auto-generated comment:[\s\S]*?-->",
+    re.IGNORECASE,
+)
+HTML_COMMENT_RE = re.compile(r"<!--[\s\S]*?-->")
+CODE_BLOCK_RE = re.compile(r"```[A-Za-z0-9_-]*\s*\n([\s\S]*?)```")
+ENDPOINT_PATTERN = r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[A-Za-z0-9._~!$&'()*+,;=:@%/\-{}]+)"
+ENDPOINT_RE = re.compile(ENDPOINT_PATTERN)
+ENDPOINT_ANY_CASE_RE = re.compile(ENDPOINT_PATTERN, re.IGNORECASE)
+CLIENT_CALL_RE = re.compile(r"\bclient\.([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+CLIENT_CALL_NO_ARGS_RE = re.compile(r"client\.([A-Za-z_][A-Za-z0-9_]*)\(\)")
+CURL_COMMAND_RE = re.compile(r"(curl\s+[^\n`]+?)(?:\s+and you can|\s+to\s+|\s*$)", re.IGNORECASE)
+TASK_LIST_RE = re.compile(r"^- \[[ xX]\]")
+USER_ATTACHMENT_URL_RE = re.compile(r"https?://github\.com/user-attachments/")
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$")
+HTTP_VERB_WORD_RE = re.compile(r"\b(get|post|put|delete)\b")
+ASSIGNMENT_CALL_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\s*=\s*[A-Za-z_][A-Za-z0-9_\.]*\(")
+# Boilerplate lead-ins and trailers stripped from usage hints, applied in order.
+USAGE_HINT_BOILERPLATE_RES = (
+    re.compile(r"^in some application scenarios,?\s*", re.IGNORECASE),
+    re.compile(r"^after updating the project,?\s*", re.IGNORECASE),
+    re.compile(r"^after starting the service and making some requests to pull configurations,?\s*", re.IGNORECASE),
+    re.compile(r"like this way[:\uff1a]?\s*$", re.IGNORECASE),
+    re.compile(r"\s*See details at https?://\S+\s*$", re.IGNORECASE),
+    re.compile(r"\s*See details:?\s*https?://\S+\s*$", re.IGNORECASE),
+)
+SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+PR_NUMBER_SEPARATOR_RE = re.compile(r"[,\s]+")
+DIGITS_RE = re.compile(r"\d+")
+CHANGES_SEPARATOR_RE = re.compile(r"^-{3,}\s*$")
+# How many lines after a release's closing separator may hold its milestone link.
+MILESTONE_TAIL_LINES = 11
+URL_RE = re.compile(r"(https?://\S+)")
+PULL_NUMBER_RE = re.compile(r"/pull/(\d+)")
+CONVENTIONAL_PREFIX_RE = re.compile(
+    r"^(feat|fix|perf|refactor|docs|test|chore|build|ci|feature|bugfix|security|optimize)(\([^)]+\))?:\s*",
+    re.IGNORECASE,
+)
+BRACKET_PREFIX_RE = re.compile(r"^\[[^\]]+\]\s*")
+STAR_BULLET_PREFIXES = ("* ", "*\t")
+FULL_CHANGELOG_MARKER = "**Full Changelog**:"
+# Applied by gh before printing, so Python only decodes the fields format_change_lines uses.
+PR_METADATA_JQ_FILTER = "{title, author_login: .author.login}"
+
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+GITHUB_API_TIMEOUT_SECONDS = 30
+
 
 def run_json_command(cmd: list[str]) -> object:
+    return json.loads(run_text_command(cmd))
+
+
+def run_text_command(cmd: list[str]) -> str:
     completed = subprocess.run(cmd, check=True, capture_output=True, text=True)
-    return json.loads(completed.stdout)
+    return completed.stdout
+
+
+class GitHubApiError(RuntimeError):
+    pass
+
+
+class _GitHubClient:
+    """Token-authenticated GitHub API client that keeps one HTTPS connection alive per thread."""
+
+    def __init__(self, token: str) -> None:
+        self._headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "apollo-release-notes-builder",
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        self._local = threading.local()
+
+    def request_json(self, method: str, path: str, payload: Optional[dict] = None) -> object:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {**self._headers, "Content-Type": "application/json"} if body is not None else self._headers
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, f"/{path.lstrip('/')}", body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                # The server may close an idle keep-alive connection; retry once on a fresh one.
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise GitHubApiError(f"{method} {path} failed: {exc}") from exc
+                continue
+            if response.status >= 400:
+                raise GitHubApiError(f"{method} {path} returned HTTP {response.status}: {data[:200]!r}")
+            return json.loads(data)
+        raise AssertionError("unreachable")
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=GITHUB_API_TIMEOUT_SECONDS)
+            self._local.connection = connection
+        return connection
+
+
+# Set by --use-github-api. gh stays the default so GH_HOST and the user's gh configuration apply.
+_GITHUB_CLIENT: Optional[_GitHubClient] = None
+
+
+def enable_github_api() -> None:
+    """Send GitHub calls over one kept-alive REST connection instead of running gh per call."""
+    global _GITHUB_CLIENT
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token:
+        try:
+            token = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=False).stdout.strip()
+        except OSError:
+            token = ""
+    if not token:
+        raise GitHubApiError("--use-github-api needs GH_TOKEN, GITHUB_TOKEN or a `gh auth login` session")
+    _GITHUB_CLIENT = _GitHubClient(token)
+
+
+def _github_client() -> Optional[_GitHubClient]:
+    return _GITHUB_CLIENT
+
+
+def gh_api_json(path: str, fields: Optional[dict[str, str]] = None, method: Optional[str] = None) -> object:
+    """Call a GitHub API path through `gh api`, or directly once --use-github-api is enabled."""
+    client = _github_client()
+    if client is None:
+        cmd = ["gh", "api"]
+        if method:
+            cmd.extend(["-X", method])
+        cmd.append(path)
+        for key, value in (fields or {}).items():
+            cmd.extend(["-f", f"{key}={value}"])
+        return run_json_command(cmd)
+
+    # Like `gh api`, sending fields implies POST, and graphql fields other than the query are variables.
+    resolved_method = method or ("POST" if fields else "GET")
+    payload: Optional[dict] = dict(fields) if fields else None
+    if path == "graphql" and payload is not None:
+        payload = {"query": payload.pop("query", ""), "variables": payload}
+    return client.request_json(resolved_method, path, payload)
 
 
 def _sanitize_text_line(text: str) -> str:
-    cleaned = text.strip()
-    cleaned = re.sub(r"^[-*+]\s+", "", cleaned)
-    cleaned = re.sub(r"^\d+[.)]\s+", "", cleaned)
-    cleaned = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1", cleaned)
+    cleaned = LIST_MARKER_PREFIX_RE.sub("", text.strip(), count=1)
+    cleaned = MARKDOWN_LINK_RE.sub(r"\1", cleaned)
     cleaned = cleaned.replace("`", "")
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = WHITESPACE_RE.sub(" ", cleaned)
     return cleaned.strip()
 
 
@@ -144,7 +305,7 @@ def _shorten_usage_line(line: str, limit: int = 170) -> str:
     if you_can_idx >= 0:
         return _truncate_text(line[you_can_idx:].strip(), limit=limit)
 
-    segments = re.split(r"(?<=[,\.\!\?;:\u3002\uff0c\uff1b])\s+", line)
+    segments = SENTENCE_BREAK_RE.split(line)
     for segment in segments:
         candidate = segment.strip().rstrip(",\uFF0C")
         if 24 <= len(candidate) <= limit:
@@ -153,13 +314,8 @@ def _shorten_usage_line(line: str, limit: int = 170) -> str:
 
 
 def _strip_auto_generated_content(markdown_text: str) -> str:
-    text = re.sub(
-        r"<!--\s*This is an auto-generated comment:[\s\S]*?end of auto-generated comment:[\s\S]*?-->",
-        "",
-        markdown_text,
-        flags=re.IGNORECASE,
-    )
-    text = re.sub(r"<!--[\s\S]*?-->", "", text)
+    text = AUTO_GENERATED_COMMENT_RE.sub("", markdown_text)
+    text = HTML_COMMENT_RE.sub("", text)
     cleaned_lines: list[str] = []
     for raw_line in text.splitlines():
         lowered = raw_line.strip().lower()
@@ -184,7 +340,7 @@ def _is_bot_login(login: str) -> bool:
 
 def _extract_usage_lines_from_code_blocks(markdown_text: str) -> list[str]:
     lines: list[str] = []
-    for match in re.finditer(r"```[A-Za-z0-9_-]*\s*\n([\s\S]*?)```", markdown_text):
+    for match in CODE_BLOCK_RE.finditer(markdown_text):
         block = match.group(1)
         for raw_line in block.splitlines():
             line = raw_line.strip()
@@ -192,10 +348,10 @@ def _extract_usage_lines_from_code_blocks(markdown_text: str) -> list[str]:
                 continue
             if "curl " in line:
                 lines.append(line)
-            endpoint_match = re.search(r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[A-Za-z0-9._~!$&'()*+,;=:@%/\-{}]+)", line)
+            endpoint_match = ENDPOINT_RE.search(line)
             if endpoint_match:
                 lines.append(f"{endpoint_match.group(1)} {endpoint_match.group(2)}")
-            client_call_match = re.search(r"\bclient\.([A-Za-z_][A-Za-z0-9_]*)\s*\(", line)
+            client_call_match = CLIENT_CALL_RE.search(line)
             if client_call_match:
                 method = client_call_match.group(1)
                 lines.append(f"OpenAPI Java client can call client.{method}()")
@@ -227,7 +383,7 @@ def _split_candidate_lines(markdown_text: str) -> list[str]:
             continue
         if line.startswith("#"):
             continue
-        if re.match(r"^- \[[ xX]\]", line):
+        if TASK_LIST_RE.match(line):
             continue
         if line.startswith(">"):
             continue
@@ -235,7 +391,7 @@ def _split_candidate_lines(markdown_text: str) -> list[str]:
             continue
         if line.startswith("<"):
             continue
-        if re.search(r"https?://github\.com/user-attachments/", line):
+        if USER_ATTACHMENT_URL_RE.search(line):
             continue
         if len(line) < 24:
             continue
@@ -249,7 +405,7 @@ def _extract_usage_lines_from_sections(markdown_text: str) -> list[str]:
     collecting = False
     for raw_line in lines:
         stripped = raw_line.strip()
-        heading = re.match(r"^#{1,6}\s+(.+)$", stripped)
+        heading = HEADING_RE.match(stripped)
         if heading:
             heading_text = heading.group(1).strip().lower()
             matched = any(token in heading_text for token in USAGE_HEADING_HINTS)
@@ -282,7 +438,7 @@ def _score_usage_line(line: str) -> int:
             score -= 2
     if "http" in lowered or "/api" in lowered:
         score += 2
-    if re.search(r"\b(get|post|put|delete)\b", lowered):
+    if HTTP_VERB_WORD_RE.search(lowered):
         score += 1
     if len(line) > 200:
         score -= 1
@@ -300,7 +456,7 @@ def _score_usage_line(line: str) -> int:
         score -= 5
     if lowered.startswith("fixes #"):
         score -= 4
-    if re.search(r"[A-Za-z_][A-Za-z0-9_]*\s*=\s*[A-Za-z_][A-Za-z0-9_\.]*\(", line):
+    if ASSIGNMENT_CALL_RE.search(line):
         score -= 2
     return score
 
@@ -308,12 +464,12 @@ def _score_usage_line(line: str) -> int:
 def _pick_best_usage_line(lines: list[str]) -> Optional[str]:
     if not lines:
         return None
-    scored: list[tuple[int, str]] = []
-    for line in lines:
-        score = _score_usage_line(line)
-        scored.append((score, line))
-    scored.sort(key=lambda item: (-item[0], len(item[1])))
-    best_score, best_line = scored[0]
+    # Only the top line is used, so a single min() pass replaces the full sort; like the stable
+    # sort it keeps the earliest line among equal keys.
+    best_score, best_line = min(
+        ((_score_usage_line(line), line) for line in lines),
+        key=lambda item: (-item[0], len(item[1])),
+    )
     if best_score <= 0:
         return None
     return _shorten_usage_line(best_line)
@@ -356,14 +512,8 @@ def _extract_added_lines_from_patch(patch_text: str) -> list[str]:
 
 def _fetch_doc_patch_lines(repo: str, pr_number: int) -> list[str]:
     try:
-        payload = run_json_command(
-            [
-                "gh",
-                "api",
-                f"repos/{repo}/pulls/{pr_number}/files?per_page=100",
-            ]
-        )
-    except subprocess.CalledProcessError:
+        payload = gh_api_json(f"repos/{repo}/pulls/{pr_number}/files?per_page=100")
+    except (subprocess.CalledProcessError, GitHubApiError):
         return []
     except json.JSONDecodeError:
         return []
@@ -398,6 +548,8 @@ def _fetch_pr_metadata(repo: str, pr_number: int) -> Optional[PullRequestMeta]:
                 repo,
                 "--json",
                 "title,author",
+                "--jq",
+                PR_METADATA_JQ_FILTER,
             ]
         )
     except subprocess.CalledProcessError:
@@ -405,18 +557,66 @@ def _fetch_pr_metadata(repo: str, pr_number: int) -> Optional[PullRequestMeta]:
     except json.JSONDecodeError:
         return None
 
-    if not isinstance(payload, dict):
+    title = payload.get("title")
+    author_login = (payload.get("author_login") or "").strip() or None
+    return PullRequestMeta(title=title, author_login=author_login)
+
+
+def _graphql_author_login(author: object) -> Optional[str]:
+    if not isinstance(author, dict):
         return None
+    login = author.get("login")
+    if not isinstance(login, str) or not login.strip():
+        return None
+    # `gh pr view` reports GitHub App authors as app/<slug>; keep the same shape.
+    if author.get("__typename") == "Bot":
+        return f"app/{login.strip()}"
+    return login.strip()
+
+
+def _fetch_pr_metadata_bulk(repo: str, pr_numbers: Iterable[int]) -> dict[int, PullRequestMeta]:
+    numbers = list(dict.fromkeys(pr_numbers))
+    owner, _, name = repo.partition("/")
+    metas: dict[int, PullRequestMeta] = {}
+    for start in range(0, len(numbers), PR_METADATA_BATCH_SIZE):
+        batch = numbers[start : start + PR_METADATA_BATCH_SIZE]
+        aliases = "\n".join(
+            f"    pr{pr_number}: pullRequest(number: {pr_number}) {{ title author {{ __typename login }} }}"
+            for pr_number in batch
+        )
+        query = (
+            "query($owner: String!, $name: String!) {\n"
+            "  repository(owner: $owner, name: $name) {\n"
+            f"{aliases}\n"
+            "  }\n"
+            "}"
+        )
+        try:
+            payload = gh_api_json("graphql", {"query": query, "owner": owner, "name": name})
+        except (subprocess.CalledProcessError, GitHubApiError, json.JSONDecodeError, OSError):
+            # PRs left out here fall back to per-PR `gh pr view` lookups.
+            continue
 
-    title = payload.get("title") if isinstance(payload.get("title"), str) else None
-    author_login: Optional[str] = None
-    author = payload.get("author")
-    if isinstance(author, dict):
-        login = author.get("login")
-        if isinstance(login, str) and login.strip():
-            author_login = login.strip()
+        data = payload.get("data") if isinstance(payload, dict) else None
+        repository = data.get("repository") if isinstance(data, dict) else None
+        if not isinstance(repository, dict):
+            continue
+        for pr_number in batch:
+            node = repository.get(f"pr{pr_number}")
+            if not isinstance(node, dict):
+                continue
+            title = node.get("title") if isinstance(node.get("title"), str) else None
+            metas[pr_number] = PullRequestMeta(title=title, author_login=_graphql_author_login(node.get("author")))
+    return metas
 
-    return PullRequestMeta(title=title, author_login=author_login)
+
+def _fetch_pr_payloads_concurrently(fetch, repo: str, pr_numbers: Iterable[int]) -> dict[int, object]:
+    unique_numbers = list(dict.fromkeys(pr_numbers))
+    if len(unique_numbers) <= 1:
+        return {pr_number: fetch(repo, pr_number) for pr_number in unique_numbers}
+    # Each lookup mostly waits on a gh subprocess, so threads overlap them despite the GIL.
+    with ThreadPoolExecutor(max_workers=min(PR_FETCH_WORKERS, len(unique_numbers))) as executor:
+        return dict(zip(unique_numbers, executor.map(lambda n: fetch(repo, n), unique_numbers)))
 
 
 def _fetch_pr_context(repo: str, pr_number: int) -> Optional[PullRequestContext]:
@@ -511,7 +711,7 @@ def _extract_pr_usage_hint(context: PullRequestContext) -> tuple[Optional[str],
 
 
 def parse_semver(value: str) -> tuple[int, int, int]:
-    match = re.fullmatch(r"(\d+)\.(\d+)\.(\d+)", value)
+    match = SEMVER_RE.fullmatch(value)
     if not match:
         raise ValueError(f"Invalid semantic version: {value}")
     return tuple(int(part) for part in match.groups())
@@ -531,14 +731,14 @@ def strip_v_prefix(tag: str) -> str:
 
 
 def parse_highlight_pr_numbers(raw: str) -> list[int]:
-    tokens = [token.strip() for token in re.split(r"[,\s]+", raw.strip()) if token.strip()]
+    tokens = [token.strip() for token in PR_NUMBER_SEPARATOR_RE.split(raw.strip()) if token.strip()]
     if not tokens:
         raise ValueError("No PR numbers provided")
 
     numbers: list[int] = []
     seen: set[int] = set()
     for token in tokens:
-        if not re.fullmatch(r"\d+", token):
+        if not DIGITS_RE.fullmatch(token):
             raise ValueError(f"Invalid PR number: {token}")
         value = int(token)
         if value <= 0:
@@ -550,66 +750,81 @@ def parse_highlight_pr_numbers(raw: str) -> list[int]:
     return numbers
 
 
+def _list_release_tags(repo: str) -> list[str]:
+    path = f"repos/{repo}/releases?per_page=100"
+    client = _github_client()
+    if client is None:
+        return run_text_command(["gh", "api", path, "--jq", ".[].tag_name"]).splitlines()
+    payload = client.request_json("GET", path)
+    if not isinstance(payload, list):
+        return []
+    return [item["tag_name"] for item in payload if isinstance(item, dict) and isinstance(item.get("tag_name"), str)]
+
+
+@lru_cache(maxsize=32)
 def infer_previous_tag(repo: str, release_version: str) -> Optional[str]:
+    # Only memoized in-process: unlike PR metadata, the answer changes when a release lands on an
+    # older line, so it is never persisted to the on-disk cache.
     release_tuple = parse_semver(release_version)
-    payload = run_json_command(["gh", "api", f"repos/{repo}/releases?per_page=100"])
-    candidates: list[tuple[tuple[int, int, int], str]] = []
-    for item in payload:
-        tag = item.get("tag_name", "")
-        if not isinstance(tag, str) or not tag.startswith("v"):
-            continue
-        raw_version = tag[1:]
-        if not re.fullmatch(r"\d+\.\d+\.\d+", raw_version):
-            continue
-        version_tuple = parse_semver(raw_version)
-        if version_tuple < release_tuple:
-            candidates.append((version_tuple, tag))
-    if not candidates:
-        return None
-    candidates.sort(key=lambda item: item[0])
-    return candidates[-1][1]
+    tag_lines = _list_release_tags(repo)
+    # The API lists releases by creation date, and patch releases for older lines can land after newer
+    # minors, so every release is reduced to a single max rather than trusting the order.
+    matches = (SEMVER_RE.fullmatch(tag, 1) for tag in tag_lines if tag.startswith("v"))
+    candidates = ((tuple(map(int, match.groups())), match.string) for match in matches if match)
+    best = max(((version, tag) for version, tag in candidates if version < release_tuple), default=None)
+    return best[1] if best else None
 
 
 def _parse_release_changes_block(
     changes_file: Path, release_version: str
 ) -> tuple[list[str], Optional[str]]:
-    lines = changes_file.read_text(encoding="utf-8").splitlines()
-    header = f"Apollo {release_version}"
-    start_index = -1
-    for index, line in enumerate(lines):
-        if line.strip() == header:
-            start_index = index
-            break
-    if start_index < 0:
-        raise ValueError(f"Failed to locate section '{header}' in {changes_file}")
+    resolved = changes_file.resolve()
+    bullets, milestone_line = _parse_release_changes_block_cached(
+        resolved, release_version, resolved.stat().st_mtime_ns
+    )
+    return list(bullets), milestone_line
 
-    separator_pattern = re.compile(r"^-{3,}\s*$")
-    index = start_index + 1
-    while index < len(lines) and not separator_pattern.match(lines[index].strip()):
-        index += 1
-    if index >= len(lines):
-        raise ValueError(f"Failed to locate first separator after '{header}'")
 
-    index += 1
+@lru_cache(maxsize=8)
+def _parse_release_changes_block_cached(
+    changes_file: Path, release_version: str, mtime_ns: int
+) -> tuple[tuple[str, ...], Optional[str]]:
+    # mtime_ns is only part of the cache key, so an edited CHANGES.md is parsed again.
+    header = f"Apollo {release_version}"
+    # Stream the file and stop after the release's milestone line; older releases are never read.
+    state = "seek_header"
     bullets: list[str] = []
-    while index < len(lines):
-        stripped = lines[index].strip()
-        if separator_pattern.match(stripped):
-            break
-        if stripped.startswith("*"):
-            content = stripped.lstrip("*").strip()
-            if content:
-                bullets.append(content)
-        index += 1
-
     milestone_line: Optional[str] = None
-    for tail_index in range(index + 1, min(index + 12, len(lines))):
-        line = lines[tail_index].strip()
-        if "milestone/" in line:
-            milestone_line = line
-            break
-
-    return bullets, milestone_line
+    tail_lines_seen = 0
+    with changes_file.open(encoding="utf-8") as handle:
+        for raw_line in handle:
+            stripped = raw_line.strip()
+            if state == "seek_header":
+                if stripped == header:
+                    state = "seek_separator"
+            elif state == "seek_separator":
+                if CHANGES_SEPARATOR_RE.match(stripped):
+                    state = "read_bullets"
+            elif state == "read_bullets":
+                if CHANGES_SEPARATOR_RE.match(stripped):
+                    state = "seek_milestone"
+                elif stripped.startswith("*"):
+                    content = stripped.lstrip("*").strip()
+                    if content:
+                        bullets.append(content)
+            else:
+                if "milestone/" in stripped:
+                    milestone_line = stripped
+                    break
+                tail_lines_seen += 1
+                if tail_lines_seen >= MILESTONE_TAIL_LINES:
+                    break
+
+    if state == "seek_header":
+        raise ValueError(f"Failed to locate section '{header}' in {changes_file}")
+    if state == "seek_separator":
+        raise ValueError(f"Failed to locate first separator after '{header}'")
+    return tuple(bullets), milestone_line
 
 
 def parse_change_entries(changes_file: Path, release_version: str) -> tuple[list[ChangeEntry], Optional[str]]:
@@ -618,17 +833,21 @@ def parse_change_entries(changes_file: Path, release_version: str) -> tuple[list
 
 
 def _parse_change_entry(raw_text: str) -> ChangeEntry:
-    link_match = re.fullmatch(r"\[([^\]]+)\]\((https?://[^)]+)\)", raw_text.strip())
+    stripped = raw_text.strip()
+    # Substring prechecks keep bullets without links out of the regex engine.
+    link_match = (
+        MARKDOWN_URL_LINK_RE.fullmatch(stripped) if stripped.startswith("[") and "](http" in stripped else None
+    )
     if link_match:
         summary = link_match.group(1).strip()
         pr_url = link_match.group(2).strip()
     else:
-        url_match = re.search(r"(https?://\S+)", raw_text)
+        url_match = URL_RE.search(raw_text) if "http" in raw_text else None
         pr_url = url_match.group(1).strip() if url_match else None
         summary = raw_text.replace(pr_url, "").strip(" -") if pr_url else raw_text.strip()
 
     return ChangeEntry(
-        raw_text=raw_text.strip(),
+        raw_text=stripped,
         summary=summary.strip(),
         pr_url=pr_url,
         pr_number=_extract_pr_number(pr_url),
@@ -638,27 +857,91 @@ def _parse_change_entry(raw_text: str) -> ChangeEntry:
 def _extract_pr_number(pr_url: Optional[str]) -> Optional[int]:
     if not pr_url:
         return None
-    match = re.search(r"/pull/(\d+)", pr_url)
+    match = PULL_NUMBER_RE.search(pr_url)
     if not match:
         return None
     return int(match.group(1))
 
 
-def _format_change_summary_text(entry: ChangeEntry) -> str:
-    summary = _sanitize_text_line(entry.summary or "")
-    if summary:
-        return summary
-    fallback = _sanitize_text_line(entry.raw_text)
-    return fallback or "Release update"
+def load_pr_metadata_cache(cache_path: Path) -> dict[str, dict]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
 
 
-def format_change_lines(entries: Iterable[ChangeEntry], repo: Optional[str] = None) -> list[str]:
+def save_pr_metadata_cache(cache_path: Path, cache: dict[str, dict]) -> None:
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{cache_path.name}.", dir=cache_path.parent)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(cache, handle, ensure_ascii=True, sort_keys=True)
+        os.replace(temp_name, cache_path)
+    except OSError:
+        # The cache only saves gh calls on reruns; failing to write it must not fail the release notes.
+        return
+
+
+def _merge_into_pr_metadata_cache(cache_path: Path, updates: dict[str, dict]) -> None:
+    # Merge into the latest file contents instead of overwriting them with a snapshot loaded before
+    # the network calls, so entries written by a concurrent run are kept.
+    with _PR_METADATA_CACHE_LOCK:
+        cache = load_pr_metadata_cache(cache_path)
+        cache.update(updates)
+        save_pr_metadata_cache(cache_path, cache)
+
+
+def _resolve_pr_metadata(
+    repo: str, pr_numbers: list[int], use_cache: bool
+) -> dict[int, Optional[PullRequestMeta]]:
+    cache = load_pr_metadata_cache(PR_METADATA_CACHE_PATH) if use_cache else {}
+    now = time.time()
+    metas: dict[int, Optional[PullRequestMeta]] = {}
+    for pr_number in pr_numbers:
+        cached = cache.get(f"{repo}#{pr_number}")
+        fetched_at = cached.get("fetched_at") if isinstance(cached, dict) else None
+        if not isinstance(fetched_at, (int, float)) or now - fetched_at > PR_METADATA_CACHE_TTL_SECONDS:
+            continue
+        title = cached.get("title")
+        author_login = cached.get("author_login")
+        metas[pr_number] = PullRequestMeta(
+            title=title if isinstance(title, str) else None,
+            author_login=author_login if isinstance(author_login, str) else None,
+        )
+
+    missing_numbers = [pr_number for pr_number in pr_numbers if pr_number not in metas]
+    if not missing_numbers:
+        return metas
+    fetched: dict[int, Optional[PullRequestMeta]] = dict(_fetch_pr_metadata_bulk(repo, missing_numbers))
+    fallback_numbers = [pr_number for pr_number in missing_numbers if pr_number not in fetched]
+    fetched.update(_fetch_pr_payloads_concurrently(_fetch_pr_metadata, repo, fallback_numbers))
+    metas.update(fetched)
+
+    if use_cache:
+        # Failed lookups stay out of the cache so the next run retries them.
+        _merge_into_pr_metadata_cache(
+            PR_METADATA_CACHE_PATH,
+            {f"{repo}#{pr_number}": {**asdict(meta), "fetched_at": now} for pr_number, meta in fetched.items() if meta},
+        )
+    return metas
+
+
+def format_change_lines(
+    entries: Iterable[ChangeEntry], repo: Optional[str] = None, use_cache: bool = False
+) -> list[str]:
+    entries = list(entries)
+    metas: dict[int, Optional[PullRequestMeta]] = {}
+    if repo:
+        pr_numbers = [entry.pr_number for entry in entries if entry.pr_number and entry.pr_url and entry.pr_url.strip()]
+        metas = _resolve_pr_metadata(repo, list(dict.fromkeys(pr_numbers)), use_cache)
+
     lines: list[str] = []
     for entry in entries:
-        summary = _format_change_summary_text(entry)
+        summary = entry.display_summary
         pr_url = entry.pr_url.strip() if entry.pr_url else None
         if repo and entry.pr_number and pr_url:
-            meta = _fetch_pr_metadata(repo, entry.pr_number)
+            meta = metas.get(entry.pr_number)
             author_login: Optional[str] = None
             if meta:
                 author_login = meta.author_login
@@ -678,35 +961,12 @@ def format_change_lines(entries: Iterable[ChangeEntry], repo: Optional[str] = No
 
 def _clean_summary_for_highlight(summary: str) -> str:
     cleaned = summary.strip()
-    cleaned = re.sub(
-        r"^(feat|fix|perf|refactor|docs|test|chore|build|ci|feature|bugfix|security|optimize)(\([^)]+\))?:\s*",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
-    cleaned = re.sub(r"^\[[^\]]+\]\s*", "", cleaned).strip()
+    cleaned = CONVENTIONAL_PREFIX_RE.sub("", cleaned)
+    cleaned = BRACKET_PREFIX_RE.sub("", cleaned).strip()
     cleaned = cleaned.rstrip(".").strip()
     return cleaned
 
 
-def _score_highlight_candidate(entry: ChangeEntry) -> int:
-    original = (entry.summary or entry.raw_text).strip().lower()
-    text = _clean_summary_for_highlight(entry.summary or entry.raw_text).lower()
-    if not text:
-        return -1
-
-    score = 1
-    if re.match(r"^(test|chore|ci|docs|build)(\([^)]+\))?:", original):
-        score -= 3
-    if any(token in text for token in ["feature", "support", "add ", "added ", "enhance", "new "]):
-        score += 2
-    if any(token in text for token in ["security", "auth", "permission"]):
-        score += 1
-    if "fix" in text or "bug" in text:
-        score += 1
-    return score
-
-
 def _ensure_sentence_end(text: str) -> str:
     if text.endswith((".", "!", "?")):
         return text
@@ -726,17 +986,8 @@ def _normalize_usage_hint(text: str) -> str:
     if not normalized:
         return ""
 
-    normalized = re.sub(r"^in some application scenarios,?\s*", "", normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r"^after updating the project,?\s*", "", normalized, flags=re.IGNORECASE)
-    normalized = re.sub(
-        r"^after starting the service and making some requests to pull configurations,?\s*",
-        "",
-        normalized,
-        flags=re.IGNORECASE,
-    )
-    normalized = re.sub(r"like this way[:\uff1a]?\s*$", "", normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r"\s*See details at https?://\S+\s*$", "", normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r"\s*See details:?\s*https?://\S+\s*$", "", normalized, flags=re.IGNORECASE)
+    for pattern in USAGE_HINT_BOILERPLATE_RES:
+        normalized = pattern.sub("", normalized)
 
     lowered = normalized.lower()
     users_idx = lowered.find("users can ")
@@ -744,27 +995,19 @@ def _normalize_usage_hint(text: str) -> str:
         normalized = normalized[users_idx:]
         lowered = normalized.lower()
 
-    curl_match = re.search(
-        r"(curl\s+[^\n`]+?)(?:\s+and you can|\s+to\s+|\s*$)",
-        normalized,
-        re.IGNORECASE,
-    )
+    curl_match = CURL_COMMAND_RE.search(normalized)
     if curl_match:
         command = curl_match.group(1).strip().rstrip(".,;")
         normalized = f"You can verify this with `{_truncate_text(command, limit=140)}`"
         lowered = normalized.lower()
 
-    client_call = re.search(r"client\.([A-Za-z_][A-Za-z0-9_]*)\(\)", normalized)
+    client_call = CLIENT_CALL_NO_ARGS_RE.search(normalized)
     if client_call:
         method = client_call.group(1)
         normalized = f"OpenAPI Java client now supports `client.{method}()` for this scenario"
         lowered = normalized.lower()
 
-    endpoint_match = re.search(
-        r"\b(GET|POST|PUT|DELETE|PATCH)\s+(/[A-Za-z0-9._~!$&'()*+,;=:@%/\-{}]+)",
-        normalized,
-        re.IGNORECASE,
-    )
+    endpoint_match = ENDPOINT_ANY_CASE_RE.search(normalized)
     if endpoint_match and "call `" not in lowered:
         method = endpoint_match.group(1).upper()
         path = endpoint_match.group(2)
@@ -847,23 +1090,31 @@ def build_highlights(
             f"Selected highlight PRs not found in CHANGES.md for Apollo {release_version}: {missing_str}"
         )
 
+    contexts: dict[int, Optional[PullRequestContext]] = {}
+    if repo:
+        contexts = _fetch_pr_payloads_concurrently(_fetch_pr_context, repo, highlight_pr_numbers)
+
     highlights: list[HighlightItem] = []
     for pr_number in highlight_pr_numbers:
         entry = entry_by_pr[pr_number]
+        pr_context = contexts.get(pr_number)
         summary = _clean_summary_for_highlight(entry.summary or entry.raw_text)
         if not summary and repo:
-            meta = _fetch_pr_metadata(repo, pr_number)
-            if meta and meta.title:
-                summary = _sanitize_text_line(meta.title)
+            # The context fetched above already carries the PR title, so only fall back to a
+            # separate metadata lookup when that fetch failed.
+            title = pr_context.title if pr_context else None
+            if title is None:
+                meta = _fetch_pr_metadata(repo, pr_number)
+                title = meta.title if meta else None
+            if title:
+                summary = _sanitize_text_line(title)
         if not summary:
             summary = f"PR #{pr_number}"
 
         usage_hint: Optional[str] = None
         doc_hint: Optional[str] = None
-        if repo:
-            pr_context = _fetch_pr_context(repo, pr_number)
-            if pr_context:
-                usage_hint, doc_hint = _extract_pr_usage_hint(pr_context)
+        if pr_context:
+            usage_hint, doc_hint = _extract_pr_usage_hint(pr_context)
 
         highlights.append(
             HighlightItem(
@@ -879,28 +1130,34 @@ def build_highlights(
     return highlights
 
 
-def extract_section_lines(markdown: str, section_title: str) -> list[str]:
-    section_pattern = re.compile(
+@lru_cache(maxsize=16)
+def _section_pattern(section_title: str) -> re.Pattern[str]:
+    return re.compile(
         rf"^## {re.escape(section_title)}[ \t]*\r?$\n?([\s\S]*?)(?=^## |\Z)",
         re.MULTILINE,
     )
-    match = section_pattern.search(markdown)
+
+
+def extract_section_lines(markdown: str, section_title: str) -> list[str]:
+    match = _section_pattern(section_title).search(markdown)
     if not match:
         return []
     section = match.group(1)
     lines: list[str] = []
     for line in section.splitlines():
         stripped = line.strip()
-        if re.match(r"^\*\s+", stripped):
+        if stripped.startswith(STAR_BULLET_PREFIXES):
             lines.append(stripped)
     return lines
 
 
 def extract_full_changelog(markdown: str) -> Optional[str]:
-    match = re.search(r"\*\*Full Changelog\*\*:\s*(\S+)", markdown)
-    if not match:
+    marker_index = markdown.find(FULL_CHANGELOG_MARKER)
+    if marker_index < 0:
         return None
-    return match.group(1)
+    # Only whitespace can follow a marker with no URL, so a later marker cannot exist in that case.
+    remainder = markdown[marker_index + len(FULL_CHANGELOG_MARKER) :].split(None, 1)
+    return remainder[0] if remainder else None
 
 
 def generate_notes_from_github(
@@ -909,20 +1166,10 @@ def generate_notes_from_github(
     target_commitish: str,
     previous_tag_name: Optional[str],
 ) -> dict[str, str]:
-    cmd = [
-        "gh",
-        "api",
-        "-X",
-        "POST",
-        f"repos/{repo}/releases/generate-notes",
-        "-f",
-        f"tag_name=v{release_version}",
-        "-f",
-        f"target_commitish={target_commitish}",
-    ]
+    fields = {"tag_name": f"v{release_version}", "target_commitish": target_commitish}
     if previous_tag_name:
-        cmd.extend(["-f", f"previous_tag_name={previous_tag_name}"])
-    payload = run_json_command(cmd)
+        fields["previous_tag_name"] = previous_tag_name
+    payload = gh_api_json(f"repos/{repo}/releases/generate-notes", fields, method="POST")
     return {
         "name": payload.get("name", f"v{release_version}"),
         "body": payload.get("body", ""),
@@ -1055,43 +1302,28 @@ def build_release_markdown(
     new_contributors: Iterable[str],
     full_changelog_url: Optional[str],
 ) -> str:
-    lines: list[str] = ["## Highlights", ""]
-
-    highlight_list = list(highlights)
-    if highlight_list:
-        for item in highlight_list:
-            lines.extend([f"### {item.title}", item.body, ""])
-    else:
-        lines.extend(["### Release Update", f"Apollo {release_version} is now available.", ""])
-
-    lines.append("## What's Changed")
-
-    change_list = list(change_lines)
-    if change_list:
-        lines.extend(change_list)
-    else:
-        lines.append(f"* Apollo {release_version} is now available.")
-
-    lines.extend(
-        [
-            "",
-            "## Installation",
-            "",
-            "Please refer to the [Distributed Deployment Guide](https://www.apolloconfig.com/#/en/deployment/distributed-deployment-guide).",
-            "",
-            upgrade_section,
-        ]
+    highlights_block = "".join(f"### {item.title}\n{item.body}\n\n" for item in highlights) or (
+        f"### Release Update\nApollo {release_version} is now available.\n\n"
     )
-
+    change_list = list(change_lines)
+    changes_block = "\n".join(change_list) if change_list else f"* Apollo {release_version} is now available."
     contributors = list(new_contributors)
-    if contributors:
-        lines.extend(["", "## New Contributors"])
-        lines.extend(contributors)
-
-    if full_changelog_url:
-        lines.extend(["", f"**Full Changelog**: {full_changelog_url}"])
-
-    return "\n".join(lines).rstrip() + "\n"
+    contributors_block = "\n\n## New Contributors\n" + "\n".join(contributors) if contributors else ""
+    changelog_block = f"\n\n**Full Changelog**: {full_changelog_url}" if full_changelog_url else ""
+
+    markdown = (
+        "## Highlights\n\n"
+        f"{highlights_block}"
+        "## What's Changed\n"
+        f"{changes_block}\n\n"
+        "## Installation\n\n"
+        "Please refer to the [Distributed Deployment Guide]"
+        "(https://www.apolloconfig.com/#/en/deployment/distributed-deployment-guide).\n\n"
+        f"{upgrade_section}"
+        f"{contributors_block}"
+        f"{changelog_block}"
+    )
+    return markdown.rstrip() + "\n"
 
 
 def build_announcement_markdown(
@@ -1099,47 +1331,51 @@ def build_announcement_markdown(
     change_lines: Iterable[str],
     full_changelog_url: Optional[str],
 ) -> str:
-    lines: list[str] = [
-        "Hi all,",
-        "",
-        f"Apollo Team is glad to announce the release of Apollo {release_version}.",
-        "",
-        "This release includes the following changes.",
-        "",
-    ]
+    change_list = [line.replace("* ", "- ", 1) for line in change_lines]
+    changes_block = "\n".join(change_list) if change_list else f"- Apollo {release_version} is now available."
+    changelog_block = (
+        "\n\nPlease refer to the change log for the complete list of changes:\n"
+        f"{full_changelog_url}"
+        if full_changelog_url
+        else ""
+    )
 
-    change_list = list(change_lines)
-    if change_list:
-        lines.extend([line.replace("* ", "- ", 1) for line in change_list])
-    else:
-        lines.append(f"- Apollo {release_version} is now available.")
+    markdown = (
+        "Hi all,\n\n"
+        f"Apollo Team is glad to announce the release of Apollo {release_version}.\n\n"
+        "This release includes the following changes.\n\n"
+        f"{changes_block}"
+        f"{changelog_block}\n\n"
+        "Apollo website: https://www.apolloconfig.com/\n\n"
+        "Downloads: https://github.com/apolloconfig/apollo/releases\n\n"
+        "Apollo Resources:\n"
+        "GitHub: https://github.com/apolloconfig/apollo\n"
+        "Issue: https://github.com/apolloconfig/apollo/issues\n"
+        "Mailing list: [apollo-config@googlegroups.com](mailto:apollo-config@googlegroups.com)\n\n"
+        "Apollo Team"
+    )
+    return markdown.rstrip() + "\n"
 
-    if full_changelog_url:
-        lines.extend(
-            [
-                "",
-                "Please refer to the change log for the complete list of changes:",
-                full_changelog_url,
-            ]
-        )
 
-    lines.extend(
-        [
-            "",
-            "Apollo website: https://www.apolloconfig.com/",
-            "",
-            "Downloads: https://github.com/apolloconfig/apollo/releases",
-            "",
-            "Apollo Resources:",
-            "GitHub: https://github.com/apolloconfig/apollo",
-            "Issue: https://github.com/apolloconfig/apollo/issues",
-            "Mailing list: [apollo-config@googlegroups.com](mailto:apollo-config@googlegroups.com)",
-            "",
-            "Apollo Team",
-        ]
+def _fetch_previous_tag_and_generated_body(
+    repo: str,
+    release_version: str,
+    target_commitish: str,
+    previous_tag_name: Optional[str],
+    need_generated_notes: bool,
+) -> tuple[Optional[str], str]:
+    resolved_previous_tag = previous_tag_name or infer_previous_tag(repo, release_version)
+    # GitHub's generated notes only feed New Contributors and the changelog link,
+    # so announcement-only callers can skip the generate-notes round-trip.
+    if not need_generated_notes:
+        return resolved_previous_tag, ""
+    generated_notes = generate_notes_from_github(
+        repo=repo,
+        release_version=release_version,
+        target_commitish=target_commitish,
+        previous_tag_name=resolved_previous_tag,
     )
-
-    return "\n".join(lines).rstrip() + "\n"
+    return resolved_previous_tag, generated_notes.get("body", "")
 
 
 def build_release_content(
@@ -1151,27 +1387,33 @@ def build_release_content(
     previous_tag_name: Optional[str] = None,
     delta_src_root: Path = Path("scripts/sql/src/delta"),
     profiles_delta_root: Path = Path("scripts/sql/profiles/mysql-default/delta"),
+    use_cache: bool = False,
+    need_generated_notes: bool = True,
 ) -> dict[str, object]:
     if not highlight_pr_numbers:
         raise ValueError("highlight_pr_numbers is required to build Highlights")
 
     entries, milestone_line = parse_change_entries(changes_file, release_version)
-    highlights = build_highlights(
-        entries,
-        release_version,
-        highlight_pr_numbers=highlight_pr_numbers,
-        repo=repo,
-    )
-    change_lines = format_change_lines(entries, repo=repo)
+    # The previous tag and generated notes do not depend on PR enrichment, so fetch them in the
+    # background while the highlight and change-line PR lookups run.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        generated_future = executor.submit(
+            _fetch_previous_tag_and_generated_body,
+            repo,
+            release_version,
+            target_commitish,
+            previous_tag_name,
+            need_generated_notes,
+        )
+        highlights = build_highlights(
+            entries,
+            release_version,
+            highlight_pr_numbers=highlight_pr_numbers,
+            repo=repo,
+        )
+        change_lines = format_change_lines(entries, repo=repo, use_cache=use_cache)
+        resolved_previous_tag, generated_body = generated_future.result()
 
-    resolved_previous_tag = previous_tag_name or infer_previous_tag(repo, release_version)
-    generated_notes = generate_notes_from_github(
-        repo=repo,
-        release_version=release_version,
-        target_commitish=target_commitish,
-        previous_tag_name=resolved_previous_tag,
-    )
-    generated_body = generated_notes.get("body", "")
     new_contributors = extract_section_lines(generated_body, "New Contributors")
     full_changelog_url = extract_full_changelog(generated_body)
 
@@ -1233,6 +1475,24 @@ def parse_args() -> argparse.Namespace:
         default="scripts/sql/profiles/mysql-default/delta",
         help="Path used to generate SQL links in release notes",
     )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help=(
+            f"Reuse PR titles and authors cached for up to 7 days at {PR_METADATA_CACHE_PATH}; "
+            "PRs retitled since they were cached keep their old titles"
+        ),
+    )
+    parser.add_argument(
+        "--skip-changelog",
+        action="store_true",
+        help="For --kind=announcement, skip the GitHub generate-notes call and omit the Full Changelog paragraph",
+    )
+    parser.add_argument(
+        "--use-github-api",
+        action="store_true",
+        help="Call the GitHub REST/GraphQL API over one reused connection instead of running gh per call",
+    )
     return parser.parse_args()
 
 
@@ -1242,6 +1502,11 @@ def main() -> int:
         highlight_pr_numbers = parse_highlight_pr_numbers(args.highlight_prs)
     except ValueError as exc:
         raise SystemExit(f"--highlight-prs is invalid: {exc}") from exc
+    if args.use_github_api:
+        try:
+            enable_github_api()
+        except GitHubApiError as exc:
+            raise SystemExit(str(exc)) from exc
 
     content = build_release_content(
         repo=args.repo,
@@ -1252,6 +1517,8 @@ def main() -> int:
         previous_tag_name=args.previous_tag,
         delta_src_root=Path(args.delta_src_root),
         profiles_delta_root=Path(args.profiles_delta_root),
+        use_cache=args.use_cache,
+        need_generated_notes=args.kind == "release" or not args.skip_changelog,
     )
 
     output_text = content["release_notes"] if args.kind == "release" else content["announcement"]
@@ -18,6 +18,18 @@ from release_flow import ReleaseFlow
 
 
 class ReleaseNotesBuilderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Memoized lookups are module-level, so no test sees another test's cached responses.
+        self.addCleanup(release_notes_builder.infer_previous_tag.cache_clear)
+
+    def test_github_api_is_opt_in(self) -> None:
+        with mock.patch.dict(release_notes_builder.os.environ, {"GH_TOKEN": "token"}), mock.patch.object(
+            release_notes_builder, "_GITHUB_CLIENT", None
+        ):
+            self.assertIsNone(release_notes_builder._github_client())
+            release_notes_builder.enable_github_api()
+            self.assertIsInstance(release_notes_builder._github_client(), release_notes_builder._GitHubClient)
+
     def test_parse_semver(self) -> None:
         self.assertEqual(release_notes_builder.parse_semver("2.5.0"), (2, 5, 0))
         with self.assertRaises(ValueError):
@@ -49,10 +61,13 @@ All issues and pull requests are [here](https://github.com/apolloconfig/apollo/m
             path = Path(tmp) / "CHANGES.md"
             path.write_text(content, encoding="utf-8")
             entries, milestone = release_notes_builder.parse_change_entries(path, "2.5.0")
+            with mock.patch.object(Path, "open", side_effect=AssertionError("CHANGES.md read twice")):
+                cached_entries, _ = release_notes_builder.parse_change_entries(path, "2.5.0")
 
         self.assertEqual(len(entries), 2)
         self.assertEqual(entries[0].summary, "Feature A")
         self.assertIn("milestone/16", milestone)
+        self.assertEqual(cached_entries, entries)
 
     def test_build_highlights_uses_selected_prs(self) -> None:
         entries = [
@@ -97,7 +112,9 @@ All issues and pull requests are [here](https://github.com/apolloconfig/apollo/m
             title="feat: support incremental sync",
             author_login="alice",
         )
-        with mock.patch.object(release_notes_builder, "_fetch_pr_metadata", return_value=meta):
+        with mock.patch.object(release_notes_builder, "_fetch_pr_metadata_bulk", return_value={}), mock.patch.object(
+            release_notes_builder, "_fetch_pr_metadata", return_value=meta
+        ):
             lines = release_notes_builder.format_change_lines(entries, repo="apolloconfig/apollo")
 
         self.assertEqual(
@@ -105,6 +122,97 @@ All issues and pull requests are [here](https://github.com/apolloconfig/apollo/m
             ["* Feature: Support incremental sync by @alice in https://github.com/apolloconfig/apollo/pull/11"],
         )
 
+    def test_format_change_lines_batches_metadata_in_one_graphql_query(self) -> None:
+        entries = [
+            release_notes_builder.ChangeEntry(
+                raw_text=f"Change {pr_number}",
+                summary=f"Change {pr_number}",
+                pr_url=f"https://github.com/apolloconfig/apollo/pull/{pr_number}",
+                pr_number=pr_number,
+            )
+            for pr_number in (11, 12)
+        ]
+        payload = {
+            "data": {
+                "repository": {
+                    "pr11": {"title": "Change 11", "author": {"__typename": "User", "login": "alice"}},
+                    "pr12": {"title": "Change 12", "author": {"__typename": "Bot", "login": "dependabot"}},
+                }
+            }
+        }
+        with mock.patch.object(
+            release_notes_builder, "run_json_command", return_value=payload
+        ) as run_json_command, mock.patch.object(
+            release_notes_builder, "_fetch_pr_metadata", side_effect=AssertionError("unexpected gh pr view")
+        ):
+            lines = release_notes_builder.format_change_lines(entries, repo="apolloconfig/apollo")
+
+        run_json_command.assert_called_once()
+        self.assertEqual(run_json_command.call_args.args[0][:3], ["gh", "api", "graphql"])
+        self.assertEqual(
+            lines,
+            [
+                "* Change 11 by @alice in https://github.com/apolloconfig/apollo/pull/11",
+                "* Change 12 by @app/dependabot in https://github.com/apolloconfig/apollo/pull/12",
+            ],
+        )
+
+    def test_fetch_pr_metadata_reads_jq_projection(self) -> None:
+        with mock.patch.object(
+            release_notes_builder, "run_json_command", return_value={"title": "Fix B", "author_login": None}
+        ) as run_json_command:
+            meta = release_notes_builder._fetch_pr_metadata("apolloconfig/apollo", 12)
+
+        self.assertEqual(meta, release_notes_builder.PullRequestMeta(title="Fix B", author_login=None))
+        self.assertEqual(run_json_command.call_args.args[0][-2], "--jq")
+
+    def test_format_change_lines_reuses_cached_pr_metadata(self) -> None:
+        entries = [
+            release_notes_builder.ChangeEntry(
+                raw_text="Feature: Support incremental sync",
+                summary="Feature: Support incremental sync",
+                pr_url="https://github.com/apolloconfig/apollo/pull/11",
+                pr_number=11,
+            )
+        ]
+        meta = release_notes_builder.PullRequestMeta(title="Support incremental sync", author_login="alice")
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "pr-meta.json"
+            with mock.patch.object(release_notes_builder, "PR_METADATA_CACHE_PATH", cache_path):
+                with mock.patch.object(release_notes_builder, "_fetch_pr_metadata_bulk", return_value={11: meta}):
+                    first = release_notes_builder.format_change_lines(entries, repo="apolloconfig/apollo", use_cache=True)
+                with mock.patch.object(
+                    release_notes_builder, "_fetch_pr_metadata_bulk", side_effect=AssertionError("unexpected gh call")
+                ):
+                    second = release_notes_builder.format_change_lines(
+                        entries, repo="apolloconfig/apollo", use_cache=True
+                    )
+            cached = release_notes_builder.load_pr_metadata_cache(cache_path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(cached["apolloconfig/apollo#11"]["author_login"], "alice")
+
+    def test_infer_previous_tag_uses_running_max_and_is_not_persisted(self) -> None:
+        releases = "v2.4.1\nv2.5.0\nv2.3.9\nv2.4.0-RC1\n"
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            release_notes_builder, "PR_METADATA_CACHE_PATH", Path(tmp) / "pr-meta.json"
+        ) as cache_path:
+            with mock.patch.object(release_notes_builder, "run_text_command", return_value=releases) as run_text:
+                first = release_notes_builder.infer_previous_tag("apolloconfig/apollo", "2.5.0")
+                second = release_notes_builder.infer_previous_tag("apolloconfig/apollo", "2.5.0")
+            release_notes_builder.infer_previous_tag.cache_clear()
+            # A later patch on an older line must be picked up by the next run.
+            with mock.patch.object(release_notes_builder, "run_text_command", return_value="v2.4.2\n" + releases):
+                third = release_notes_builder.infer_previous_tag("apolloconfig/apollo", "2.5.0")
+            persisted = cache_path.exists()
+
+        self.assertEqual(first, "v2.4.1")
+        self.assertEqual(second, "v2.4.1")
+        self.assertEqual(third, "v2.4.2")
+        self.assertEqual(run_text.call_count, 1)
+        self.assertEqual(run_text.call_args.args[0][-2:], ["--jq", ".[].tag_name"])
+        self.assertFalse(persisted)
+
     def test_format_change_lines_issue_link_without_author(self) -> None:
         entries = [
             release_notes_builder.ChangeEntry(
@@ -152,6 +260,120 @@ All issues and pull requests are [here](https://github.com/apolloconfig/apollo/m
         self.assertEqual(len(highlights), 1)
         self.assertIn("POST /openapi/v1/envs", highlights[0].body)
 
+    def test_build_highlights_takes_empty_summary_title_from_pr_context(self) -> None:
+        entries = [
+            release_notes_builder.ChangeEntry(
+                raw_text="feat: https://github.com/apolloconfig/apollo/pull/89",
+                summary="feat:",
+                pr_url="https://github.com/apolloconfig/apollo/pull/89",
+                pr_number=89,
+            )
+        ]
+        context = release_notes_builder.PullRequestContext(
+            title="Support namespace item import", body="", comments=[], files=[], doc_lines=[]
+        )
+
+        with mock.patch.object(release_notes_builder, "_fetch_pr_context", return_value=context), mock.patch.object(
+            release_notes_builder, "_fetch_pr_metadata", side_effect=AssertionError("unexpected gh call")
+        ):
+            highlights = release_notes_builder.build_highlights(
+                entries,
+                "2.5.0",
+                highlight_pr_numbers=[89],
+                repo="apolloconfig/apollo",
+            )
+
+        self.assertEqual(highlights[0].title, "Support namespace item import")
+
+    def test_extract_full_changelog(self) -> None:
+        body = (
+            "## What's Changed\n* Fix by @alice\n\n"
+            "**Full Changelog**: https://github.com/apolloconfig/apollo/compare/v2.4.0...v2.5.0\n"
+        )
+        self.assertEqual(
+            release_notes_builder.extract_full_changelog(body),
+            "https://github.com/apolloconfig/apollo/compare/v2.4.0...v2.5.0",
+        )
+        self.assertIsNone(release_notes_builder.extract_full_changelog("**Full Changelog**:  \n"))
+        self.assertIsNone(release_notes_builder.extract_full_changelog("## What's Changed"))
+
+    def test_build_release_content_can_skip_generated_notes(self) -> None:
+        with mock.patch.object(
+            release_notes_builder, "parse_change_entries", return_value=([], "")
+        ), mock.patch.object(
+            release_notes_builder, "build_highlights", return_value=[]
+        ), mock.patch.object(
+            release_notes_builder, "format_change_lines", return_value=["* Fix B"]
+        ), mock.patch.object(
+            release_notes_builder, "build_upgrade_section", return_value=""
+        ), mock.patch.object(
+            release_notes_builder,
+            "generate_notes_from_github",
+            side_effect=AssertionError("generate-notes should be skipped"),
+        ):
+            content = release_notes_builder.build_release_content(
+                repo="apolloconfig/apollo",
+                release_version="2.5.0",
+                changes_file=Path("CHANGES.md"),
+                target_commitish="master",
+                highlight_pr_numbers=[1],
+                previous_tag_name="v2.4.0",
+                need_generated_notes=False,
+            )
+
+        self.assertIsNone(content["full_changelog_url"])
+        self.assertEqual(content["new_contributors"], [])
+        self.assertIn("- Fix B", content["announcement"])
+
+    def test_build_release_content_prefetches_previous_tag_and_notes(self) -> None:
+        body = "**Full Changelog**: https://github.com/apolloconfig/apollo/compare/v2.4.0...v2.5.0\n"
+        with mock.patch.object(
+            release_notes_builder, "parse_change_entries", return_value=([], "")
+        ), mock.patch.object(
+            release_notes_builder, "build_highlights", return_value=[]
+        ), mock.patch.object(
+            release_notes_builder, "format_change_lines", return_value=[]
+        ), mock.patch.object(
+            release_notes_builder, "build_upgrade_section", return_value=""
+        ), mock.patch.object(
+            release_notes_builder, "infer_previous_tag", return_value="v2.4.0"
+        ), mock.patch.object(
+            release_notes_builder, "generate_notes_from_github", return_value={"body": body}
+        ) as generate_notes:
+            content = release_notes_builder.build_release_content(
+                repo="apolloconfig/apollo",
+                release_version="2.5.0",
+                changes_file=Path("CHANGES.md"),
+                target_commitish="master",
+                highlight_pr_numbers=[1],
+            )
+
+        self.assertEqual(content["previous_tag"], "v2.4.0")
+        self.assertTrue(content["full_changelog_url"].endswith("v2.4.0...v2.5.0"))
+        self.assertEqual(generate_notes.call_args.kwargs["previous_tag_name"], "v2.4.0")
+
+    def test_gh_api_json_uses_token_client_when_available(self) -> None:
+        client = mock.Mock()
+        client.request_json.return_value = {"data": {}}
+        with mock.patch.object(release_notes_builder, "_github_client", return_value=client), mock.patch.object(
+            release_notes_builder, "run_json_command", side_effect=AssertionError("unexpected gh subprocess")
+        ):
+            release_notes_builder.gh_api_json("graphql", {"query": "query { viewer { login } }", "owner": "apolloconfig"})
+            release_notes_builder.generate_notes_from_github("apolloconfig/apollo", "2.5.0", "master", None)
+
+        self.assertEqual(
+            client.request_json.call_args_list[0].args,
+            ("POST", "graphql", {"query": "query { viewer { login } }", "variables": {"owner": "apolloconfig"}}),
+        )
+        self.assertEqual(
+            client.request_json.call_args_list[1].args,
+            (
+                "POST",
+                "repos/apolloconfig/apollo/releases/generate-notes",
+                {"tag_name": "v2.5.0", "target_commitish": "master"},
+            ),
+        )
+
     def test_build_highlights_rejects_missing_pr(self) -> None:
         entries = [
             release_notes_builder.ChangeEntry(